@@ -3,11 +3,12 @@ from typing import List, Type
 
 from maya.api.OpenMaya import MFnPlugin, MSyntax
 
-from pulse.plugins import PulseCmdBase, CmdArg, CmdFlag
+from pulse.plugins import CmdBase, PulseCmdBase, CmdArg, CmdFlag
 from pulse.core import serialize_attr_value, deserialize_attr_value
+from pulse import modifiers
 
 # the list of all cmd classes in this plugin
-_CMD_CLASSES: List[Type[PulseCmdBase]] = []
+_CMD_CLASSES: List[Type[CmdBase]] = []
 
 
 def maya_useNewAPI():
@@ -20,14 +21,14 @@ def maya_useNewAPI():
 
 def initializePlugin(plugin):
     plugin_fn = MFnPlugin(plugin)
-    cmd_cls: Type[PulseCmdBase]
+    cmd_cls: Type[CmdBase]
     for cmd_cls in _CMD_CLASSES:
         plugin_fn.registerCommand(cmd_cls.get_name(), cmd_cls.create_cmd, cmd_cls.create_syntax)
 
 
 def uninitializePlugin(plugin):
     plugin_fn = MFnPlugin(plugin)
-    cmd_cls: Type[PulseCmdBase]
+    cmd_cls: Type[CmdBase]
     for cmd_cls in _CMD_CLASSES:
         plugin_fn.deregisterCommand(cmd_cls.get_name())
 
@@ -305,3 +306,23 @@ class PulseSetIsActionMirroredCmd(PulseCmdBase):
 
 
 _CMD_CLASSES.append(PulseSetIsActionMirroredCmd)
+
+
+class PulseCommitCmd(CmdBase):
+    """
+    Command to record a change made with the Maya API in the undo queue.
+    Use `pulse.modifiers.commit` instead of calling this directly.
+    """
+
+    def doIt(self, args):
+        self.do_it, self.undo_it = modifiers.take_pending_commit()
+        self.redoIt()
+
+    def redoIt(self):
+        self.do_it()
+
+    def undoIt(self):
+        self.undo_it()
+
+
+_CMD_CLASSES.append(PulseCommitCmd)
@@ -39,6 +39,16 @@ def reload(install_menu=True):
     except:
         pass
 
+    # remove any metadata callbacks that would outlive the modules
+    from .vendor import pymetanode as meta
+
+    meta.disable_registry(force=True)
+    meta.clear_reference_cache()
+
+    from .core import disable_rig_index
+
+    disable_rig_index(force=True)
+
     # delete all pulse modules from sys
     mayacoretools.delete_modules("pulse*")
 
@@ -1,14 +1,54 @@
+import json
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import maya.api.OpenMaya as om2
+import pymel.core as pm
+from maya import cmds
+
 from .vendor import pymetanode as meta
 from .vendor import yaml
 
 ANIM_CTL_METACLASS = "pulse_animcontrol"
 
-
-def get_all_anim_ctls():
+# attribute type names, as returned by `getAttr -type`, for numeric attribute types
+NUMERIC_TYPE_NAMES = {
+    om2.MFnNumericData.kBoolean: "bool",
+    om2.MFnNumericData.kByte: "byte",
+    om2.MFnNumericData.kChar: "char",
+    om2.MFnNumericData.kShort: "short",
+    om2.MFnNumericData.k2Short: "short2",
+    om2.MFnNumericData.k3Short: "short3",
+    om2.MFnNumericData.kInt: "long",
+    om2.MFnNumericData.k2Int: "long2",
+    om2.MFnNumericData.k3Int: "long3",
+    om2.MFnNumericData.kFloat: "float",
+    om2.MFnNumericData.k2Float: "float2",
+    om2.MFnNumericData.k3Float: "float3",
+    om2.MFnNumericData.kDouble: "double",
+    om2.MFnNumericData.k2Double: "double2",
+    om2.MFnNumericData.k3Double: "double3",
+    om2.MFnNumericData.k4Double: "double4",
+}
+
+# attribute type names for unit attribute types
+UNIT_TYPE_NAMES = {
+    om2.MFn.kDoubleLinearAttribute: "doubleLinear",
+    om2.MFn.kFloatLinearAttribute: "floatLinear",
+    om2.MFn.kDoubleAngleAttribute: "doubleAngle",
+    om2.MFn.kFloatAngleAttribute: "floatAngle",
+    om2.MFn.kTimeAttribute: "time",
+}
+
+
+def get_all_anim_ctls(as_handles=False):
     """
     Return all animation controls in the scene
+
+    Args:
+        as_handles: Return NodeHandles instead of PyNodes
     """
-    return meta.find_meta_nodes(ANIM_CTL_METACLASS)
+    return meta.find_meta_nodes(ANIM_CTL_METACLASS, as_handles=as_handles)
 
 
 def get_rig_anim_interface(ctls, exclude_attrs=None):
@@ -41,14 +81,32 @@ def get_rig_anim_interface(ctls, exclude_attrs=None):
         }
     """
     interface = {"ctls": {}}
-
-    for ctl in ctls:
-        ctl_name = ctl.nodeName()
-        ctl_interface = get_anim_ctl_interface(ctl, exclude_attrs=exclude_attrs)
+    for ctl_name, ctl_interface in iter_anim_ctl_interfaces(ctls, exclude_attrs=exclude_attrs):
         interface["ctls"][ctl_name] = ctl_interface
     return interface
 
 
+def iter_anim_ctl_interfaces(ctls, exclude_attrs=None) -> Iterator[Tuple[str, dict]]:
+    """
+    Iterate over the animation interface of each control, reading all controls with the API.
+    See `get_anim_ctl_interface` for the interface of each control.
+
+    Args:
+        ctls (list of PyNode): A list of animation control nodes
+        exclude_attrs (list of str): List of keyable attributes to exclude
+
+    Returns:
+        An iterator of (control name, control interface) tuples.
+    """
+    reader = AnimInterfaceReader(exclude_attrs=exclude_attrs)
+    sel = om2.MSelectionList()
+    for ctl in ctls:
+        sel.add(str(ctl))
+    for i in range(sel.length()):
+        dag_path = sel.getDagPath(i)
+        yield om2.MFnDagNode(dag_path).name(), reader.get_interface(dag_path)
+
+
 def get_anim_ctl_interface(ctl, exclude_attrs=None):
     """
     Return the animation interface for an animation control node.
@@ -83,30 +141,170 @@ def get_anim_ctl_interface(ctl, exclude_attrs=None):
                 }
             }
     """
-    interface = {
-        # get world matrix, simplified
-        "worldMatrix": get_approx_attr_value(ctl.wm),
-        "attrs": {},
-    }
-
-    # get all keyable attribute info
-    attrs = ctl.listAttr(keyable=True)
-    for attr in attrs:
-        attr_info = {}
-        attr_name = attr.longName()
-        if exclude_attrs:
-            if attr_name in exclude_attrs:
+    for _, interface in iter_anim_ctl_interfaces([ctl], exclude_attrs=exclude_attrs):
+        return interface
+
+
+class AnimInterfaceReader(object):
+    """
+    Reads the animation interface of controls using MFnDependencyNode, producing the same
+    results as reading each keyable attribute with PyMEL.
+
+    The type and enum names of static attributes are cached by node type, so they are only
+    read once for all controls of the same type.
+    """
+
+    def __init__(self, exclude_attrs=None):
+        """
+        Args:
+            exclude_attrs (list of str): List of keyable attributes to exclude
+        """
+        self.exclude_attrs = set(exclude_attrs or [])
+        # {(node type, attribute name): (type name, enums by index or None)}
+        self._attr_info_cache: Dict[Tuple[str, str], Tuple[str, Optional[dict]]] = {}
+
+    def get_interface(self, dag_path: om2.MDagPath) -> dict:
+        """
+        Return the animation interface for a control, see `get_anim_ctl_interface`.
+
+        Args:
+            dag_path: The MDagPath of an animation control node
+        """
+        interface = {
+            # get world matrix, simplified
+            "worldMatrix": get_approx_value(_get_matrix_rows(dag_path.inclusiveMatrix())),
+            "attrs": {},
+        }
+
+        fn_node = om2.MFnDependencyNode(dag_path.node())
+        for plug in get_keyable_plugs(fn_node):
+            attr_name = om2.MFnAttribute(plug.attribute()).name
+            if attr_name in self.exclude_attrs:
                 continue
+            type_name, enums = self._get_attr_info(fn_node, plug)
+            attr_info = {
+                "type": type_name,
+                "default": get_approx_value(get_plug_value(plug, type_name)),
+            }
+            if enums is not None:
+                attr_info["enums"] = dict(enums)
+            interface["attrs"][attr_name] = attr_info
 
-        attr_info["type"] = attr.type()
-        attr_info["default"] = get_approx_attr_value(attr)
+        return interface
 
-        if attr.type() == "enum":
-            attr_info["enums"] = get_enum_dict_by_index(attr.getEnums())
+    def _get_attr_info(self, fn_node: om2.MFnDependencyNode, plug: om2.MPlug) -> Tuple[str, Optional[dict]]:
+        """
+        Return the type name of an attribute, and its enums by index, or None if it is not an enum.
+        """
+        fn_attr = om2.MFnAttribute(plug.attribute())
+        key = (fn_node.typeName, fn_attr.name)
+        if not fn_attr.dynamic and key in self._attr_info_cache:
+            return self._attr_info_cache[key]
 
-        interface["attrs"][attr_name] = attr_info
+        type_name = get_attr_type_name(plug)
+        enums = get_enums_by_index(plug.attribute()) if type_name == "enum" else None
+        if not fn_attr.dynamic:
+            self._attr_info_cache[key] = (type_name, enums)
+        return type_name, enums
 
-    return interface
+
+def get_keyable_plugs(fn_node: om2.MFnDependencyNode) -> List[om2.MPlug]:
+    """
+    Return the keyable plugs of a node, in the same order as `listAttr(keyable=True)`.
+    Uses the keyable state of each plug, since it can be changed per node with `setAttr -keyable`.
+    Elements of array attributes are not included.
+    """
+    result = []
+    for i in range(fn_node.attributeCount()):
+        attribute = fn_node.attribute(i)
+        fn_attr = om2.MFnAttribute(attribute)
+        if fn_attr.array or _has_array_parent(fn_attr):
+            continue
+        plug = fn_node.findPlug(attribute, False)
+        if plug.isKeyable:
+            result.append(plug)
+    return result
+
+
+def _has_array_parent(fn_attr: om2.MFnAttribute) -> bool:
+    parent = fn_attr.parent
+    while not parent.isNull():
+        fn_parent = om2.MFnAttribute(parent)
+        if fn_parent.array:
+            return True
+        parent = fn_parent.parent
+    return False
+
+
+def _get_matrix_rows(matrix: om2.MMatrix) -> List[List[float]]:
+    return [[matrix.getElement(row, col) for col in range(4)] for row in range(4)]
+
+
+def get_attr_type_name(plug: om2.MPlug) -> str:
+    """
+    Return the type name of an attribute, matching `getAttr -type`.
+
+    Args:
+        plug: The MPlug of an attribute
+    """
+    attribute = plug.attribute()
+    api_type = attribute.apiType()
+    if api_type in UNIT_TYPE_NAMES:
+        return UNIT_TYPE_NAMES[api_type]
+    if attribute.hasFn(om2.MFn.kEnumAttribute):
+        return "enum"
+    if attribute.hasFn(om2.MFn.kNumericAttribute):
+        type_name = NUMERIC_TYPE_NAMES.get(om2.MFnNumericAttribute(attribute).numericType())
+        if type_name:
+            return type_name
+    # less common types
+    return cmds.getAttr(plug.name(), type=True)
+
+
+def get_plug_value(plug: om2.MPlug, type_name: str = None):
+    """
+    Return the value of a plug, matching the values returned by `Attribute.get()`.
+    Distances, angles, and times are returned in UI units.
+
+    Args:
+        plug: The MPlug of an attribute
+        type_name: The type name of the attribute, if already known
+    """
+    if type_name is None:
+        type_name = get_attr_type_name(plug)
+    if type_name in ("doubleLinear", "floatLinear"):
+        return plug.asMDistance().asUnits(om2.MDistance.uiUnit())
+    elif type_name in ("doubleAngle", "floatAngle"):
+        return plug.asMAngle().asUnits(om2.MAngle.uiUnit())
+    elif type_name == "time":
+        return plug.asMTime().asUnits(om2.MTime.uiUnit())
+    elif type_name == "bool":
+        return plug.asBool()
+    elif type_name in ("enum", "byte", "char", "short", "long"):
+        return plug.asInt()
+    elif type_name in ("float", "double"):
+        return plug.asDouble()
+    elif type_name == "string":
+        return plug.asString()
+    elif plug.isCompound and type_name in NUMERIC_TYPE_NAMES.values():
+        return [get_plug_value(plug.child(i)) for i in range(plug.numChildren())]
+    # less common types
+    return pm.Attribute(plug.name()).get()
+
+
+def get_enums_by_index(attribute: om2.MObject) -> Dict[int, str]:
+    """
+    Return the enum names of an enum attribute, indexed by value.
+    """
+    fn_enum = om2.MFnEnumAttribute(attribute)
+    result = {}
+    for value in range(fn_enum.getMin(), fn_enum.getMax() + 1):
+        try:
+            result[value] = fn_enum.fieldName(value)
+        except RuntimeError:
+            # not every value in the range has a name
+            pass
+    return result
 
 
 def get_enum_dict_by_index(enum_dict):
@@ -151,9 +349,50 @@ def get_approx_value(value):
         return value
 
 
+def write_rig_anim_interface(fp, ctls, exclude_attrs=None, file_format="yaml"):
+    """
+    Write the animation interface of a rig to a file one control at a time,
+    without gathering the whole interface in memory first.
+
+    The output is equivalent to dumping the result of `get_rig_anim_interface`,
+    with controls sorted by name.
+
+    Args:
+        fp: A writable text file object
+        ctls (list of PyNode): A list of animation control nodes
+        exclude_attrs (list of str): List of keyable attributes to exclude
+        file_format (str): The format to write, either 'yaml' or 'json'
+    """
+    if file_format not in ("yaml", "json"):
+        raise ValueError(f"Unsupported anim interface format: {file_format}")
+
+    # sort by name to match the sorted keys of a full dump, later controls replace earlier ones with the same name
+    ctls_by_name = {}
+    for ctl in ctls:
+        ctls_by_name[ctl.nodeName()] = ctl
+    sorted_ctls = [ctls_by_name[name] for name in sorted(ctls_by_name)]
+
+    interfaces = iter_anim_ctl_interfaces(sorted_ctls, exclude_attrs=exclude_attrs)
+    if file_format == "json":
+        fp.write('{"ctls": {')
+        for i, (ctl_name, ctl_interface) in enumerate(interfaces):
+            if i > 0:
+                fp.write(", ")
+            fp.write(f"{json.dumps(ctl_name)}: {json.dumps(ctl_interface, sort_keys=True)}")
+        fp.write("}}\n")
+    elif not sorted_ctls:
+        yaml.safe_dump({"ctls": {}}, fp, default_flow_style=False)
+    else:
+        fp.write("ctls:\n")
+        for ctl_name, ctl_interface in interfaces:
+            text = yaml.safe_dump({ctl_name: ctl_interface}, default_flow_style=False)
+            fp.write("".join(f"  {line}" for line in text.splitlines(True)))
+
+
 def save_rig_anim_interface(filepath, exclude_attrs=None, find_control_func=None):
     """
     Save the animation interface of a rig to a file.
+    The file is written as json if it has a '.json' extension, otherwise as yaml.
 
     Args:
         filepath (str): The path to the file to write
@@ -166,9 +405,8 @@ def save_rig_anim_interface(filepath, exclude_attrs=None, find_control_func=None
     else:
         ctls = get_all_anim_ctls()
 
-    interface = get_rig_anim_interface(ctls, exclude_attrs=exclude_attrs)
-
+    file_format = "json" if os.path.splitext(filepath)[1].lower() == ".json" else "yaml"
     with open(filepath, "w") as fp:
-        yaml.safe_dump(interface, fp, default_flow_style=False)
+        write_rig_anim_interface(fp, ctls, exclude_attrs=exclude_attrs, file_format=file_format)
 
     print(filepath)
@@ -1,9 +1,6 @@
 """
 The built-in Pulse actions package.
-"""
-
-from pulse.core import import_all_submodules
 
-# dynamically import all subpackages and submodules recursively so that
-# actions can be easily added and removed without having to maintain package imports
-import_all_submodules(__name__)
+Action modules are not imported here. The action loader finds all submodules recursively when it needs to,
+and otherwise loads actions from a cached manifest so that each module is only imported once its action is used.
+"""
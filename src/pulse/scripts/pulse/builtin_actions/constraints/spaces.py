@@ -119,9 +119,10 @@ class ApplySpacesAction(BuildAction):
             spaces.create_space(world_node, "world")
             self.update_rig_metadata_dict("spaces", {"world": world_node})
 
-        # TODO: only gather not-yet-created constraints
-        all_constraints = spaces.get_all_space_constraints()
-        spaces.connect_space_constraints(all_constraints)
+        registry = spaces.SpaceRegistry()
+        registry.load()
+        num_connected = registry.connect_constraints()
+        self.logger.debug("Connected %d spaces for %d space constraints", num_connected, len(registry.constraints))
 
 
 class SpaceSwitchUtils(object):
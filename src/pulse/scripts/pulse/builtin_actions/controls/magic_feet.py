@@ -137,8 +137,7 @@ class MagicFeetAction(BuildAction):
         )
         heel_tgt = pm.group(empty=True, parent=self.heelPivot, name="{0}_mf_heel_tgt".format(self.follower.nodeName()))
 
-        follower_mtx = nodes.get_world_matrix(self.follower)
-        toe_follower_mtx = nodes.get_world_matrix(self.toeFollower)
+        follower_mtx, toe_follower_mtx = nodes.get_world_matrices([self.follower, self.toeFollower])
 
         # update pivots to match world rotation of control and create
         # offset so that direct connect rotations will match up
@@ -1,4 +1,5 @@
 import os
+import time
 from typing import Optional
 
 import pymel.core as pm
@@ -118,8 +119,9 @@ class BindSkinAction(BuildAction):
             type=AttrType.FILE,
             fileFilter="Weights (*.weights)",
             optional=True,
-            description="A file containing skin weights to apply when available. "
-            "If no weights file exists, the skin method will be used.",
+            description="A file containing skin weights to apply when available, either binary or text weights. "
+            "If no weights file exists, the skin method will be used. Binary weights are transferred by "
+            "position when the number of vertices has changed.",
         ),
     ]
 
@@ -158,12 +160,24 @@ class BindSkinAction(BuildAction):
                 )
             )
 
-        # create skin clusters
-        all_skin_names = []
-        for mesh in self.meshes:
-            pm.select(bind_jnts + [mesh])
-            results = cmds.skinCluster(name=f"{mesh}_skcl", **bind_kwargs)
-            all_skin_names.append(results[0])
+        # decode weights in the background while skin clusters are created,
+        # and apply each skin's weights as soon as both are ready
+        loader = None
+        if weights_file_path:
+            loader = skins.SkinWeightsFileLoader(weights_file_path)
+            loader.start([f"{mesh.nodeName()}_skcl" for mesh in self.meshes])
+
+        try:
+            for mesh in self.meshes:
+                start_time = time.time()
+                pm.select(bind_jnts + [mesh])
+                skin_name = cmds.skinCluster(name=f"{mesh}_skcl", **bind_kwargs)[0]
+                bind_time = time.time() - start_time
+                if loader:
+                    self._apply_weights(loader, mesh, skin_name, bind_time)
+        finally:
+            if loader:
+                loader.close()
 
         # TODO: support geomBind when using geodesic voxel binding
 
@@ -172,10 +186,34 @@ class BindSkinAction(BuildAction):
             self.extend_rig_metadata_list("renderGeo", self.meshes)
             self.extend_rig_metadata_list("bakeNodes", bind_jnts)
 
-        # apply skin weights
-        if weights_file_path and all_skin_names:
-            all_skins = [pm.PyNode(name) for name in all_skin_names]
-            skins.apply_skin_weights_from_file(weights_file_path, *all_skins)
+    def _apply_weights(self, loader: skins.SkinWeightsFileLoader, mesh, skin_name: str, bind_time: float):
+        """
+        Apply the weights for a skin cluster once they have been decoded.
+        """
+        start_time = time.time()
+        weights = loader.get(skin_name)
+        wait_time = time.time() - start_time
+        if not weights:
+            self.logger.warning("Could not find weights for skin: %s", skin_name)
+            return
+
+        start_time = time.time()
+        transfer_stats = skins.apply_skin_weights_map({skin_name: weights}, pm.PyNode(skin_name))
+        apply_time = time.time() - start_time
+        self.logger.info(
+            "Bound %s (bind %.03fs, wait %.03fs, apply %.03fs)", mesh.nodeName(), bind_time, wait_time, apply_time
+        )
+
+        stats = transfer_stats.get(skin_name)
+        if stats:
+            self.logger.warning(
+                "Vertex count changed for %s, transferred weights by position "
+                "(mean distance %.4f, max distance %.4f, %d exact matches)",
+                skin_name,
+                stats["mean_distance"],
+                stats["max_distance"],
+                stats["exact_matches"],
+            )
 
     def _get_bind_joints(self):
         """
@@ -1,18 +1,45 @@
-import functools
+import bisect
+import hashlib
+import json
+import logging
 import os
+import tempfile
 from fnmatch import fnmatch
+from typing import List, Optional
 
+import maya.api.OpenMaya as om2
 import pymel.core as pm
 
+from .colors import LinearColor
 from .vendor import pymetanode as meta
 from .vendor import yaml
 from . import links
-from . import nodes
+from . import modifiers
+from . import traversal
 from . import util_nodes
 
+LOG = logging.getLogger(__name__)
+
 CONTROL_SHAPE_METACLASS = "pulse_controlshape"
 BUILTIN_CONTROL_SHAPES_LOADED = False
 CONTROL_SHAPES = {}
+# all registered shapes, and their sort keys, kept sorted as shapes are registered
+_SORTED_SHAPES = []
+_SORTED_SHAPE_KEYS = []
+# the sort key of each registered shape by name, as it was when the shape was registered
+_SHAPE_SORT_KEYS = {}
+
+# the directory where manifests of control shape directories are cached
+MANIFEST_CACHE_DIR = os.path.join(tempfile.gettempdir(), "pulse", "control_shapes")
+MANIFEST_VERSION = 2
+# the control shape keys stored in manifests, all other data is loaded on demand
+MANIFEST_KEYS = ("name", "sort", "icon")
+
+# the types of shapes that are removed when replacing the shapes of a control
+REPLACEABLE_SHAPE_FN_TYPES = (om2.MFn.kMesh, om2.MFn.kNurbsCurve, om2.MFn.kNurbsSurface)
+
+# the sort order of shapes that don't define one
+DEFAULT_SHAPE_SORT = 999
 
 
 def create_line_shape(start_node, end_node, parent_node=None):
@@ -68,19 +95,14 @@ def connect_node_to_control_point(node, curve_shape, point_index):
 
 def get_control_shapes():
     """
-    Return all available control shapes
+    Return all available control shapes, sorted by their sort order and name.
     """
+    return list(_SORTED_SHAPES)
 
-    def cmp(a, b):
-        return (a > b) - (a < b)
-
-    def sort_func(a, b):
-        result = cmp(a.get("sort", 999), b.get("sort", 999))
-        if result == 0:
-            result = cmp(a["name"], b["name"])
-        return result
 
-    return sorted(CONTROL_SHAPES.values(), key=functools.cmp_to_key(sort_func))
+def _get_shape_sort_key(name, shape):
+    # use dict.get to avoid loading the whole file of a LazyControlShape
+    return dict.get(shape, "sort", DEFAULT_SHAPE_SORT), dict.get(shape, "name", name), name
 
 
 def register_control_shape(name, shape):
@@ -92,7 +114,12 @@ def register_control_shape(name, shape):
             replace existing shapes and can be used to remove shapes.
         shape: A dict containing control shape data.
     """
-    global CONTROL_SHAPES
+    unregister_control_shape(name)
+    sort_key = _get_shape_sort_key(name, shape)
+    _SHAPE_SORT_KEYS[name] = sort_key
+    index = bisect.bisect_right(_SORTED_SHAPE_KEYS, sort_key)
+    _SORTED_SHAPE_KEYS.insert(index, sort_key)
+    _SORTED_SHAPES.insert(index, shape)
     CONTROL_SHAPES[name] = shape
 
 
@@ -103,44 +130,175 @@ def unregister_control_shape(name):
     Args:
         name: A string name that the shape is registered under
     """
-    global CONTROL_SHAPES
     if name in CONTROL_SHAPES:
         del CONTROL_SHAPES[name]
+        index = bisect.bisect_left(_SORTED_SHAPE_KEYS, _SHAPE_SORT_KEYS.pop(name))
+        del _SORTED_SHAPE_KEYS[index]
+        del _SORTED_SHAPES[index]
+
+
+class LazyControlShape(dict):
+    """
+    Control shape data from a file, that only reads the whole file the first time
+    a key is accessed that is not already known, e.g. the curve data.
+    """
+
+    def __init__(self, file_path, data=None, is_loaded=False):
+        super(LazyControlShape, self).__init__(data or {})
+        self.file_path = file_path
+        self.is_loaded = is_loaded
 
+    def __missing__(self, key):
+        if not self.is_loaded:
+            self.load()
+            if key in self:
+                return self[key]
+        raise KeyError(key)
 
-def load_control_shapes_from_directory(start_dir, pattern="*_control.yaml"):
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def load(self):
+        """
+        Read the control shape file and update this shape with its data.
+        """
+        self.is_loaded = True
+        data = _read_control_shape_file(self.file_path)
+        if data:
+            self.update(data)
+
+
+def _read_control_shape_file(file_path):
+    with open(file_path, "r") as fp:
+        return yaml.safe_load(fp)
+
+
+def _get_manifest_path(start_dir, pattern):
+    key = hashlib.md5(f"{os.path.normcase(start_dir)}|{pattern}".encode("utf-8")).hexdigest()
+    return os.path.join(MANIFEST_CACHE_DIR, f"{key}.json")
+
+
+def _read_manifest(manifest_path):
+    """
+    Return the cached manifest of a control shapes directory, or None if it does not exist or is invalid.
+    """
+    try:
+        with open(manifest_path, "r") as fp:
+            manifest = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def _write_manifest(manifest_path, manifest):
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with open(manifest_path, "w") as fp:
+            json.dump(manifest, fp)
+    except OSError as e:
+        LOG.debug("Failed to write control shapes manifest %s: %s", manifest_path, e)
+
+
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _is_manifest_up_to_date(manifest):
+    """
+    Return True if none of the directories or files in a manifest have been modified.
+    Files can only be added or removed by modifying their directory, so no directories need to be listed.
+    """
+    for path, mtime in manifest["dirs"].items():
+        if _get_mtime(path) != mtime:
+            return False
+    for entry in manifest["shapes"]:
+        if _get_mtime(entry["file_path"]) != entry["mtime"]:
+            return False
+    return True
+
+
+def _scan_control_shapes_directory(start_dir, pattern, cached_entries, dirs, shapes):
+    """
+    Recursively find all control shape files in a directory, only reading files that have changed since
+    they were cached.
+
+    Args:
+        start_dir: A str path of the directory to search.
+        pattern: A fnmatch pattern to filter which files to load.
+        cached_entries: A dict of manifest entries by file path, from a previous scan.
+        dirs: A dict to fill with the modified time of every directory that was searched.
+        shapes: A list to fill with a LazyControlShape for every control shape found.
+    """
+    dirs[start_dir] = _get_mtime(start_dir)
+    for entry in sorted(os.scandir(start_dir), key=lambda e: e.name):
+        if entry.is_dir():
+            _scan_control_shapes_directory(entry.path, pattern, cached_entries, dirs, shapes)
+        elif entry.is_file() and fnmatch(entry.name, pattern):
+            mtime = entry.stat().st_mtime
+            cached_entry = cached_entries.get(entry.path)
+            if cached_entry and cached_entry["mtime"] == mtime:
+                shapes.append(LazyControlShape(entry.path, cached_entry["data"]))
+                continue
+            data = _read_control_shape_file(entry.path)
+            if isinstance(data, dict) and data.get("name"):
+                shapes.append(LazyControlShape(entry.path, data, is_loaded=True))
+            else:
+                pm.warning(f"Invalid control shape: {entry.path}")
+
+
+def _get_manifest_entry(shape):
+    data = {key: shape[key] for key in MANIFEST_KEYS if key in shape}
+    # always store the sort, so that sorting never needs to load the file
+    data.setdefault("sort", DEFAULT_SHAPE_SORT)
+    return {"file_path": shape.file_path, "mtime": _get_mtime(shape.file_path), "data": data}
+
+
+def load_control_shapes_from_directory(start_dir, pattern="*_control.yaml", use_cache=True):
     """
     Return control shape data for all controls found by searching
     a directory. Search is performed recursively for
     any yaml files matching a pattern.
 
+    The name, sort order, and icon of each shape are stored in a manifest in `MANIFEST_CACHE_DIR`
+    that is reused while the directories and files are unmodified, and the curve data of cached
+    shapes is only loaded when first accessed, see `LazyControlShape`.
+
     Args:
         start_dir: A str path of the directory to search
         pattern: A fnmatch pattern to filter which files to load
+        use_cache: If true, read and update the manifest cache
     """
     if "~" in start_dir:
         start_dir = os.path.expanduser(start_dir)
+    start_dir = os.path.abspath(start_dir)
+
+    manifest_path = _get_manifest_path(start_dir, pattern)
+    manifest = _read_manifest(manifest_path) if use_cache else None
+    if manifest and _is_manifest_up_to_date(manifest):
+        return [LazyControlShape(entry["file_path"], entry["data"]) for entry in manifest["shapes"]]
+
+    cached_entries = {entry["file_path"]: entry for entry in manifest["shapes"]} if manifest else {}
+    dirs = {}
+    shapes = []
+    _scan_control_shapes_directory(start_dir, pattern, cached_entries, dirs, shapes)
+
+    if use_cache:
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "dirs": dirs,
+            "shapes": [_get_manifest_entry(shape) for shape in shapes],
+        }
+        _write_manifest(manifest_path, manifest)
 
-    result = []
-
-    paths = os.listdir(start_dir)
-    for path in paths:
-        full_path = os.path.join(start_dir, path)
-
-        if os.path.isfile(full_path):
-            if fnmatch(path, pattern):
-                with open(full_path, "r") as fp:
-                    data = yaml.safe_load(fp.read())
-                name = data.get("name")
-                if name:
-                    result.append(data)
-                else:
-                    pm.warning(f"Invalid control shape: {full_path}")
-
-        elif os.path.isdir(full_path):
-            result.extend(load_control_shapes_from_directory(full_path, pattern))
-
-    return result
+    return shapes
 
 
 def load_builtin_control_shapes():
@@ -180,6 +338,265 @@ def save_control_shape_to_file(name, icon, curve, file_path):
 # ----------------
 
 
+def _get_default_knots(num_cvs, degree, periodic):
+    """
+    Return the knots that `pm.curve` uses by default for a number of cvs.
+    """
+    if periodic:
+        return [float(i - degree + 1) for i in range(num_cvs + degree - 1)]
+    spans = num_cvs - degree
+    return [0.0] * (degree - 1) + [float(i) for i in range(spans + 1)] + [float(spans)] * (degree - 1)
+
+
+def create_curve_data(curve_data) -> om2.MObject:
+    """
+    Return a nurbsCurve data object for the data of one curve from a control shape.
+
+    Args:
+        curve_data: A dict with the same 'degree', 'periodic', 'knot', and 'point' keys used by `pm.curve`.
+    """
+    degree = curve_data.get("degree", 3)
+    periodic = curve_data.get("periodic", False)
+    points = curve_data["point"]
+    knots = curve_data.get("knot") or _get_default_knots(len(points), degree, periodic)
+    form = om2.MFnNurbsCurve.kPeriodic if periodic else om2.MFnNurbsCurve.kOpen
+    data = om2.MFnNurbsCurveData().create()
+    om2.MFnNurbsCurve().create(
+        om2.MPointArray([om2.MPoint(*p) for p in points]), om2.MDoubleArray(knots), degree, form, False, False, data
+    )
+    return data
+
+
+def _add_plug_value(modifier: om2.MDGModifier, plug: om2.MPlug, value):
+    if isinstance(value, bool):
+        modifier.newPlugValueBool(plug, value)
+    elif isinstance(value, int):
+        modifier.newPlugValueInt(plug, value)
+    elif isinstance(value, float):
+        modifier.newPlugValueDouble(plug, value)
+    elif isinstance(value, str):
+        modifier.newPlugValueString(plug, value)
+    elif isinstance(value, om2.MAngle):
+        modifier.newPlugValueMAngle(plug, value)
+    else:
+        modifier.newPlugValue(plug, value)
+
+
+class ControlBatch(object):
+    """
+    Creates many controls or control shapes as a single undoable operation.
+
+    Nodes are created with one MDagModifier, and their attribute values are set with a second modifier
+    once the nodes and their attributes exist. Curve shapes are created by setting their cached geometry,
+    using nurbsCurve data created once per shape, the same way curves are stored in scene files.
+
+    Examples:
+        batch = ControlBatch(shape_data)
+        for joint in joints:
+            batch.create_control(target_node=joint, name=f"{joint.nodeName()}_ctl")
+        ctls = batch.commit()
+    """
+
+    def __init__(self, shape_data):
+        """
+        Args:
+            shape_data: A dict containing control shape data.
+        """
+        self.curve_data = [create_curve_data(curve_data) for curve_data in shape_data["curves"]]
+        self.modifier = om2.MDagModifier()
+        # the new control transforms, in the order they were created
+        self.controls: List[om2.MObject] = []
+        # (node, attribute name, value) for all values to set after the nodes are created
+        self._values = []
+        self._value_modifier: Optional[om2.MDGModifier] = None
+        self.is_committed = False
+
+    def create_control(self, name=None, target_node=None, parent=None, color=None, link=False) -> om2.MObject:
+        """
+        Add a new control transform with the batch's shapes.
+
+        Args:
+            name: A string name of the control created.
+            target_node: An optional transform node to position the control at, matching its rotate order.
+            parent: An optional transform node to parent the control to.
+            color: An optional LinearColor to set as the override color of the shapes.
+            link (bool): If true, link the control to the target_node.
+
+        Returns:
+            The MObject of the new transform, which exists once the batch is committed.
+        """
+        parent_path = traversal.get_dag_path(parent) if parent else None
+        transform = self.modifier.createNode("transform", parent_path.node() if parent_path else om2.MObject.kNullObj)
+        name = name or "ctl1"
+        self.modifier.renameNode(transform, name)
+
+        world_matrix = om2.MMatrix()
+        rotate_order = 0
+        if target_node:
+            target_path = traversal.get_dag_path(target_node)
+            if target_path is None or not target_path.hasFn(om2.MFn.kTransform):
+                raise TypeError(f"target_node must be a Transform node, got {target_node}")
+            world_matrix = target_path.inclusiveMatrix()
+            rotate_order = om2.MFnDependencyNode(target_path.node()).findPlug("rotateOrder", False).asInt()
+        local_matrix = world_matrix * parent_path.inclusiveMatrixInverse() if parent_path else world_matrix
+        self._set_local_matrix(transform, local_matrix, rotate_order)
+
+        self._add_shape_nodes(transform, name, color)
+
+        metadata = {CONTROL_SHAPE_METACLASS: {}}
+        if link and target_node:
+            # matches the data written by `links.create_default_link`
+            metadata[links.LINK_METACLASS] = {"targetNodes": [target_node], "type": links.LinkType.DEFAULT}
+        self._add_metadata(transform, metadata)
+
+        self.controls.append(transform)
+        return transform
+
+    def replace_shapes(self, node, keep_color=True):
+        """
+        Replace the curve, mesh, and nurbs surface shapes of an existing transform with the batch's shapes.
+
+        Args:
+            node: A transform node.
+            keep_color: If true, apply the override color of the existing shapes to the new shapes.
+        """
+        dag_path = traversal.get_dag_path(node)
+        if dag_path is None or not dag_path.hasFn(om2.MFn.kTransform):
+            raise TypeError(f"Expected a Transform node, got {node}")
+        color = None
+        for i in range(dag_path.childCount()):
+            child = dag_path.child(i)
+            if not any(child.hasFn(fn_type) for fn_type in REPLACEABLE_SHAPE_FN_TYPES):
+                continue
+            if keep_color and color is None:
+                color = _get_override_color(child)
+            # don't delete the control itself when these are its only children
+            self.modifier.deleteNode(child, includeParents=False)
+        self.add_shapes(dag_path, color)
+
+    def add_shapes(self, node, color=None):
+        """
+        Add the batch's shapes to an existing transform.
+
+        Args:
+            node: A transform node.
+            color: An optional LinearColor to set as the override color of the shapes.
+        """
+        dag_path = traversal.get_dag_path(node)
+        self._add_shape_nodes(dag_path.node(), om2.MFnDagNode(dag_path).name(), color)
+
+    def commit(self) -> List[pm.nt.Transform]:
+        """
+        Create all nodes and set all values in the batch.
+
+        Returns:
+            The new control transforms.
+        """
+        if self.is_committed:
+            raise RuntimeError("ControlBatch has already been committed")
+        modifiers.commit(self._do_it, self._undo_it)
+        self.is_committed = True
+        return traversal.to_py_nodes([om2.MDagPath.getAPathTo(transform) for transform in self.controls])
+
+    def _do_it(self):
+        self.modifier.doIt()
+        if self._value_modifier is None:
+            # plugs of new dynamic attributes are only available once the attributes have been added
+            self._value_modifier = om2.MDGModifier()
+            for node, attr_name, value in self._values:
+                plug = om2.MFnDependencyNode(node).findPlug(attr_name, False)
+                _add_plug_value(self._value_modifier, plug, value)
+        self._value_modifier.doIt()
+
+    def _undo_it(self):
+        self._value_modifier.undoIt()
+        self.modifier.undoIt()
+
+    def _set_local_matrix(self, transform: om2.MObject, matrix: om2.MMatrix, rotate_order: int):
+        transformation = om2.MTransformationMatrix(matrix)
+        translate = transformation.translation(om2.MSpace.kTransform)
+        rotate = transformation.rotation()
+        rotate.reorderIt(rotate_order)
+        scale = transformation.scale(om2.MSpace.kTransform)
+        self._values.append((transform, "rotateOrder", rotate_order))
+        for i, axis in enumerate("XYZ"):
+            self._values.append((transform, f"translate{axis}", translate[i]))
+            self._values.append((transform, f"rotate{axis}", om2.MAngle(rotate[i])))
+            self._values.append((transform, f"scale{axis}", scale[i]))
+        shear = transformation.shear(om2.MSpace.kTransform)
+        if any(shear):
+            for i, attr_name in enumerate(("shearXY", "shearXZ", "shearYZ")):
+                self._values.append((transform, attr_name, shear[i]))
+
+    def _add_shape_nodes(self, transform: om2.MObject, name: str, color=None):
+        for i, curve_data in enumerate(self.curve_data):
+            shape = self.modifier.createNode("nurbsCurve", transform)
+            self.modifier.renameNode(shape, f"{name}Shape{i + 1 if i else ''}")
+            self._values.append((shape, "cached", curve_data))
+            if color:
+                self._values.append((shape, "overrideEnabled", True))
+                self._values.append((shape, "overrideRGBColors", True))
+                for channel, value in zip("RGB", color[:3]):
+                    self._values.append((shape, f"overrideColor{channel}", float(value)))
+
+    def _add_metadata(self, node: om2.MObject, data: dict):
+        """
+        Add the metadata attributes to a new node, equivalent to `meta.set_all_metadata`.
+        """
+        metadata_attr = meta.core.METADATA_ATTR
+        self.modifier.addAttribute(
+            node, om2.MFnTypedAttribute().create(metadata_attr, metadata_attr, om2.MFnData.kString)
+        )
+        for class_name in data:
+            class_attr = meta.core.METACLASS_ATTR_PREFIX + class_name
+            self.modifier.addAttribute(
+                node, om2.MFnNumericAttribute().create(class_attr, class_attr, om2.MFnNumericData.kShort)
+            )
+        self._values.append((node, metadata_attr, meta.encode_metadata(data)))
+
+
+def _get_override_color(shape: om2.MObject) -> Optional[LinearColor]:
+    """
+    Return the override color of a shape, or None if its color is not overridden.
+    """
+    fn_node = om2.MFnDependencyNode(shape)
+    if fn_node.findPlug("overrideEnabled", False).asBool() and fn_node.findPlug("overrideRGBColors", False).asBool():
+        return LinearColor(*[fn_node.findPlug(f"overrideColor{c}", False).asFloat() for c in "RGB"])
+
+
+def create_controls(shape_data, target_nodes=None, names=None, link=False, parent=None, color=None):
+    """
+    Create many controls with the same shape data as a single undoable operation.
+
+    Args:
+        shape_data: A dict containing control shape data.
+        target_nodes: An optional list of transform nodes to position each control at.
+        names: An optional list of names for each control.
+        link (bool): If true, link each control to its target node.
+        parent: An optional transform node to parent the controls to.
+        color: An optional LinearColor to set as the override color of the controls.
+
+    Returns:
+        The list of new control transforms. One control is created for each target node or name, or
+        a single control if neither are given.
+    """
+    if target_nodes:
+        for target_node in target_nodes:
+            if not isinstance(target_node, pm.nt.Transform):
+                raise TypeError("target_node must be a Transform node")
+    count = len(target_nodes) if target_nodes else len(names) if names else 1
+    batch = ControlBatch(shape_data)
+    for i in range(count):
+        batch.create_control(
+            name=names[i] if names else None,
+            target_node=target_nodes[i] if target_nodes else None,
+            parent=parent,
+            color=color,
+            link=link,
+        )
+    return batch.commit()
+
+
 def create_control(shape_data, name=None, target_node=None, link=False, parent=None):
     """
     Create a control at the given target with the given shape data.
@@ -191,25 +608,9 @@ def create_control(shape_data, name=None, target_node=None, link=False, parent=N
         link (bool): If true, link the control to the target_node.
         parent: An optional transform node to parent the control to.
     """
-    if target_node and not isinstance(target_node, pm.nt.Transform):
-        raise TypeError("target_node must be a Transform node")
-    if name is None:
-        name = "ctl1"
-    # create control transform
-    ctl = pm.group(em=True, n=name)
-    add_shapes(ctl, shape_data)
-    if target_node:
-        # match target node transform settings
-        ctl.setAttr("rotateOrder", target_node.getAttr("rotateOrder"))
-        nodes.match_world_matrix(target_node, ctl)
-        if link:
-            links.create_default_link(ctl, target_node)
-    # group to main ctls group
-    if parent:
-        ctl.setParent(parent)
-    # apply metadata to keep track of control shapes
-    meta.set_metadata(ctl, CONTROL_SHAPE_METACLASS, {})
-    return ctl
+    target_nodes = [target_node] if target_node else None
+    names = [name] if name else None
+    return create_controls(shape_data, target_nodes, names, link=link, parent=parent)[0]
 
 
 def create_controls_for_selected(shape_data, link=True):
@@ -220,21 +621,26 @@ def create_controls_for_selected(shape_data, link=True):
         shape_data: A dict containing control shape data.
         link (bool): If true, link the controls to the target nodes.
     """
-    result = []
     sel = pm.selected()
     if not sel:
-        ctl = create_control(shape_data)
-        result.append(ctl)
-    else:
-        for node in sel:
-            if meta.has_metaclass(node, CONTROL_SHAPE_METACLASS):
-                # update shape
-                replace_shapes(node, shape_data)
-                result.append(node)
-            else:
-                # create new control
-                ctl = create_control(shape_data, target_node=node, link=link)
-                result.append(ctl)
+        result = create_controls(shape_data)
+        pm.select(result)
+        return result
+
+    # create and update all controls in one batch
+    batch = ControlBatch(shape_data)
+    new_ctl_indices = []
+    for i, node in enumerate(sel):
+        if meta.has_metaclass(node, CONTROL_SHAPE_METACLASS):
+            batch.replace_shapes(node)
+        else:
+            batch.create_control(target_node=node, link=link)
+            new_ctl_indices.append(i)
+    new_ctls = batch.commit()
+
+    result = list(sel)
+    for i, ctl in zip(new_ctl_indices, new_ctls):
+        result[i] = ctl
     pm.select(result)
     return result
 
@@ -246,14 +652,11 @@ def add_shapes(node, shape_data):
     """
     if not isinstance(node, pm.nt.Transform):
         raise TypeError(f"Expected a Transform node, got {type(node).__name__}")
-    result = []
-    for curveData in shape_data["curves"]:
-        curve = pm.curve(**curveData)
-        shape = curve.getShape()
-        pm.parent(shape, node, s=True, r=True)
-        pm.delete(curve)
-        result.append(shape)
-    return result
+    existing_shapes = set(node.getShapes())
+    batch = ControlBatch(shape_data)
+    batch.add_shapes(node)
+    batch.commit()
+    return [shape for shape in node.getShapes() if shape not in existing_shapes]
 
 
 def remove_shapes(node):
@@ -272,14 +675,20 @@ def replace_shapes(node, shape_data):
     """
     Replace the shapes on the given control node with the given shape data.
     """
-    if not isinstance(node, pm.nt.Transform):
-        raise TypeError(f"Expected a Transform node, got {type(node).__name__}")
+    replace_shapes_for_nodes([node], shape_data)
+
 
-    color = nodes.get_override_color(node)
-    remove_shapes(node)
-    add_shapes(node, shape_data)
-    if color:
-        nodes.set_override_color(node, color)
+def replace_shapes_for_nodes(nodes, shape_data):
+    """
+    Replace the shapes on many control nodes with the given shape data, as a single undoable operation.
+    The override color of each node is kept.
+    """
+    batch = ControlBatch(shape_data)
+    for node in nodes:
+        if not isinstance(node, pm.nt.Transform):
+            raise TypeError(f"Expected a Transform node, got {type(node).__name__}")
+        batch.replace_shapes(node)
+    batch.commit()
 
 
 def get_shape_data(node):
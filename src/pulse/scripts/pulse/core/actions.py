@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib
 import logging
 import re
 from typing import List, Iterable, Optional, Any, TYPE_CHECKING, Type
@@ -35,46 +36,129 @@ __all__ = [
 class BuildActionSpec(object):
     """
     Contains information about a registered build action class and its config.
+
+    A spec can also be created from an action manifest entry, in which case the action's module is not
+    imported until the action class, module, or editor form is actually needed.
     """
 
-    def __init__(self, action_cls: type["BuildAction"], module):
+    # the keys of the action info that is stored in a manifest entry
+    MANIFEST_KEYS = ("id", "display_name", "description", "color", "category", "attrs", "module", "class_name")
+
+    def __init__(self, action_cls: type["BuildAction"] = None, module=None, manifest_entry: dict = None):
         # the BuildAction subclass
-        self.action_cls = action_cls
+        self._action_cls = action_cls
         # the python module containing the BuildAction
-        self.module = module
+        self._module = module
+        # the action info from a generated manifest, used until the action class is loaded
+        self.manifest_entry = manifest_entry
 
     def __repr__(self):
         return f"<{self.__class__.__name__} '{self.id}'>"
 
+    @classmethod
+    def from_manifest_entry(cls, entry: dict) -> "BuildActionSpec":
+        """
+        Create a BuildActionSpec that loads its action class lazily.
+
+        Args:
+            entry: A dict of action info, as returned by `to_manifest_entry`.
+        """
+        return cls(manifest_entry=entry)
+
+    def to_manifest_entry(self) -> dict:
+        """
+        Return a dict of all action info needed to register and display this action without importing it.
+        """
+        entry = {key: getattr(self, key) for key in self.MANIFEST_KEYS if key not in ("module", "class_name")}
+        entry["module"], entry["class_name"] = self.get_class_path()
+        return entry
+
+    def is_loaded(self) -> bool:
+        """
+        Return true if the action class has been imported.
+        """
+        return self._action_cls is not None
+
+    def load(self):
+        """
+        Import the action's module and find the action class, if not already loaded.
+        """
+        if self.is_loaded() or not self.manifest_entry:
+            return
+
+        module_name, class_name = self.get_class_path()
+        LOG.debug("Importing action module: %s", module_name)
+        module = importlib.import_module(module_name)
+        self._action_cls = getattr(module, class_name)
+        self._module = module
+
+    def get_class_path(self) -> tuple[Optional[str], Optional[str]]:
+        """
+        Return the module name and class name of the action, without importing it.
+        """
+        if self.is_loaded():
+            return self._action_cls.__module__, self._action_cls.__name__
+        if self.manifest_entry:
+            return self.manifest_entry["module"], self.manifest_entry["class_name"]
+        return None, None
+
+    def _get_info(self, key: str, default=None):
+        """
+        Return a value from the manifest entry if the action is not loaded yet, or from the action class.
+        """
+        if not self.is_loaded() and self.manifest_entry:
+            return self.manifest_entry.get(key, default)
+        return getattr(self._action_cls, key, default)
+
+    @property
+    def action_cls(self) -> Optional[type["BuildAction"]]:
+        """
+        The BuildAction subclass. Imports the action module if necessary.
+        """
+        self.load()
+        return self._action_cls
+
+    @property
+    def module(self):
+        """
+        The python module containing the BuildAction. Imports the module if necessary.
+        """
+        self.load()
+        return self._module
+
     def is_valid(self) -> bool:
-        return self.action_cls is not None and self.id
+        return (self.is_loaded() or bool(self.manifest_entry)) and self.id
 
     def is_equal(self, other: "BuildActionSpec") -> bool:
         """
         Return true if this action spec is the same as another.
         """
-        return self.action_cls == other.action_cls
+        if self.is_loaded() and other.is_loaded():
+            return self._action_cls == other._action_cls
+        return self.get_class_path() == other.get_class_path()
 
     @property
     def id(self):
         """
         The globally unique action id.
         """
-        return self.action_cls.id if self.action_cls else None
+        return self._get_info("id")
 
     @property
     def display_name(self):
         """
         The display name of the action.
         """
-        return self.action_cls.display_name
+        return self._get_info("display_name")
 
     @property
     def description(self):
         """
         The description of the action.
         """
-        doc = self.action_cls.__doc__
+        if not self.is_loaded() and self.manifest_entry:
+            return self.manifest_entry.get("description")
+        doc = self._action_cls.__doc__ if self._action_cls else None
         if doc:
             doc = doc.strip().split("\n")[0]
         return doc
@@ -84,24 +168,29 @@ class BuildActionSpec(object):
         """
         The display color of the action.
         """
-        return self.action_cls.color
+        return self._get_info("color")
 
     @property
     def category(self):
         """
         The menu category where the action will be grouped.
         """
-        return self.action_cls.category
+        return self._get_info("category")
 
     @property
     def attrs(self):
         """
         The list of all attribute definitions.
         """
-        return self.action_cls.attr_definitions
+        if not self.is_loaded() and self.manifest_entry:
+            return self.manifest_entry.get("attrs", [])
+        return self._action_cls.attr_definitions
 
     @property
     def editor_form_cls(self):
+        """
+        The editor form class of the action. Imports the action module if necessary.
+        """
         return self.action_cls.editor_form_class
 
 
@@ -209,7 +298,8 @@ class BuildActionRegistry(object):
         Find a BuildActionSpec by action class.
         """
         for spec in self._action_specs.values():
-            if spec.action_cls == action_cls:
+            # compare by class path to avoid importing every lazily loaded action
+            if spec.get_class_path() == (action_cls.__module__, action_cls.__name__):
                 return spec
 
 
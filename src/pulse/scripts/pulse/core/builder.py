@@ -14,6 +14,7 @@ from .actions import BuildStep, BuildAction
 from .blueprint import Blueprint, BlueprintSettings
 from .rigs import RIG_METACLASS
 from .. import names
+from .. import util_nodes
 from ..vendor import pymetanode as meta
 
 __all__ = [
@@ -93,6 +94,17 @@ class BlueprintBuilder(object):
         self.elapsed_time = 0.0
         self.show_progress_ui = True
         self.progress_title = "Building Blueprint"
+        # if true, use the live meta class registry while building to speed up finding meta nodes
+        self.use_meta_registry = True
+        self._is_meta_registry_enabled = False
+        # if true, reuse identical utility nodes created during the build, see `util_nodes.UtilNodeCache`
+        self.use_util_node_cache = False
+        self._is_util_node_cache_enabled = False
+        # if true, also evaluate utility node expressions with only constant inputs in python
+        self.fold_util_node_constants = False
+        # if true, suspend rig lifecycle events while building, checking all new nodes once the build ends
+        self.suspend_rig_events = True
+        self._are_rig_events_suspended = False
         # the current context that should be associated with any warnings or errors that occur.
         # includes the current 'step' and 'action' when fully populated.
         self._log_context = {}
@@ -363,6 +375,18 @@ class BlueprintBuilder(object):
         """
         # record time
         self.start_time = time.time()
+        if self.use_meta_registry:
+            meta.enable_registry()
+            self._is_meta_registry_enabled = True
+        if self.use_util_node_cache:
+            util_nodes.enable_node_cache(self.fold_util_node_constants)
+            self._is_util_node_cache_enabled = True
+        if self.suspend_rig_events:
+            # imported here since events depends on the core package
+            from ..events import RigLifecycleEvents
+
+            RigLifecycleEvents.get_shared().suspend()
+            self._are_rig_events_suspended = True
         # log start of build
         start_msg = self.get_start_build_log_message()
         if start_msg:
@@ -391,6 +415,7 @@ class BlueprintBuilder(object):
 
     def _on_build_end(self):
         self.apply_rig_metadata()
+        self._release_build_state()
 
         pm.select(clear=True)
 
@@ -398,6 +423,33 @@ class BlueprintBuilder(object):
         self.end_time = time.time()
         self.elapsed_time = self.end_time - self.start_time
 
+    def _release_build_state(self):
+        """
+        Disable the metadata registry, utility node cache, and rig event suspension that were enabled
+        when the build started. Safe to call more than once, and called when the build ends,
+        fails with an exception, or is discarded before finishing.
+        """
+        if self._is_meta_registry_enabled:
+            meta.disable_registry()
+            self._is_meta_registry_enabled = False
+
+        if self._are_rig_events_suspended:
+            from ..events import RigLifecycleEvents
+
+            RigLifecycleEvents.get_shared().resume()
+            self._are_rig_events_suspended = False
+
+        if self._is_util_node_cache_enabled:
+            cache = util_nodes.disable_node_cache()
+            self._is_util_node_cache_enabled = False
+            if cache and cache.num_saved:
+                self.logger.info(
+                    "Saved %d utility nodes (%d reused, %d folded)",
+                    cache.num_saved,
+                    cache.num_reused,
+                    cache.num_folded,
+                )
+
     def on_finish(self):
         """
         Called when the build has completely finished.
@@ -473,29 +525,33 @@ class BlueprintBuilder(object):
         This is the main iterator for performing all build operations.
         It runs all BuildSteps and BuildActions in order.
         """
-        self.clear_validate_results()
+        try:
+            self.clear_validate_results()
 
-        yield dict(index=1, total=100, phase="setup", status="Retrieve Actions")
-        all_actions = self._generate_all_actions()
-        action_count = len(all_actions)
+            yield dict(index=1, total=100, phase="setup", status="Retrieve Actions")
+            all_actions = self._generate_all_actions()
+            action_count = len(all_actions)
 
-        self._on_actions_generated(all_actions)
+            self._on_actions_generated(all_actions)
 
-        for index, (step, action, action_index) in enumerate(all_actions):
-            self.current_build_step_path = step.get_full_path()
+            for index, (step, action, action_index) in enumerate(all_actions):
+                self.current_build_step_path = step.get_full_path()
 
-            # return progress for the action that is about to run
-            yield dict(index=index, total=action_count, phase="actions", status=self.current_build_step_path)
+                # return progress for the action that is about to run
+                yield dict(index=index, total=action_count, phase="actions", status=self.current_build_step_path)
 
-            # run the action
-            action.builder = self
-            # note that the rig will not exist until a Create Rig action has run
-            action.rig = self.rig
-            self._log_context = dict(step=step, action=action, action_index=action_index)
-            self.run_build_action(step, action, action_index, index, action_count)
-            self._log_context = {}
+                # run the action
+                action.builder = self
+                # note that the rig will not exist until a Create Rig action has run
+                action.rig = self.rig
+                self._log_context = dict(step=step, action=action, action_index=action_index)
+                self.run_build_action(step, action, action_index, index, action_count)
+                self._log_context = {}
 
-        yield dict(index=action_count, total=action_count, phase="finished", status="Finished")
+            yield dict(index=action_count, total=action_count, phase="finished", status="Finished")
+        finally:
+            # make sure nothing stays enabled if the build raises, or the generator is closed before finishing
+            self._release_build_state()
 
     def clear_validate_results(self):
         """
@@ -509,9 +565,13 @@ class BlueprintBuilder(object):
         """
         Expand all build actions to perform from all build steps and their variants.
         """
+        from .. import sym
+
         start_time = time.time()
 
-        result = list(self.action_iterator())
+        # share mirror pairs between all mirrored actions
+        with sym.mirror_pairing_scope():
+            result = list(self.action_iterator())
 
         end_time = time.time()
         duration = end_time - start_time
@@ -3,19 +3,25 @@ Functionality for finding and loading Pulse Build Actions from a library of acti
 """
 from __future__ import annotations
 
+import ast
+import hashlib
 import importlib
 import logging
 import os
+import pprint
 import sys
+import tempfile
 import types
 from fnmatch import fnmatch
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .actions import BuildAction, BuildActionSpec, BuildActionRegistry
 
 __all__ = [
     "BuildActionLoader",
     "BuildActionPackageRegistry",
+    "generate_action_manifest",
+    "get_action_manifest_path",
     "import_all_submodules",
     "load_actions",
     "reload_actions",
@@ -23,6 +29,12 @@ __all__ = [
 
 LOG = logging.getLogger(__name__)
 
+# the directory where generated action manifests are cached
+ACTION_MANIFEST_CACHE_DIR = os.path.join(tempfile.gettempdir(), "pulse", "action_manifests")
+
+# the version of the action manifest format, manifests with a different version are regenerated
+ACTION_MANIFEST_VERSION = 1
+
 
 def import_all_submodules(pkg_name: str):
     """
@@ -38,27 +50,160 @@ def import_all_submodules(pkg_name: str):
     Args:
         pkg_name: The name of python package where everything will be imported
     """
+    for sub_module_name, _ in _iter_package_module_files(pkg_name):
+        importlib.import_module(sub_module_name)
+
+
+def _iter_package_module_files(pkg_name: str, include_init=False) -> Iterator[Tuple[str, str]]:
+    """
+    Yield the full module name and file path of all python modules within a package recursively.
+
+    Args:
+        pkg_name: The name of the python package to search.
+        include_init: If true, include the __init__.py files of the package and its sub-packages.
+    """
     # get the full path to the pkg
     pkg_module = sys.modules[pkg_name]
     pkg_path = pkg_module.__path__[0]
 
-    # find all __init__.py files recursively
+    # find all python files recursively
     for base_dir, dir_names, file_names in os.walk(pkg_path):
-        # potential name of a sub-package
-        if os.path.basename(base_dir) in ("__pycache__",):
-            continue
+        # don't search cache dirs
+        dir_names[:] = sorted(d for d in dir_names if d != "__pycache__")
 
+        # the relative sub-package, or "." for the root package
         sub_pkg_name = os.path.relpath(base_dir, pkg_path).replace("/", ".").replace("\\", ".")
+        full_pkg_name = pkg_name if sub_pkg_name == "." else f"{pkg_name}.{sub_pkg_name}"
+
+        for file_name in sorted(file_names):
+            if not fnmatch(file_name, "*.py") or file_name == "__main__.py":
+                continue
 
-        for file_name in file_names:
-            if file_name in ("__init__.py", "__main__.py"):
+            file_path = os.path.join(base_dir, file_name)
+            if file_name == "__init__.py":
+                if include_init:
+                    yield full_pkg_name, file_path
                 continue
 
-            if fnmatch(file_name, "*.py"):
-                module_name = os.path.splitext(file_name)[0]
-                # leading dot to make sure it's a relative import to the root package
-                sub_module_name = f".{sub_pkg_name}.{module_name}"
-                importlib.import_module(sub_module_name, pkg_name)
+            module_name = os.path.splitext(file_name)[0]
+            yield f"{full_pkg_name}.{module_name}", file_path
+
+
+def _get_package_file_hashes(pkg_name: str) -> Dict[str, str]:
+    """
+    Return a hash of the contents of every python file in a package, indexed by module name.
+    """
+    result = {}
+    for module_name, file_path in _iter_package_module_files(pkg_name, include_init=True):
+        with open(file_path, "rb") as fp:
+            result[module_name] = hashlib.md5(fp.read()).hexdigest()
+    return result
+
+
+def get_action_manifest_path(package: types.ModuleType) -> str:
+    """
+    Return the path to the cached action manifest for a package.
+    Manifests are cached per package location, so that different versions of a package don't collide.
+
+    Args:
+        package: A python package containing BuildActions.
+    """
+    pkg_path = os.path.normpath(os.path.abspath(package.__path__[0]))
+    path_hash = hashlib.md5(pkg_path.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(ACTION_MANIFEST_CACHE_DIR, f"{package.__name__}_{path_hash}.py")
+
+
+def generate_action_manifest(package: types.ModuleType, action_specs: List[BuildActionSpec] = None) -> dict:
+    """
+    Generate a manifest of all actions in a package, containing everything needed to
+    register and display the actions without importing their modules.
+
+    Args:
+        package: A python package containing BuildActions.
+        action_specs: The already loaded actions of the package. If not given, all modules in the package
+            are imported to find them.
+
+    Returns:
+        A dict with the manifest version, the hash of every module in the package, and a list of action entries.
+    """
+    if action_specs is None:
+        action_specs = BuildActionLoader(use_registry=False, use_manifest=False).load_actions_from_package(package)
+
+    module_hashes = _get_package_file_hashes(package.__name__)
+
+    entries = []
+    entry_ids = set()
+    eager_modules = set()
+    for action_spec in action_specs:
+        entry = action_spec.to_manifest_entry()
+        if entry["id"] in entry_ids:
+            # the same action was found through more than one module
+            continue
+        if entry["module"] not in module_hashes:
+            LOG.debug("Action is not defined in package %s, skipping from manifest: %s", package.__name__, entry)
+            continue
+        if not _is_literal(entry):
+            # actions with non-literal info can't be stored, always import their module instead
+            LOG.debug("Action info cannot be stored in a manifest: %s", action_spec)
+            eager_modules.add(entry["module"])
+            continue
+        entries.append(entry)
+        entry_ids.add(entry["id"])
+
+    # modules that are imported anyway don't need entries for any of their actions
+    entries = [entry for entry in entries if entry["module"] not in eager_modules]
+
+    return {
+        "version": ACTION_MANIFEST_VERSION,
+        "package": package.__name__,
+        "modules": module_hashes,
+        "eager_modules": sorted(eager_modules),
+        "actions": entries,
+    }
+
+
+def _is_literal(data) -> bool:
+    """
+    Return true if data can be written with repr and read back with `ast.literal_eval` unchanged.
+    """
+    try:
+        return ast.literal_eval(repr(data)) == data
+    except (ValueError, SyntaxError):
+        return False
+
+
+def _write_action_manifest(manifest: dict, path: str):
+    """
+    Write an action manifest to a file. Manifests are written as python literals so that
+    tuples and other values used in action definitions are preserved exactly.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fp:
+            # dict keys are sorted, which is fine since only the values matter when reading it back
+            fp.write(pprint.pformat(manifest))
+    except OSError as e:
+        LOG.warning("Failed to write action manifest %s: %s", path, e)
+
+
+def _read_action_manifest(path: str) -> Optional[dict]:
+    """
+    Read an action manifest from a file. Returns None if it doesn't exist, or is invalid or outdated.
+    """
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        with open(path, "r") as fp:
+            manifest = ast.literal_eval(fp.read())
+    except (OSError, ValueError, SyntaxError) as e:
+        LOG.warning("Failed to read action manifest %s: %s", path, e)
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != ACTION_MANIFEST_VERSION:
+        return None
+
+    return manifest
 
 
 def _is_same_python_file(path_a, path_b):
@@ -165,9 +310,12 @@ class BuildActionLoader(object):
     They can then be registered with the build action registry for use.
     """
 
-    def __init__(self, use_registry=True):
+    def __init__(self, use_registry=True, use_manifest=True):
         # if true, automatically register loaded actions, otherwise just return them
         self.use_registry = use_registry
+        # if true, load actions from a cached manifest when it's up-to-date instead of importing every
+        # action module, and write a new manifest whenever a package has to be fully imported
+        self.use_manifest = use_manifest
 
     def load_actions_from_package(self, package: types.ModuleType) -> List[BuildActionSpec]:
         """
@@ -175,12 +323,52 @@ class BuildActionLoader(object):
         Searches BuildAction subclasses recursively in all submodules.
         Automatically register each spec if `self.use_registry` is True.
 
+        If `self.use_manifest` is True and the package's manifest is up-to-date, the actions are loaded from
+        the manifest, and each action module is only imported once that action is actually used.
+
         Args:
             package: A python package containing BuildActions
         """
         LOG.info("Loading Pulse actions from package: %s", package)
 
-        return self._load_actions_from_module(package)
+        if self.use_manifest:
+            action_specs = self._load_actions_from_manifest(package)
+            if action_specs is not None:
+                return action_specs
+
+        import_all_submodules(package.__name__)
+        action_specs = self._load_actions_from_module(package)
+
+        if self.use_manifest:
+            manifest = generate_action_manifest(package, action_specs)
+            _write_action_manifest(manifest, get_action_manifest_path(package))
+
+        return action_specs
+
+    def _load_actions_from_manifest(self, package: types.ModuleType) -> Optional[List[BuildActionSpec]]:
+        """
+        Load lazy action specs from the cached manifest of a package.
+        Returns None if there is no manifest, or if any module in the package has changed since it was generated.
+        """
+        manifest_path = get_action_manifest_path(package)
+        manifest = _read_action_manifest(manifest_path)
+        if not manifest or manifest.get("package") != package.__name__:
+            return None
+
+        if manifest.get("modules") != _get_package_file_hashes(package.__name__):
+            LOG.debug("Action manifest is out of date: %s", manifest_path)
+            return None
+
+        LOG.debug("Loading actions from manifest: %s", manifest_path)
+        action_specs = [BuildActionSpec.from_manifest_entry(entry) for entry in manifest["actions"]]
+        if self.use_registry:
+            self.register_actions(action_specs)
+
+        # import any modules whose actions couldn't be stored in the manifest
+        for module_name in manifest.get("eager_modules", []):
+            action_specs.extend(self._load_actions_from_module(importlib.import_module(module_name)))
+
+        return action_specs
 
     def _load_actions_from_module(self, module: types.ModuleType) -> List[BuildActionSpec]:
         """
@@ -1,40 +1,58 @@
 import logging
+from typing import Dict, List, Optional
 
+import maya.OpenMaya as api
+import maya.api.OpenMaya as om2
 import pymel.core as pm
 from maya import cmds
 
+from .. import traversal
 from ..vendor import pymetanode as meta
 
 __all__ = [
     "RIG_METACLASS",
+    "RigIndex",
+    "RigLookup",
     "create_rig_node",
+    "disable_rig_index",
+    "enable_rig_index",
     "get_all_rigs",
     "get_all_rigs_by_name",
     "get_rig_from_node",
+    "get_rig_index",
     "get_selected_rigs",
     "is_rig",
+    "rig_index_enabled",
 ]
 
 LOG = logging.getLogger(__name__)
 
 RIG_METACLASS = "pulse_rig"
 
+# the shared rig index, only exists while enabled
+_rig_index: Optional["RigIndex"] = None
+# the number of times the rig index has been enabled
+_rig_index_enable_count = 0
+
 
 def is_rig(node):
     """
     Return whether a node represents a pulse rig
 
     Args:
-        node: A PyNode or string node name
+        node: A PyNode, NodeHandle, or string node name
     """
     return meta.has_metaclass(node, RIG_METACLASS)
 
 
-def get_all_rigs():
+def get_all_rigs(as_handles=False):
     """
     Return a list of all rigs in the scene
+
+    Args:
+        as_handles: Return NodeHandles instead of PyNodes
     """
-    return meta.find_meta_nodes(RIG_METACLASS)
+    return meta.find_meta_nodes(RIG_METACLASS, as_handles=as_handles)
 
 
 def get_all_rigs_by_name(names):
@@ -45,6 +63,8 @@ def get_all_rigs_by_name(names):
     Args:
         names: A list of string rig names
     """
+    if _rig_index:
+        return _rig_index.get_rigs_by_name(names)
     rigs = get_all_rigs()
     matches = []
     for r in rigs:
@@ -54,30 +74,349 @@ def get_all_rigs_by_name(names):
     return matches
 
 
-def get_rig_from_node(node):
+class RigLookup(traversal.AncestorLookup):
+    """
+    Finds the rigs that own nodes, remembering the rig of every node visited,
+    so that finding the rig of many nodes in the same hierarchy is fast.
+
+    Should only be used while the hierarchy is unchanged, e.g. for a single operation.
+    """
+
+    def __init__(self):
+        super(RigLookup, self).__init__(lambda dag_path: is_rig(dag_path.fullPathName()))
+
+    def get_rig(self, node) -> Optional[pm.PyNode]:
+        """
+        Return the rig that owns a node, if any.
+
+        Args:
+            node: A PyNode rig or node that is part of a rig
+        """
+        rig_path = self.find(node)
+        if rig_path:
+            return pm.PyNode(rig_path)
+
+
+def get_rig_from_node(node, lookup: RigLookup = None):
     """
     Return the rig that owns this node, if any
 
     Args:
         node: A PyNode rig or node that is part of a rig
+        lookup: A RigLookup to use when finding the rig of many nodes
     """
-    if is_rig(node):
-        return node
-    else:
-        parent = node.getParent()
-        if parent:
-            return get_rig_from_node(parent)
+    if lookup is None and _rig_index:
+        return _rig_index.get_rig(node)
+    if lookup is None:
+        lookup = RigLookup()
+    return lookup.get_rig(node)
 
 
 def get_selected_rigs():
     """
     Return the selected rigs
     """
-    rigs = list(set([get_rig_from_node(s) for s in pm.selected()]))
+    lookup = None if _rig_index else RigLookup()
+    rigs = list(set([get_rig_from_node(s, lookup) for s in pm.selected()]))
     rigs = [r for r in rigs if r is not None]
     return rigs
 
 
+class RigIndex(object):
+    """
+    A per-scene index of rigs, mapping rig names to rigs and nodes to the rig that owns them,
+    with cached metadata and core hierarchy nodes for each rig.
+
+    The index is built lazily the first time it is queried, by finding all rigs and traversing only
+    the hierarchy below each rig. It is invalidated when rigs are created or deleted, when the DAG or
+    node names change inside a rig or above one, or when a scene is opened. Metadata is decoded on demand, and dropped when a rig's metadata changes.
+    """
+
+    def __init__(self):
+        self.is_valid = False
+        # full paths of all rigs, in DAG order
+        self._rig_paths: List[str] = []
+        # {full path: full path of the rig that owns the node}, only for transforms that are part of a rig
+        self._owners: Dict[str, str] = {}
+        # {rig full path: PyNode}
+        self._rig_nodes: Dict[str, pm.PyNode] = {}
+        # {rig full path: handle to the rig node}, used to detect when a rig's path changes
+        self._rig_handles: Dict[str, om2.MObjectHandle] = {}
+        # {rig full path: decoded metadata}
+        self._meta_data: Dict[str, dict] = {}
+        # {rig full path: {name: core hierarchy node}}
+        self._core_hierarchy: Dict[str, Dict[str, pm.PyNode]] = {}
+        # the global callback ids
+        self._callback_ids: List[int] = []
+        # {rig full path: attribute changed callback id}
+        self._rig_callback_ids: Dict[str, int] = {}
+        self._is_started = False
+
+    def __del__(self):
+        self.stop()
+
+    def start(self):
+        """
+        Register all callbacks that invalidate the index.
+        """
+        if self._is_started:
+            return
+        self._is_started = True
+
+        # imported here since events depends on the core package
+        from ..events import RigLifecycleEvents
+
+        rig_events = RigLifecycleEvents.get_shared()
+        rig_events.onRigCreated.append_unique(self.invalidate)
+        rig_events.onRigDeleted.append_unique(self.invalidate)
+        rig_events.add_subscriber(self)
+
+        self._callback_ids = [
+            api.MDagMessage.addAllDagChangesCallback(self._on_dag_changed),
+            api.MNodeMessage.addNameChangedCallback(api.MObject(), self._on_name_changed),
+            api.MSceneMessage.addCallback(api.MSceneMessage.kAfterOpen, self.invalidate),
+            api.MSceneMessage.addCallback(api.MSceneMessage.kAfterNew, self.invalidate),
+        ]
+
+    def stop(self):
+        """
+        Remove all callbacks and clear the index.
+        """
+        if not self._is_started:
+            return
+        self._is_started = False
+
+        from ..events import RigLifecycleEvents
+
+        rig_events = RigLifecycleEvents.get_shared()
+        rig_events.onRigCreated.remove_all(self.invalidate)
+        rig_events.onRigDeleted.remove_all(self.invalidate)
+        rig_events.remove_subscriber(self)
+
+        for callback_id in self._callback_ids:
+            api.MMessage.removeCallback(callback_id)
+        self._callback_ids = []
+        self.invalidate()
+
+    def invalidate(self, *args):
+        """
+        Clear the index so that it is rebuilt on the next query.
+        """
+        if not self.is_valid:
+            return
+        self.is_valid = False
+        for callback_id in self._rig_callback_ids.values():
+            api.MMessage.removeCallback(callback_id)
+        self._rig_callback_ids = {}
+        self._rig_paths = []
+        self._owners = {}
+        self._rig_nodes = {}
+        self._rig_handles = {}
+        self._meta_data = {}
+        self._core_hierarchy = {}
+
+    def _update(self):
+        """
+        Rebuild the index if it is not valid, finding all rigs and the nodes they own by traversing each rig's hierarchy.
+        """
+        if self.is_valid:
+            return
+        for rig in meta.find_meta_nodes(RIG_METACLASS):
+            rig_dag_path = traversal.get_dag_path(rig)
+            if rig_dag_path is not None:
+                rig_path = rig_dag_path.fullPathName()
+                self._rig_paths.append(rig_path)
+                self._rig_nodes[rig_path] = rig
+                self._rig_handles[rig_path] = om2.MObjectHandle(rig_dag_path.node())
+
+        # visit deeper rigs first, so that nodes of a rig inside another rig are owned by the innermost rig
+        it = om2.MItDag()
+        for rig_path in sorted(self._rig_paths, key=lambda path: path.count("|"), reverse=True):
+            it.reset(traversal.get_dag_path(rig_path), om2.MItDag.kDepthFirst, om2.MFn.kTransform)
+            while not it.isDone():
+                full_path = it.fullPathName()
+                if full_path in self._owners:
+                    # already owned by a nested rig
+                    it.prune()
+                else:
+                    self._owners[full_path] = rig_path
+                it.next()
+
+        if self._is_started:
+            for rig_path in self._rig_paths:
+                self._rig_callback_ids[rig_path] = api.MNodeMessage.addAttributeChangedCallback(
+                    meta.get_m_object(rig_path), self._on_rig_attribute_changed, rig_path
+                )
+        self.is_valid = True
+
+    def _have_rig_paths_changed(self) -> bool:
+        """
+        Return True if any indexed rig was deleted, reparented, or renamed (directly or through an ancestor).
+        """
+        for rig_path, handle in self._rig_handles.items():
+            if not handle.isValid() or om2.MDagPath.getAPathTo(handle.object()).fullPathName() != rig_path:
+                return True
+        return False
+
+    def _on_dag_changed(self, msg: int, child: api.MDagPath, parent: api.MDagPath, *args):
+        if not self.is_valid:
+            return
+        # a node was added to or removed from a rig, or a rig itself was moved
+        if parent.fullPathName() in self._owners or self._have_rig_paths_changed():
+            self.invalidate()
+
+    def _on_name_changed(self, node: api.MObject, prev_name: str, *args):
+        if not self.is_valid or not node.hasFn(api.MFn.kDagNode):
+            return
+        full_path = api.MFnDagNode(node).fullPathName()
+        # a node inside a rig was renamed, or a rig or one of its ancestors was renamed
+        if full_path.rpartition("|")[0] in self._owners or self._have_rig_paths_changed():
+            self.invalidate()
+
+    def _on_rig_attribute_changed(self, msg: int, plug: api.MPlug, other_plug: api.MPlug, rig_path: str):
+        if msg & (api.MNodeMessage.kAttributeAdded | api.MNodeMessage.kAttributeRemoved):
+            # the node may no longer be a rig
+            self.invalidate()
+        elif msg & api.MNodeMessage.kAttributeSet:
+            if api.MFnAttribute(plug.attribute()).name() == meta.core.METADATA_ATTR:
+                self._meta_data.pop(rig_path, None)
+
+    def _get_rig_node(self, rig_path: str) -> pm.PyNode:
+        if rig_path not in self._rig_nodes:
+            self._rig_nodes[rig_path] = pm.PyNode(rig_path)
+        return self._rig_nodes[rig_path]
+
+    def _get_rig_path(self, rig) -> Optional[str]:
+        dag_path = traversal.get_dag_path(rig)
+        return dag_path.fullPathName() if dag_path else None
+
+    def get_rigs(self) -> List[pm.PyNode]:
+        """
+        Return all rigs in the scene.
+        """
+        self._update()
+        return [self._get_rig_node(rig_path) for rig_path in self._rig_paths]
+
+    def get_rigs_by_name(self, names) -> List[pm.PyNode]:
+        """
+        Return all rigs in the scene that have a specific rig name.
+
+        Args:
+            names: A list of string rig names
+        """
+        self._update()
+        return [
+            self._get_rig_node(rig_path)
+            for rig_path in self._rig_paths
+            if self._get_meta_data(rig_path).get("name") in names
+        ]
+
+    def get_rig(self, node) -> Optional[pm.PyNode]:
+        """
+        Return the rig that owns a node, if any.
+
+        Args:
+            node: A PyNode rig or node that is part of a rig
+        """
+        self._update()
+        dag_path = traversal.get_dag_path(node)
+        if dag_path is None:
+            return None
+        # shapes are not indexed, find the rig of their parent
+        path = dag_path.fullPathName()
+        while path:
+            if path in self._owners:
+                return self._get_rig_node(self._owners[path])
+            path = path.rpartition("|")[0]
+
+    def get_meta_data(self, rig) -> dict:
+        """
+        Return the decoded rig metadata of a rig.
+
+        Args:
+            rig: A PyNode rig
+        """
+        self._update()
+        return self._get_meta_data(self._get_rig_path(rig))
+
+    def _get_meta_data(self, rig_path: str) -> dict:
+        if rig_path not in self._meta_data:
+            self._meta_data[rig_path] = meta.get_metadata(rig_path, RIG_METACLASS) or {}
+        return self._meta_data[rig_path]
+
+    def get_core_hierarchy_nodes(self, rig) -> Dict[str, pm.PyNode]:
+        """
+        Return the core hierarchy transform nodes of a rig, indexed by name.
+
+        Args:
+            rig: A PyNode rig
+        """
+        self._update()
+        rig_path = self._get_rig_path(rig)
+        if rig_path not in self._core_hierarchy:
+            dag_path = traversal.get_dag_path(rig_path)
+            children = {}
+            for i in range(dag_path.childCount()):
+                child = dag_path.child(i)
+                if child.hasFn(om2.MFn.kTransform):
+                    child_path = om2.MDagPath.getAPathTo(child)
+                    children[om2.MFnDagNode(child_path).name()] = pm.PyNode(child_path.fullPathName())
+            self._core_hierarchy[rig_path] = children
+        return self._core_hierarchy[rig_path]
+
+
+def get_rig_index() -> Optional[RigIndex]:
+    """
+    Return the shared rig index, or None if it is not enabled.
+    """
+    return _rig_index
+
+
+def enable_rig_index() -> RigIndex:
+    """
+    Enable the shared rig index, so that finding rigs, their metadata, and the rigs
+    that own nodes uses a cached index of the scene.
+
+    Calls can be nested, the index stays enabled until `disable_rig_index` has been
+    called once for each call to `enable_rig_index`.
+
+    Returns:
+        The shared RigIndex.
+    """
+    global _rig_index, _rig_index_enable_count
+    _rig_index_enable_count += 1
+    if _rig_index is None:
+        _rig_index = RigIndex()
+        _rig_index.start()
+    return _rig_index
+
+
+def disable_rig_index(force=False):
+    """
+    Disable the shared rig index.
+
+    Args:
+        force: Disable the index immediately, even if `enable_rig_index` was called more than once.
+    """
+    global _rig_index, _rig_index_enable_count
+    _rig_index_enable_count = 0 if force else max(_rig_index_enable_count - 1, 0)
+    if _rig_index_enable_count == 0 and _rig_index is not None:
+        _rig_index.stop()
+        _rig_index = None
+
+
+class rig_index_enabled(object):
+    """
+    Context manager that enables the shared rig index for the duration of a block.
+    """
+
+    def __enter__(self) -> RigIndex:
+        return enable_rig_index()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        disable_rig_index()
+
+
 def create_rig_node(name: str, extra_data: dict = None) -> pm.nt.Transform:
     """
     Create and return a new Rig node
@@ -118,6 +457,8 @@ class Rig(object):
 
     @property
     def meta_data(self):
+        if _rig_index:
+            return _rig_index.get_meta_data(self.node)
         if self._metaData is None:
             self._metaData = meta.get_metadata(self.node, RIG_METACLASS)
         return self._metaData if self._metaData else {}
@@ -133,6 +474,8 @@ class Rig(object):
         Args:
             name (str): The name of the core hierarchy node as defined in the Build Core Hierarchy action
         """
+        if _rig_index:
+            return _rig_index.get_core_hierarchy_nodes(self.node).get(name)
         children = self.node.getChildren(type="transform")
         for child in children:
             if child.nodeName() == name:
@@ -142,6 +485,8 @@ class Rig(object):
         """
         Return all core hierarchy transform nodes in the rig.
         """
+        if _rig_index:
+            return list(_rig_index.get_core_hierarchy_nodes(self.node).values())
         return self.node.getChildren(type="transform")
 
     def get_anim_controls(self):
@@ -551,27 +551,30 @@ def upgrade_all_links():
 
 
 def position_link_for_selected():
+    """
+    Update the position of the selected linked nodes, or all linked nodes if nothing is selected.
+    Nodes are updated in dependency order, see `links.LinkSolver`.
+    """
     sel = pm.selected()
     if not sel:
-        sel = links.get_all_linked_nodes()
-        # TODO: sort by parenting hierarchy
-    else:
-        old_len = len(sel)
-        # filter for only linked nodes
-        sel = [s for s in sel if links.is_linked(s)]
-        if old_len > 0 and len(sel) == 0:
-            # something was selected, but no linked nodes
-            LOG.warning("No linked nodes were selected")
-
-    show_progress = len(sel) > 20
-    if show_progress:
-        pm.progressWindow(t="Positioning Links", min=0, max=len(sel))
-    for node in sel:
-        links.apply_link_position(node)
-        if show_progress:
-            pm.progressWindow(e=True, step=1)
-    if show_progress:
-        pm.progressWindow(endProgress=True)
+        links.update_links()
+        return
+
+    # filter for only linked nodes
+    sel = [s for s in sel if links.is_linked(s)]
+    if not sel:
+        # something was selected, but no linked nodes
+        LOG.warning("No linked nodes were selected")
+        return
+    links.update_links(sel)
+
+
+def update_all_links():
+    """
+    Update the position of all linked nodes in the scene in a single evaluation.
+    """
+    solver = links.update_links()
+    LOG.info("Updated %d links", len(solver.order))
 
 
 def pair_selected():
@@ -586,8 +589,16 @@ def unpair_selected():
 
 
 def mirror_selected(
-    recursive=True, create=True, curve_shapes=True, links=True, reparent=True, transform=True, appearance=True, axis=0
-):
+    recursive=True,
+    create=True,
+    curve_shapes=True,
+    links=True,
+    reparent=True,
+    transform=True,
+    appearance=True,
+    axis=0,
+    dry_run=False,
+) -> Optional[sym.MirrorPlan]:
     """
     Perform a mirroring operation on the selected nodes.
 
@@ -600,6 +611,7 @@ def mirror_selected(
         transform (bool): Mirror the transform matrices of the nodes
         appearance (bool): Mirror the name and color of the nodes
         axis (int): The axis to mirror on.
+        dry_run (bool): Don't modify the scene, only log and return the plan of changes that would be made.
     """
     sel_nodes = pm.selected()
     if not sel_nodes:
@@ -633,16 +645,22 @@ def mirror_selected(
     if links:
         util.add_operation(sym.MirrorLinks())
 
+    if dry_run:
+        plan = util.plan(sel_nodes)
+        LOG.info("Mirror plan (%.3fs): %s", plan.plan_time, plan.get_counts())
+        return plan
+
     util.run(sel_nodes)
 
 
-def save_skin_weights_for_selected(file_path=None):
+def save_skin_weights_for_selected(file_path=None, binary=False):
     """
     Save skin weights for the selected meshes to a file.
 
     Args:
         file_path (str): A full path to a .weights file to write. If None,
             will use the scene name.
+        binary (bool): If true, write a binary weights file, which is much faster to load.
     """
     if file_path is None:
         scene_name = pm.sceneName()
@@ -658,16 +676,17 @@ def save_skin_weights_for_selected(file_path=None):
         LOG.warning("No skins were found to save")
         return
 
-    skins.save_skin_weights_to_file(file_path, *sel_skins)
+    skins.save_skin_weights_to_file(file_path, *sel_skins, binary=binary)
 
 
-def save_all_skin_weights(file_path=None):
+def save_all_skin_weights(file_path=None, binary=False):
     """
     Save skin weights for all skin clusters in the scene.
 
     Args:
         file_path (str): A full path to a .weights file to write. If None,
             will use the scene name.
+        binary (bool): If true, write a binary weights file, which is much faster to load.
     """
     if file_path is None:
         scene_name = pm.sceneName()
@@ -684,7 +703,7 @@ def save_all_skin_weights(file_path=None):
 
     LOG.info("Saving skin weights: %s", all_skins)
 
-    skins.save_skin_weights_to_file(file_path, *all_skins)
+    skins.save_skin_weights_to_file(file_path, *all_skins, binary=binary)
 
 
 def get_named_color(name: str) -> Optional[LinearColor]:
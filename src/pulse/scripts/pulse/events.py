@@ -1,15 +1,18 @@
 import logging
-from functools import partial
+from typing import Dict, List
 
 import maya.OpenMaya as api
 import maya.cmds as cmds
 import pymel.core as pm
 
 from .vendor import pymetanode as meta
-from .core import is_rig
+from .core.rigs import RIG_METACLASS
 
 LOG = logging.getLogger(__name__)
 
+# the attribute that identifies rig nodes
+RIG_CLASS_ATTR = meta.core.METACLASS_ATTR_PREFIX + RIG_METACLASS
+
 
 class Event(list):
     """
@@ -110,13 +113,20 @@ class RigLifecycleEvents(MayaCallbackEvents):
     A singular object responsible for dispatching
     Rig creation and deletion events.
 
+    Transforms that are added to the scene are collected and checked in a single
+    deferred batch, since their metadata does not exist yet when they are created.
+    Events can be suspended, e.g. while building a rig, in which case added nodes are
+    checked once all suspensions have been resumed, and rigs that were deleted while
+    suspended are dispatched on resume.
+
     Events:
         onRigCreated(node):
             Called when any rig is created. Passes
             the newly created rig node.
         onRigDeleted(node):
             Called when any rig is deleted. Passes
-            the rig node that is being deleted.
+            the rig node that is being deleted. When dispatched on resume,
+            the node will no longer exist.
     """
 
     # the shared events instance
@@ -132,6 +142,40 @@ class RigLifecycleEvents(MayaCallbackEvents):
         super(RigLifecycleEvents, self).__init__()
         self.onRigCreated = Event()
         self.onRigDeleted = Event()
+        # {hash: MObjectHandle} transforms that were added but have not been checked yet
+        self._pending_nodes: Dict[int, api.MObjectHandle] = {}
+        # rigs that were deleted while events were suspended
+        self._removed_rigs: List[pm.PyNode] = []
+        # whether a deferred flush of the pending nodes has been scheduled
+        self._is_flush_scheduled = False
+        # the number of times events have been suspended
+        self._suspend_count = 0
+
+    @property
+    def is_suspended(self) -> bool:
+        return self._suspend_count > 0
+
+    def suspend(self):
+        """
+        Suspend dispatching events until `resume` has been called once for each call to `suspend`.
+        Nodes added and rigs deleted while suspended are still collected, and dispatched when events are resumed.
+        """
+        self._suspend_count += 1
+
+    def resume(self):
+        """
+        Resume dispatching events, dispatching any rigs that were deleted while suspended,
+        and checking any nodes that were added.
+        """
+        self._suspend_count = max(self._suspend_count - 1, 0)
+        if self.is_suspended:
+            return
+        removed_rigs = self._removed_rigs
+        self._removed_rigs = []
+        for rig in removed_rigs:
+            self.onRigDeleted(rig)
+        if self._pending_nodes:
+            self._schedule_flush()
 
     # override
     def _add_maya_callbacks(self):
@@ -140,35 +184,75 @@ class RigLifecycleEvents(MayaCallbackEvents):
         remove_id = api.MDGMessage.addNodeRemovedCallback(self._on_node_removed, "transform")
         return add_id, remove_id
 
+    # override
+    def _unregister_maya_callbacks(self):
+        super(RigLifecycleEvents, self)._unregister_maya_callbacks()
+        self._pending_nodes = {}
+        self._removed_rigs = []
+
     def _on_node_added(self, node, *args):
         """
         Args:
             node: A MObject node that was just added
         """
-        # no way to know if it's a Rig yet, defer until later and check the node again
-        # TODO: do this more precisely, don't use deferred
-
-        mfn = api.MFnDependencyNode(node)
-        if mfn.typeName() != "transform":
+        # no way to know if it's a Rig yet, check the node later once its metadata exists
+        if node.apiType() != api.MFn.kTransform:
             # rig nodes must be transforms
             return
 
-        full_name = api.MFnDagNode(node).fullPathName()
-        cmds.evalDeferred(partial(self._on_node_added_deferred, full_name), evaluateNext=True)
+        handle = api.MObjectHandle(node)
+        self._pending_nodes[handle.hashCode()] = handle
+        if not self.is_suspended:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        if not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            cmds.evalDeferred(self._flush_pending_nodes, evaluateNext=True)
 
-    def _on_node_added_deferred(self, full_name, *args):
+    def _flush_pending_nodes(self, *args):
         """
-        Args:
-            full_name: A string full name of a node that was added
+        Check all nodes that were added since the last flush, and dispatch events for any new rigs.
         """
-        node = meta.get_m_object(full_name)
-        if node and is_rig(node):
-            self.onRigCreated(pm.PyNode(node))
+        self._is_flush_scheduled = False
+        if self.is_suspended:
+            return
+        handles = self._pending_nodes.values()
+        self._pending_nodes = {}
+        for handle in handles:
+            if handle.isValid() and _is_rig_node(handle.object()):
+                self.onRigCreated(pm.PyNode(handle.object()))
 
     def _on_node_removed(self, node, *args):
         """
         Args:
             node: A MObject node that is being removed
         """
-        if is_rig(node):
+        if self._pending_nodes.pop(api.MObjectHandle(node).hashCode(), None) is not None:
+            # the node was never checked, so its creation was never dispatched either
+            return
+        if not _is_rig_node(node):
+            return
+        if self.is_suspended:
+            self._removed_rigs.append(pm.PyNode(node))
+        else:
             self.onRigDeleted(pm.PyNode(node))
+
+
+def _is_rig_node(node: api.MObject) -> bool:
+    """
+    Return True if a node is a rig, by checking if it has the rig metaclass attribute.
+    """
+    return api.MFnDependencyNode(node).hasAttribute(RIG_CLASS_ATTR)
+
+
+class rig_events_suspended(object):
+    """
+    Context manager that suspends the shared rig lifecycle events for the duration of a block.
+    """
+
+    def __enter__(self):
+        RigLifecycleEvents.get_shared().suspend()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        RigLifecycleEvents.get_shared().resume()
@@ -0,0 +1,538 @@
+"""
+Compiles math expressions into optimized networks of utility nodes.
+
+Expressions use python syntax, where names refer to values or nodes in a namespace, or nodes in the scene.
+
+Examples:
+    compile_expression("clamp(a.tx * 2 + b.ty, 0, 1)", {"a": node_a, "b": node_b})
+    compile_expression("lerp(ctl.tx, ctl.ty, blend) if ctl.tz > 0 else 0", {"ctl": ctl, "blend": 0.25})
+
+Supported operations are `+`, `-`, `*`, `/`, `**`, conditional expressions that compare two values,
+and the functions in `FUNCTIONS`. Before creating any nodes, expressions are optimized by folding constants,
+merging chains of additions and subtractions, and reusing identical sub-expressions. Scalar multiplications,
+divisions, and powers that are independent of each other share the X, Y, and Z lanes of one `multiplyDivide`
+node, and other scalar operations use `floatMath` nodes when the lookdevKit plugin is available.
+"""
+
+import ast
+import logging
+import math
+from typing import Dict, List, Optional
+
+import pymel.core as pm
+
+from . import nodes
+from . import util_nodes
+from .util_nodes import ConditionOperation, FloatMathOperation, MultiplyDivideOperation
+
+LOG = logging.getLogger(__name__)
+
+# the supported functions and their number of arguments, or None if they accept two or more
+FUNCTIONS = {
+    "clamp": 3,
+    "lerp": 3,
+    "max": None,
+    "min": None,
+    "pow": 2,
+    "sqrt": 1,
+}
+
+_BINARY_OPERATIONS = {
+    ast.Mult: "mul",
+    ast.Div: "div",
+    ast.Pow: "pow",
+}
+
+_COMPARE_OPERATIONS = {
+    ast.Eq: ConditionOperation.EQUAL,
+    ast.NotEq: ConditionOperation.NOT_EQUAL,
+    ast.Gt: ConditionOperation.GREATER_THAN,
+    ast.GtE: ConditionOperation.GREATER_OR_EQUAL,
+    ast.Lt: ConditionOperation.LESS_THAN,
+    ast.LtE: ConditionOperation.LESS_OR_EQUAL,
+}
+
+_COMPARE_FUNCS = {
+    ConditionOperation.EQUAL: lambda a, b: a == b,
+    ConditionOperation.NOT_EQUAL: lambda a, b: a != b,
+    ConditionOperation.GREATER_THAN: lambda a, b: a > b,
+    ConditionOperation.GREATER_OR_EQUAL: lambda a, b: a >= b,
+    ConditionOperation.LESS_THAN: lambda a, b: a < b,
+    ConditionOperation.LESS_OR_EQUAL: lambda a, b: a <= b,
+}
+
+# operations that can share the lanes of one multiplyDivide node
+_MULTIPLY_DIVIDE_OPERATIONS = {
+    "mul": MultiplyDivideOperation.MULTIPLY,
+    "div": MultiplyDivideOperation.DIVIDE,
+    "pow": MultiplyDivideOperation.POWER,
+}
+
+_FLOAT_MATH_OPERATIONS = {
+    "mul": FloatMathOperation.MULTIPLY,
+    "div": FloatMathOperation.DIVIDE,
+    "pow": FloatMathOperation.POWER,
+    "min": FloatMathOperation.MIN,
+    "max": FloatMathOperation.MAX,
+}
+
+_LANES = "XYZ"
+
+
+class ExpressionError(ValueError):
+    """
+    Raised when an expression cannot be parsed or compiled.
+    """
+
+    pass
+
+
+class ExprNode(object):
+    """
+    Base class for a node of a parsed expression.
+    """
+
+    # the number of operations between this node and the inputs of the expression
+    depth = 0
+
+    def key(self) -> tuple:
+        """
+        Return a hashable key that is equal for identical expressions.
+        """
+        raise NotImplementedError
+
+    def get_dimension(self) -> int:
+        """
+        Return the dimension of the value of this node, e.g. 3 for a vector.
+        """
+        return 1
+
+    def is_constant(self) -> bool:
+        return False
+
+
+class Constant(ExprNode):
+    """
+    A constant number.
+    """
+
+    def __init__(self, value: float):
+        self.value = float(value)
+
+    def __repr__(self):
+        return f"Constant({self.value})"
+
+    def key(self) -> tuple:
+        return "const", self.value
+
+    def is_constant(self) -> bool:
+        return True
+
+
+class Input(ExprNode):
+    """
+    An attribute used as an input of the expression.
+    """
+
+    def __init__(self, attr: pm.Attribute):
+        self.attr = attr
+
+    def __repr__(self):
+        return f"Input({self.attr})"
+
+    def key(self) -> tuple:
+        return "input", self.attr.name(fullAttrPath=True, fullDagPath=True)
+
+    def get_dimension(self) -> int:
+        return nodes.get_attr_dimension(self.attr)
+
+
+class Operation(ExprNode):
+    """
+    An operation on one or more other nodes.
+
+    The `param` of 'sum' operations is a tuple of 1 or -1 signs for each arg,
+    and the `param` of 'cond' operations is the ConditionOperation comparing the first two args.
+    """
+
+    def __init__(self, op: str, args: List[ExprNode], param=None):
+        self.op = op
+        self.args = args
+        self.param = param
+        self.depth = 1 + max(arg.depth for arg in args)
+
+    def __repr__(self):
+        return f"Operation({self.op!r}, {self.args!r}, {self.param!r})"
+
+    def key(self) -> tuple:
+        return ("op", self.op, self.param) + tuple(arg.key() for arg in self.args)
+
+    def get_dimension(self) -> int:
+        args = self.args[2:] if self.op == "cond" else self.args
+        return max(arg.get_dimension() for arg in args)
+
+
+class _ExpressionParser(object):
+    """
+    Converts a python AST into expression nodes.
+    """
+
+    def __init__(self, namespace: Dict[str, object]):
+        self.namespace = namespace
+
+    def parse(self, node: ast.AST) -> ExprNode:
+        if isinstance(node, ast.Expression):
+            return self.parse(node.body)
+        number = _get_number(node)
+        if number is not None:
+            return Constant(number)
+        if isinstance(node, (ast.Name, ast.Attribute)):
+            return self._to_expr_node(self._resolve(node), node)
+        if isinstance(node, ast.BinOp):
+            left, right = self.parse(node.left), self.parse(node.right)
+            if isinstance(node.op, ast.Add):
+                return Operation("sum", [left, right], (1, 1))
+            if isinstance(node.op, ast.Sub):
+                return Operation("sum", [left, right], (1, -1))
+            op = _BINARY_OPERATIONS.get(type(node.op))
+            if op:
+                return Operation(op, [left, right])
+        if isinstance(node, ast.UnaryOp):
+            if isinstance(node.op, ast.USub):
+                return Operation("sum", [self.parse(node.operand)], (-1,))
+            if isinstance(node.op, ast.UAdd):
+                return self.parse(node.operand)
+        if isinstance(node, ast.IfExp):
+            return self._parse_condition(node)
+        if isinstance(node, ast.Call):
+            return self._parse_call(node)
+        raise ExpressionError(f"Unsupported syntax: {_get_source(node)}")
+
+    def _parse_condition(self, node: ast.IfExp) -> ExprNode:
+        test = node.test
+        if not isinstance(test, ast.Compare) or len(test.ops) != 1:
+            raise ExpressionError(f"Conditions must compare two values: {_get_source(test)}")
+        compare_op = _COMPARE_OPERATIONS.get(type(test.ops[0]))
+        if compare_op is None:
+            raise ExpressionError(f"Unsupported comparison: {_get_source(test)}")
+        args = [self.parse(test.left), self.parse(test.comparators[0]), self.parse(node.body), self.parse(node.orelse)]
+        return Operation("cond", args, compare_op)
+
+    def _parse_call(self, node: ast.Call) -> ExprNode:
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            raise ExpressionError(f"Unsupported function: {_get_source(node.func)}")
+        if node.keywords:
+            raise ExpressionError(f"Keyword arguments are not supported: {_get_source(node)}")
+        name = node.func.id
+        num_args = FUNCTIONS[name]
+        if (num_args is None and len(node.args) < 2) or (num_args is not None and len(node.args) != num_args):
+            raise ExpressionError(f"Wrong number of arguments for {name}: {_get_source(node)}")
+        return Operation(name, [self.parse(arg) for arg in node.args])
+
+    def _resolve(self, node: ast.AST):
+        """
+        Return the object that a name or attribute access refers to.
+        """
+        if isinstance(node, ast.Name):
+            if node.id in self.namespace:
+                return self.namespace[node.id]
+            try:
+                return pm.PyNode(node.id)
+            except pm.MayaNodeError:
+                raise ExpressionError(f"Unknown name: {node.id}")
+        if isinstance(node, ast.Attribute):
+            obj = self._resolve(node.value)
+            if not isinstance(obj, (pm.PyNode, pm.Attribute)):
+                raise ExpressionError(f"Cannot get attribute of a value: {_get_source(node)}")
+            try:
+                return obj.attr(node.attr)
+            except (pm.MayaAttributeError, AttributeError):
+                raise ExpressionError(f"Attribute not found: {_get_source(node)}")
+        raise ExpressionError(f"Unsupported syntax: {_get_source(node)}")
+
+    def _to_expr_node(self, value, node: ast.AST) -> ExprNode:
+        if isinstance(value, ExprNode):
+            return value
+        if isinstance(value, pm.Attribute):
+            return Input(value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return Constant(value)
+        raise ExpressionError(f"Names must refer to numbers or attributes: {_get_source(node)}")
+
+
+def _get_number(node: ast.AST) -> Optional[float]:
+    if isinstance(node, ast.Constant):
+        value = node.value
+    elif hasattr(ast, "Num") and isinstance(node, ast.Num):
+        value = node.n
+    else:
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _get_source(node: ast.AST) -> str:
+    try:
+        return ast.unparse(node)
+    except AttributeError:
+        # ast.unparse requires python 3.9
+        return ast.dump(node)
+
+
+def parse_expression(expression: str, namespace: Dict[str, object] = None) -> ExprNode:
+    """
+    Parse an expression into a tree of expression nodes, without optimizing it.
+
+    Args:
+        expression: The expression to parse, e.g. "a.tx * 2 + 1".
+        namespace: A dict of names used in the expression, mapped to PyNodes, Attributes, numbers, or ExprNodes.
+            Names that are not in the namespace are resolved as nodes in the scene.
+
+    Raises:
+        ExpressionError: If the expression is invalid or uses unsupported syntax.
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"Invalid expression '{expression}': {e}")
+    return _ExpressionParser(namespace or {}).parse(tree)
+
+
+def _evaluate(op: str, values: List[float], param=None) -> float:
+    """
+    Return the result of an operation on constant values.
+    """
+    if op == "sum":
+        return sum(sign * value for sign, value in zip(param, values))
+    elif op == "mul":
+        return values[0] * values[1]
+    elif op == "div":
+        return values[0] / values[1]
+    elif op == "pow":
+        return values[0] ** values[1]
+    elif op == "sqrt":
+        return math.sqrt(values[0])
+    elif op == "min":
+        return min(values)
+    elif op == "max":
+        return max(values)
+    elif op == "clamp":
+        return sorted(values)[1] if values[1] <= values[2] else values[1]
+    elif op == "lerp":
+        return values[0] + (values[1] - values[0]) * values[2]
+    elif op == "cond":
+        return values[2] if _COMPARE_FUNCS[param](values[0], values[1]) else values[3]
+    raise ExpressionError(f"Unknown operation: {op}")
+
+
+def _optimize_sum(args: List[ExprNode], signs: tuple) -> ExprNode:
+    """
+    Flatten nested sums into a single sum with at most one constant, combining identical terms.
+    """
+    # {term key: [term, number of times it is added]}
+    counts: Dict[tuple, list] = {}
+    constant = 0.0
+    for arg, sign in zip(args, signs):
+        if isinstance(arg, Operation) and arg.op == "sum":
+            sub_terms = zip(arg.args, arg.param)
+        else:
+            sub_terms = [(arg, 1)]
+        for term, term_sign in sub_terms:
+            if term.is_constant():
+                constant += sign * term_sign * term.value
+            else:
+                counts.setdefault(term.key(), [term, 0])[1] += sign * term_sign
+
+    terms = []
+    for term, count in counts.values():
+        if abs(count) > 1:
+            term = Operation("mul", [term, Constant(abs(count))])
+        if count:
+            terms.append((term, 1 if count > 0 else -1))
+    if constant:
+        terms.append((Constant(abs(constant)), 1 if constant > 0 else -1))
+    if not terms:
+        return Constant(0.0)
+    if len(terms) == 1:
+        term, sign = terms[0]
+        return term if sign > 0 else Operation("mul", [term, Constant(-1.0)])
+    # put added terms first, so that they can be subtracted from
+    terms.sort(key=lambda term_and_sign: -term_and_sign[1])
+    return Operation("sum", [term for term, _ in terms], tuple(sign for _, sign in terms))
+
+
+def optimize_expression(node: ExprNode) -> ExprNode:
+    """
+    Return an optimized copy of an expression, folding constants and merging chained additions and subtractions.
+
+    Raises:
+        ExpressionError: If evaluating a constant part of the expression fails, e.g. when dividing by zero.
+    """
+    if not isinstance(node, Operation):
+        return node
+    args = [optimize_expression(arg) for arg in node.args]
+    op = node.op
+
+    if op == "sum":
+        return _optimize_sum(args, node.param)
+
+    if all(arg.is_constant() for arg in args):
+        try:
+            value = _evaluate(op, [arg.value for arg in args], node.param)
+        except (ZeroDivisionError, ValueError, OverflowError) as e:
+            raise ExpressionError(f"Failed to evaluate {op} of constants {[arg.value for arg in args]}: {e}")
+        if isinstance(value, complex):
+            raise ExpressionError(f"{op} of constants {[arg.value for arg in args]} is not a real number")
+        return Constant(value)
+
+    if op == "mul":
+        for arg, other in ((args[0], args[1]), (args[1], args[0])):
+            if arg.is_constant() and arg.value == 1:
+                return other
+    elif op in ("div", "pow"):
+        if args[1].is_constant() and args[1].value == 1:
+            return args[0]
+    elif op in ("min", "max"):
+        # combine all constants into one
+        constants = [arg.value for arg in args if arg.is_constant()]
+        if len(constants) > 1:
+            args = [arg for arg in args if not arg.is_constant()]
+            args.append(Constant(min(constants) if op == "min" else max(constants)))
+    elif op == "cond":
+        if args[0].is_constant() and args[1].is_constant():
+            return args[2] if _COMPARE_FUNCS[node.param](args[0].value, args[1].value) else args[3]
+    elif op == "lerp":
+        if args[2].is_constant() and args[2].value in (0, 1):
+            return args[0] if args[2].value == 0 else args[1]
+
+    return Operation(op, args, node.param)
+
+
+class _ExpressionEmitter(object):
+    """
+    Creates the utility nodes for an optimized expression.
+    """
+
+    def __init__(self):
+        # {expression key: the attribute or value of the expression}
+        self._results = {}
+        util_nodes.load_lookdev_kit_plugin()
+        self.use_float_math = util_nodes.IS_LOOKDEV_KIT_PLUGIN_LOADED
+
+    def emit(self, root: ExprNode):
+        self._emit_shared_multiply_divides(root)
+        return self._emit(root)
+
+    def _emit_shared_multiply_divides(self, root: ExprNode):
+        """
+        Create multiplyDivide nodes for groups of independent scalar operations, using one lane for each.
+        Operations at the same depth never depend on each other, so they can be grouped by depth.
+        """
+        groups: Dict[tuple, List[Operation]] = {}
+        visited = set()
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, Operation) or node.key() in visited:
+                continue
+            visited.add(node.key())
+            stack.extend(node.args)
+            if node.op in _MULTIPLY_DIVIDE_OPERATIONS and node.get_dimension() == 1:
+                groups.setdefault((node.depth, node.op), []).append(node)
+
+        for (_, op), group in sorted(groups.items(), key=lambda item: item[0][0]):
+            for start in range(0, len(group), len(_LANES)):
+                lane_ops = group[start : start + len(_LANES)]
+                if len(lane_ops) < 2:
+                    # not worth sharing, emitted as a single operation
+                    continue
+                mult = util_nodes.create_utility_node("multiplyDivide", operation=_MULTIPLY_DIVIDE_OPERATIONS[op])
+                for lane, lane_op in zip(_LANES, lane_ops):
+                    util_nodes.set_or_connect_attr(mult.attr(f"input1{lane}"), self._emit(lane_op.args[0]))
+                    util_nodes.set_or_connect_attr(mult.attr(f"input2{lane}"), self._emit(lane_op.args[1]))
+                    self._results[lane_op.key()] = mult.attr(f"output{lane}")
+
+    def _emit(self, node: ExprNode):
+        key = node.key()
+        if key in self._results:
+            return self._results[key]
+        if isinstance(node, Constant):
+            result = node.value
+        elif isinstance(node, Input):
+            result = node.attr
+        else:
+            args = [self._emit(arg) for arg in node.args]
+            is_scalar = node.get_dimension() == 1
+            result = self._emit_operation(node, args, is_scalar)
+        self._results[key] = result
+        return result
+
+    def _emit_operation(self, node: Operation, args: list, is_scalar: bool):
+        op = node.op
+        use_float_math = self.use_float_math and is_scalar
+        if op == "sum":
+            return self._emit_sum(args, node.param, use_float_math)
+        elif op in ("mul", "div", "pow"):
+            if use_float_math:
+                return util_nodes.float_math(args[0], args[1], _FLOAT_MATH_OPERATIONS[op])
+            return util_nodes.multiply_divide(args[0], args[1], _MULTIPLY_DIVIDE_OPERATIONS[op])
+        elif op in ("min", "max"):
+            result = args[0]
+            for arg in args[1:]:
+                if use_float_math:
+                    result = util_nodes.float_math(result, arg, _FLOAT_MATH_OPERATIONS[op])
+                elif op == "min":
+                    result = util_nodes.less_than(result, arg, result, arg)
+                else:
+                    result = util_nodes.greater_than(result, arg, result, arg)
+            return result
+        elif op == "sqrt":
+            if use_float_math:
+                return util_nodes.float_math(args[0], 0.5, FloatMathOperation.POWER)
+            return util_nodes.sqrt(args[0])
+        elif op == "clamp":
+            return util_nodes.clamp(*args)
+        elif op == "lerp":
+            # blendColors returns color1 when the blender is 1
+            return util_nodes.blend2(args[1], args[0], args[2])
+        elif op == "cond":
+            return util_nodes.condition(*args, node.param)
+        raise ExpressionError(f"Unknown operation: {op}")
+
+    def _emit_sum(self, args: list, signs: tuple, use_float_math: bool):
+        added = [arg for arg, sign in zip(args, signs) if sign > 0]
+        subtracted = [arg for arg, sign in zip(args, signs) if sign < 0]
+        if use_float_math and len(args) == 2 and added:
+            operation = FloatMathOperation.ADD if len(added) == 2 else FloatMathOperation.SUBTRACT
+            return util_nodes.float_math(added[0], (added[1:] or subtracted)[0], operation)
+        if not subtracted:
+            return util_nodes.add(*added)
+        if not added:
+            first = 0.0
+        elif len(added) == 1:
+            first = added[0]
+        else:
+            first = util_nodes.add(*added)
+        return util_nodes.subtract(first, *subtracted)
+
+
+def compile_expression(expression: str, namespace: Dict[str, object] = None, optimize=True):
+    """
+    Create a network of utility nodes that calculates an expression.
+
+    Args:
+        expression: The expression to compile, e.g. "clamp(a.tx * 2 + b.ty, 0, 1)".
+        namespace: A dict of names used in the expression, see `parse_expression`.
+        optimize: If true, optimize the expression before creating nodes.
+
+    Returns:
+        The output attribute of the expression, or a float if the expression is constant.
+
+    Raises:
+        ExpressionError: If the expression is invalid or uses unsupported syntax.
+    """
+    root = parse_expression(expression, namespace)
+    if optimize:
+        root = optimize_expression(root)
+    return _ExpressionEmitter().emit(root)
@@ -1,9 +1,11 @@
 import logging
 
+import maya.api.OpenMaya as om2
 import pymel.core as pm
 
 from . import math
 from . import nodes
+from . import traversal
 
 logger = logging.getLogger(__name__)
 
@@ -48,14 +50,7 @@ def get_child_joints(jnt):
     Args:
         jnt (PyNode): A joint node
     """
-    result = []
-    children = jnt.getChildren()
-    for child in children:
-        if isinstance(child, pm.nt.Joint):
-            result.append(child)
-        else:
-            result.extend(get_child_joints(child))
-    return result
+    return traversal.to_py_nodes(traversal.get_first_descendants(jnt, [om2.MFn.kJoint]))
 
 
 def get_end_joints(jnt):
@@ -65,14 +60,7 @@ def get_end_joints(jnt):
     Args:
         jnt (PyNode): A joint node
     """
-    result = []
-    children = jnt.listRelatives(children=True, typ="joint")
-    if not children:
-        result.append(jnt)
-    else:
-        for child in children:
-            result.extend(get_end_joints(child))
-    return result
+    return traversal.to_py_nodes(traversal.get_leaf_descendants(jnt, om2.MFn.kJoint))
 
 
 def set_joint_parent(child, parent):
@@ -0,0 +1,188 @@
+"""
+A KD-tree for finding the nearest neighbors of many points at once, implemented with numpy.
+
+Uses scipy's cKDTree when it is available, see `create_kd_tree`.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+
+class KDTree(object):
+    """
+    A balanced KD-tree over a set of points, where queries are vectorized across all query points.
+
+    The tree is stored implicitly: node `i` has children `2i` and `2i + 1`, the root is node 1,
+    and every leaf is a contiguous range of the sorted points. Queries first find the k nearest
+    points within each query's own leaf, then visit every other leaf whose bounds are closer
+    than that distance, so results are exact.
+    """
+
+    def __init__(self, points, leaf_size=16):
+        """
+        Args:
+            points: A (num_points, num_dimensions) array of points.
+            leaf_size: The target number of points in each leaf.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        self.points = points
+        num_points = len(points)
+
+        # the number of levels below the root, leaves are at this depth
+        self.depth = 0
+        while num_points // (2 ** (self.depth + 1)) >= leaf_size:
+            self.depth += 1
+        num_nodes = 2 ** (self.depth + 1)
+
+        self.split_axes = np.zeros(num_nodes, dtype=np.int64)
+        self.split_values = np.zeros(num_nodes, dtype=np.float64)
+        self.mins = np.zeros((num_nodes, points.shape[1]), dtype=np.float64)
+        self.maxs = np.zeros((num_nodes, points.shape[1]), dtype=np.float64)
+
+        # sort points level by level, so each node's points are contiguous and split at the median
+        order = np.arange(num_points)
+        for level in range(self.depth + 1):
+            num_level_nodes = 2**level
+            bounds = (np.arange(num_level_nodes + 1) * num_points) // num_level_nodes
+            node_ids = np.repeat(np.arange(num_level_nodes), np.diff(bounds))
+            sorted_points = points[order]
+            node_mins = np.minimum.reduceat(sorted_points, bounds[:-1], axis=0)
+            node_maxs = np.maximum.reduceat(sorted_points, bounds[:-1], axis=0)
+            self.mins[num_level_nodes : 2 * num_level_nodes] = node_mins
+            self.maxs[num_level_nodes : 2 * num_level_nodes] = node_maxs
+            if level == self.depth:
+                break
+
+            # split along the widest axis of each node
+            axes = np.argmax(node_maxs - node_mins, axis=1)
+            coords = sorted_points[np.arange(num_points), axes[node_ids]]
+            order = order[np.lexsort((coords, node_ids))]
+            mid = (bounds[:-1] + bounds[1:]) // 2
+            self.split_axes[num_level_nodes : 2 * num_level_nodes] = axes
+            self.split_values[num_level_nodes : 2 * num_level_nodes] = points[order[mid], axes]
+
+        self.indices = order
+        # padded (num_leaves, max_leaf_size) array of point indices, -1 for padding
+        num_leaves = 2**self.depth
+        bounds = (np.arange(num_leaves + 1) * num_points) // num_leaves
+        sizes = np.diff(bounds)
+        max_size = sizes.max() if num_leaves else 0
+        self.leaf_points = np.full((num_leaves, max_size), -1, dtype=np.int64)
+        leaf_ids = np.repeat(np.arange(num_leaves), sizes)
+        self.leaf_points[leaf_ids, np.arange(num_points) - bounds[leaf_ids]] = order
+
+    def query(self, query_points, k=1, chunk_size=4096):
+        """
+        Find the k nearest points of each query point.
+
+        Args:
+            query_points: A (num_queries, num_dimensions) array of points.
+            k: The number of neighbors to find, must not be more than the number of points.
+            chunk_size: The number of query points to process at once, to limit memory use.
+
+        Returns:
+            A tuple of (distances, indices), each (num_queries, k) arrays, sorted by distance.
+        """
+        query_points = np.asarray(query_points, dtype=np.float64)
+        k = min(k, len(self.points))
+        distances = np.empty((len(query_points), k), dtype=np.float64)
+        indices = np.empty((len(query_points), k), dtype=np.int64)
+        for start in range(0, len(query_points), chunk_size):
+            end = start + chunk_size
+            distances[start:end], indices[start:end] = self._query_chunk(query_points[start:end], k)
+        return distances, indices
+
+    def _get_leaf_nodes(self, query_points):
+        """
+        Return the node index of the leaf containing each query point.
+        """
+        nodes = np.ones(len(query_points), dtype=np.int64)
+        for _ in range(self.depth):
+            axes = self.split_axes[nodes]
+            go_right = query_points[np.arange(len(query_points)), axes] >= self.split_values[nodes]
+            nodes = nodes * 2 + go_right
+        return nodes
+
+    def _nearest_in_leaves(self, query_points, query_ids, leaf_nodes, k):
+        """
+        Return the k nearest points for each query, considering only the points in the given
+        (query, leaf) pairs. Queries may appear in multiple pairs.
+        """
+        num_queries = len(query_points)
+        leaf_points = self.leaf_points[leaf_nodes - 2**self.depth]
+        valid = leaf_points >= 0
+        diffs = self.points[np.maximum(leaf_points, 0)] - query_points[query_ids][:, None, :]
+        sq_dists = np.where(valid, np.einsum("ijk,ijk->ij", diffs, diffs), np.inf)
+
+        # gather the candidates of each query into a padded (num_queries, max_candidates) array
+        order = np.argsort(query_ids, kind="stable")
+        query_ids, sq_dists, leaf_points = query_ids[order], sq_dists[order], leaf_points[order]
+        counts = np.bincount(query_ids, minlength=num_queries)
+        starts = np.cumsum(counts) - counts
+        slot = np.arange(len(query_ids)) - starts[query_ids]
+        leaf_size = leaf_points.shape[1]
+        width = max(counts.max() * leaf_size, k)
+        cand_dists = np.full((num_queries, width), np.inf)
+        cand_points = np.zeros((num_queries, width), dtype=np.int64)
+        columns = slot[:, None] * leaf_size + np.arange(leaf_size)
+        cand_dists[query_ids[:, None], columns] = sq_dists
+        cand_points[query_ids[:, None], columns] = leaf_points
+
+        nearest = np.argpartition(cand_dists, k - 1, axis=1)[:, :k]
+        nearest_dists = np.take_along_axis(cand_dists, nearest, axis=1)
+        sort_order = np.argsort(nearest_dists, axis=1)
+        nearest = np.take_along_axis(nearest, sort_order, axis=1)
+        return np.take_along_axis(cand_dists, nearest, axis=1), np.take_along_axis(cand_points, nearest, axis=1)
+
+    def _query_chunk(self, query_points, k):
+        num_queries = len(query_points)
+        all_queries = np.arange(num_queries)
+
+        # find an upper bound on the k-th nearest distance from each query's own leaf
+        home_leaves = self._get_leaf_nodes(query_points)
+        sq_dists, _ = self._nearest_in_leaves(query_points, all_queries, home_leaves, k)
+        max_sq_dists = sq_dists[:, -1]
+
+        # visit all nodes closer than the bound, level by level
+        query_ids = all_queries
+        nodes = np.ones(num_queries, dtype=np.int64)
+        for level in range(self.depth + 1):
+            q = query_points[query_ids]
+            gaps = np.maximum(0.0, np.maximum(self.mins[nodes] - q, q - self.maxs[nodes]))
+            keep = np.einsum("ij,ij->i", gaps, gaps) <= max_sq_dists[query_ids]
+            query_ids, nodes = query_ids[keep], nodes[keep]
+            if level < self.depth:
+                query_ids = np.repeat(query_ids, 2)
+                nodes = np.stack([nodes * 2, nodes * 2 + 1], axis=1).ravel()
+
+        sq_dists, indices = self._nearest_in_leaves(query_points, query_ids, nodes, k)
+        return np.sqrt(sq_dists), indices
+
+
+def create_kd_tree(points):
+    """
+    Return a KD-tree for a set of points, using scipy's cKDTree if available, or KDTree otherwise.
+    Both provide `query(points, k)` which returns (distances, indices).
+    """
+    if cKDTree is not None:
+        return cKDTree(points)
+    return KDTree(points)
+
+
+def query_nearest(tree, query_points, k):
+    """
+    Return the (distances, indices) of the k nearest points as (num_queries, k) arrays for any tree
+    returned by `create_kd_tree`.
+    """
+    distances, indices = tree.query(query_points, k=k)
+    if k == 1 and distances.ndim == 1:
+        # cKDTree returns 1d arrays when k is 1
+        distances, indices = distances[:, None], indices[:, None]
+    return distances, indices
@@ -7,10 +7,13 @@ or connections between nodes, and are only updated when requested by the designe
 Link information is stored in the scene on each node using metadata.
 """
 
+import ast
 import logging
 import operator
-from typing import List
+from collections import deque
+from typing import Dict, List, Optional
 
+import maya.OpenMaya as api
 import pymel.core as pm
 
 from .vendor import pymetanode as meta
@@ -104,11 +107,14 @@ def set_link_meta_data(node, link_data):
     meta.set_metadata(node, class_name=LINK_METACLASS, data=link_data)
 
 
-def get_all_linked_nodes():
+def get_all_linked_nodes(as_handles=False):
     """
     Return all nodes in the scene that are linked
+
+    Args:
+        as_handles: Return NodeHandles instead of PyNodes
     """
-    return meta.find_meta_nodes(class_name=LINK_METACLASS)
+    return meta.find_meta_nodes(class_name=LINK_METACLASS, as_handles=as_handles)
 
 
 def cleanup_links():
@@ -121,6 +127,60 @@ def cleanup_links():
             unlink(node)
 
 
+def get_all_link_meta_data(link_nodes=None) -> Dict[pm.PyNode, dict]:
+    """
+    Return the link metadata of many nodes at once.
+
+    Args:
+        link_nodes: The nodes to get link data for, defaults to all linked nodes in the scene.
+
+    Returns:
+        A dict of {node: link_data}, for only the nodes that are linked, in the order given.
+    """
+    if link_nodes is None:
+        # find all linked nodes with a single query, and only create PyNodes for them once their data is read
+        m_objects = meta.find_meta_nodes(class_name=LINK_METACLASS, as_py_nodes=False)
+        link_nodes = [None] * len(m_objects)
+    else:
+        m_objects = [meta.get_m_object(node) for node in link_nodes]
+
+    # read the raw metadata of every node with one function set, and decode only the link data,
+    # since other metaclasses on the same nodes may reference many nodes that would all be looked up
+    result = {}
+    mfn_node = api.MFnDependencyNode()
+    for node, m_object in zip(link_nodes, m_objects):
+        if m_object is None or m_object.isNull():
+            continue
+        mfn_node.setObject(m_object)
+        try:
+            data_str = mfn_node.findPlug(meta.core.METADATA_ATTR).asString()
+        except RuntimeError:
+            continue
+        if not data_str:
+            continue
+        link_data = ast.literal_eval(data_str.replace("\r", "")).get(LINK_METACLASS)
+        if link_data:
+            ref_node = meta.get_reference_node(m_object)
+            result[node or pm.PyNode(m_object)] = meta.decode_metadata_value(link_data, ref_node)
+    return result
+
+
+def update_links(link_nodes=None) -> "LinkSolver":
+    """
+    Position many linked nodes at once, in dependency order. See `LinkSolver`.
+
+    Args:
+        link_nodes: The linked nodes to update, defaults to all linked nodes in the scene.
+
+    Returns:
+        The LinkSolver that was used, which contains the evaluation order and any cyclic nodes.
+    """
+    solver = LinkSolver(link_nodes)
+    solver.solve()
+    solver.apply()
+    return solver
+
+
 def apply_link_position(node, quiet=False):
     link_data = get_link_meta_data(node)
 
@@ -145,6 +205,23 @@ class LinkPositioner(object):
     def __init__(self):
         # if true, maintain the followers current offset when creating a link
         self.keepOffset = False
+        # the solver that is evaluating this positioner, which provides already solved matrices
+        self.solver: Optional[LinkSolver] = None
+
+    def get_world_matrix(self, node, negate_rotate_axis=True) -> pm.dt.TransformationMatrix:
+        """
+        Return the world matrix of a node, including any changes already solved by the current LinkSolver.
+        See `nodes.get_world_matrix`.
+        """
+        if self.solver:
+            return self.solver.get_world_matrix(node, negate_rotate_axis)
+        return nodes.get_world_matrix(node, negate_rotate_axis)
+
+    def get_dependencies(self, follower, link_data) -> List[pm.PyNode]:
+        """
+        Return the nodes whose world matrices are used to position a follower.
+        """
+        return self.get_target_nodes(link_data)
 
     def set_link_meta_data(self, node, link_data):
         """
@@ -233,7 +310,15 @@ class LinkPositioner(object):
         """
         Calculate the target matrix to use for applying a linked position to the follower node.
         """
-        return nodes.get_world_matrix(target_nodes[0])
+        return self.get_world_matrix(target_nodes[0])
+
+    def calculate_follower_matrix(self, follower, link_data) -> pm.dt.Matrix:
+        """
+        Calculate the new world matrix of a follower node, incorporating
+        the saved offsets from link_data if applicable.
+        """
+        target_mtx = self.calculate_target_matrix(follower, self.get_target_nodes(link_data), link_data)
+        return self.get_offset_matrix(link_data) * target_mtx
 
     def set_follower_matrix_with_offset(self, follower, target_mtx, link_data):
         """
@@ -242,7 +327,7 @@ class LinkPositioner(object):
         """
         offset_mtx = self.get_offset_matrix(link_data)
         new_mtx = offset_mtx * target_mtx
-        nodes.set_world_matrix(follower, new_mtx)
+        nodes.set_world_matrices([(follower, new_mtx)], chunk_name="Apply Link Position")
 
     def get_target_node(self, link_data):
         """
@@ -267,7 +352,7 @@ class DefaultLinkPositioner(LinkPositioner):
         """
         Calculate the target matrix to use for a linked node.
         """
-        return nodes.get_world_matrix(target_nodes[0])
+        return self.get_world_matrix(target_nodes[0])
 
 
 POSITIONER_CLASS_MAP[DefaultLinkPositioner.linkType] = DefaultLinkPositioner
@@ -296,18 +381,37 @@ class IKPoleLinkPositioner(LinkPositioner):
 
         self.set_link_meta_data(follower, link_data)
 
-    def calculate_target_matrix(self, follower, target_nodes, link_data):
-        leader = target_nodes[0]
-        pole_vector, mid_point = joints.get_ik_pole_vector_and_mid_point_for_joint(leader)
+    def get_dependencies(self, follower, link_data) -> List[pm.PyNode]:
+        # the pole vector depends on the leader's parent and grandparent joints
+        result = []
+        node = self.get_target_node(link_data)
+        while node is not None and len(result) < 3:
+            result.append(node)
+            node = node.getParent()
+        return result
 
+    def calculate_target_matrix(self, follower, target_nodes, link_data):
+        end_joint = target_nodes[0]
+        mid_joint = end_joint.getParent()
+        if not mid_joint:
+            raise ValueError("%s has no parent joint" % end_joint)
+        root_joint = mid_joint.getParent()
+        if not root_joint:
+            raise ValueError("%s has no parent joint" % mid_joint)
+        pole_vector, mid_point = joints.get_ik_pole_vector_and_mid_point(
+            self.get_world_matrix(root_joint).getTranslation("world"),
+            self.get_world_matrix(mid_joint).getTranslation("world"),
+            self.get_world_matrix(end_joint).getTranslation("world"),
+        )
+
+        target_mtx = self.get_world_matrix(follower, negate_rotate_axis=False)
         distance = link_data.get("ikpoleDistance")
         if not distance:
             # calculate distance based on followers current location
-            mid_to_follower_vector = follower.getTranslation(space="world") - mid_point
+            mid_to_follower_vector = target_mtx.getTranslation("world") - mid_point
             distance = pole_vector.dot(mid_to_follower_vector)
 
         new_translate = mid_point + pole_vector * distance
-        target_mtx = pm.dt.TransformationMatrix(follower.wm.get())
         target_mtx.setTranslation(new_translate, space="world")
         return target_mtx
 
@@ -351,7 +455,7 @@ class WeightedLinkPositioner(LinkPositioner):
         self.create_link(node, self.get_target_nodes(link_data))
 
     def calculate_target_matrix(self, follower, target_nodes, link_data):
-        mtxs = [n.wm.get() for n in target_nodes]
+        mtxs = [self.get_world_matrix(n) for n in target_nodes]
         weights = link_data.get("weights", [])
         total_weight = sum(weights)
 
@@ -367,9 +471,166 @@ class WeightedLinkPositioner(LinkPositioner):
             target_translate = math.lerp_vector(target_translate, translate, alpha)
 
         # currently only blending translate, the rest stays unmodified
-        target_mtx = pm.dt.TransformationMatrix(follower.wm.get())
+        target_mtx = self.get_world_matrix(follower, negate_rotate_axis=False)
         target_mtx.setTranslation(target_translate, space="world")
         return target_mtx
 
 
 POSITIONER_CLASS_MAP[WeightedLinkPositioner.linkType] = WeightedLinkPositioner
+
+
+class LinkSolver(object):
+    """
+    Positions many linked nodes at once.
+
+    Followers are evaluated after every leader they depend on, including leaders that move because
+    one of their parents is linked, so chains of links settle in a single evaluation. Matrices that
+    have been solved are reused by later positioners instead of being read back from the scene,
+    and all results are applied in one batch.
+
+    Attributes:
+        link_data: A dict of {node: link_data} for every linked node being solved.
+        order: The linked nodes in the order they are evaluated.
+        cyclic_nodes: Linked nodes that depend on each other in a cycle, and are not positioned.
+        matrices: A dict of {node: world matrix} with the solved result of every node in `order`.
+    """
+
+    def __init__(self, link_nodes=None):
+        """
+        Args:
+            link_nodes: The linked nodes to update, defaults to all linked nodes in the scene.
+        """
+        self.link_data: Dict[pm.PyNode, dict] = get_all_link_meta_data(link_nodes)
+        self.order: List[pm.PyNode] = []
+        self.cyclic_nodes: List[pm.PyNode] = []
+        self.matrices: Dict[pm.PyNode, pm.dt.Matrix] = {}
+        # solved matrices by long name, for finding solved ancestors
+        self._solved_paths: Dict[str, pm.PyNode] = {}
+        # world matrices read from the scene, by (node, negate_rotate_axis)
+        self._scene_matrices = {}
+        self._positioners: Dict[pm.PyNode, LinkPositioner] = {}
+
+    def _get_positioner(self, node) -> LinkPositioner:
+        positioner = self._positioners.get(node)
+        if positioner is None:
+            positioner = get_positioner(self.link_data[node].get("type", LinkType.DEFAULT))
+            positioner.solver = self
+            self._positioners[node] = positioner
+        return positioner
+
+    def _get_dependency_graph(self) -> Dict[pm.PyNode, List[pm.PyNode]]:
+        """
+        Return a dict of {follower: [leaders]}, where leaders are the linked nodes that
+        must be evaluated before the follower, either directly or because they are parents of its targets.
+        """
+        linked_paths = {node.longName(): node for node in self.link_data}
+        graph = {}
+        for follower, link_data in self.link_data.items():
+            leaders = []
+            dependencies = [follower] + self._get_positioner(follower).get_dependencies(follower, link_data)
+            for dependency in dependencies:
+                if dependency is None:
+                    continue
+                # the dependency and all its linked ancestors, a follower's own parents also affect its position
+                path_parts = dependency.longName().split("|")
+                for i in range(2, len(path_parts) + 1):
+                    leader = linked_paths.get("|".join(path_parts[:i]))
+                    if leader is not None and leader != follower and leader not in leaders:
+                        leaders.append(leader)
+            graph[follower] = leaders
+        return graph
+
+    def sort(self):
+        """
+        Sort the linked nodes so that leaders are evaluated before followers, and find any cycles.
+        """
+        graph = self._get_dependency_graph()
+        followers: Dict[pm.PyNode, List[pm.PyNode]] = {node: [] for node in graph}
+        num_leaders = {}
+        for follower, leaders in graph.items():
+            num_leaders[follower] = len(leaders)
+            for leader in leaders:
+                followers[leader].append(follower)
+
+        # Kahn's algorithm, keeping the original order where possible
+        ready = deque(node for node in graph if not num_leaders[node])
+        self.order = []
+        while ready:
+            node = ready.popleft()
+            self.order.append(node)
+            for follower in followers[node]:
+                num_leaders[follower] -= 1
+                if not num_leaders[follower]:
+                    ready.append(follower)
+
+        self.cyclic_nodes = [node for node in graph if num_leaders[node]]
+        if self.cyclic_nodes:
+            LOG.warning(
+                "Found cyclic links, these nodes will not be positioned: %s",
+                ", ".join(node.nodeName() for node in self.cyclic_nodes),
+            )
+
+    def get_world_matrix(self, node, negate_rotate_axis=True) -> pm.dt.TransformationMatrix:
+        """
+        Return the world matrix of a node, using the solved matrix of the node or its nearest solved ancestor.
+        """
+        if node in self.matrices:
+            return pm.dt.TransformationMatrix(self.matrices[node])
+
+        scene_mtx = self._get_scene_matrix(node, negate_rotate_axis)
+        if not self._solved_paths:
+            return scene_mtx
+
+        # move along with the nearest solved ancestor
+        path_parts = node.longName().split("|")
+        for i in range(len(path_parts) - 1, 1, -1):
+            ancestor = self._solved_paths.get("|".join(path_parts[:i]))
+            if ancestor is not None:
+                relative_mtx = scene_mtx.asMatrix() * self._get_scene_matrix(ancestor, False).asMatrixInverse()
+                return pm.dt.TransformationMatrix(relative_mtx * self.matrices[ancestor])
+        return scene_mtx
+
+    def _get_scene_matrix(self, node, negate_rotate_axis) -> pm.dt.TransformationMatrix:
+        key = (node, negate_rotate_axis)
+        mtx = self._scene_matrices.get(key)
+        if mtx is None:
+            mtx = nodes.get_world_matrix(node, negate_rotate_axis)
+            self._scene_matrices[key] = mtx
+        # positioners may modify the result
+        return pm.dt.TransformationMatrix(mtx)
+
+    def _read_scene_matrices(self):
+        """
+        Read the world matrices of all followers and their dependencies from the scene in one batch.
+        """
+        dependencies = []
+        for follower, link_data in self.link_data.items():
+            for node in self._get_positioner(follower).get_dependencies(follower, link_data):
+                if node is not None and node not in dependencies:
+                    dependencies.append(node)
+        followers = list(self.link_data.keys())
+        for negate_rotate_axis, nodes_to_read in ((True, dependencies), (False, followers)):
+            matrices = nodes.get_world_matrices(nodes_to_read, negate_rotate_axis)
+            for node, mtx in zip(nodes_to_read, matrices):
+                self._scene_matrices[(node, negate_rotate_axis)] = mtx
+
+    def solve(self):
+        """
+        Calculate the new world matrix of every linked node, without modifying the scene.
+        """
+        self.sort()
+        self.matrices = {}
+        self._solved_paths = {}
+        self._read_scene_matrices()
+        for node in self.order:
+            mtx = self._get_positioner(node).calculate_follower_matrix(node, self.link_data[node])
+            self.matrices[node] = pm.dt.Matrix(mtx)
+            self._solved_paths[node.longName()] = node
+
+    def apply(self):
+        """
+        Set the world matrices of all solved nodes as a single undoable operation.
+        """
+        items = [(node, self.matrices[node]) for node in self.order]
+        if items:
+            nodes.set_world_matrices(items, chunk_name="Update Links")
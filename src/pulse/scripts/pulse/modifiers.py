@@ -0,0 +1,79 @@
+"""
+Utils for making changes with the Maya API that can be undone as a single operation.
+
+Changes made directly with the API are not recorded in the undo queue. These utils
+pass the functions that apply and revert a change to the `pulseCommit` plugin command,
+which calls them when it is done, undone, and redone.
+"""
+
+import logging
+from typing import Callable, Optional, Tuple
+
+import maya.api.OpenMaya as om2
+from maya import cmds
+
+LOG = logging.getLogger(__name__)
+
+# the name of the plugin that provides the commit command
+PLUGIN_NAME = "pulse"
+
+# the (do_it, undo_it) functions of the change currently being committed
+_pending_commit: Optional[Tuple[Callable, Callable]] = None
+
+# whether the commit command is available, None if not checked yet
+_is_commit_cmd_available: Optional[bool] = None
+
+
+def is_commit_cmd_available() -> bool:
+    """
+    Return True if the `pulseCommit` command is available, loading the plugin if necessary.
+    """
+    global _is_commit_cmd_available
+    if _is_commit_cmd_available is None:
+        if not cmds.pluginInfo(PLUGIN_NAME, query=True, loaded=True):
+            try:
+                cmds.loadPlugin(PLUGIN_NAME, quiet=True)
+            except RuntimeError as e:
+                LOG.warning("Failed to load %s plugin, API changes will not be undoable: %s", PLUGIN_NAME, e)
+        _is_commit_cmd_available = hasattr(cmds, "pulseCommit")
+    return _is_commit_cmd_available
+
+
+def commit(do_it: Callable[[], None], undo_it: Callable[[], None]):
+    """
+    Apply a change and record it in the undo queue.
+
+    Args:
+        do_it: A function that applies the change, called immediately and again on redo.
+        undo_it: A function that reverts the change.
+    """
+    global _pending_commit
+    if not is_commit_cmd_available():
+        do_it()
+        return
+
+    _pending_commit = (do_it, undo_it)
+    try:
+        cmds.pulseCommit()
+    finally:
+        _pending_commit = None
+
+
+def commit_modifier(modifier: om2.MDGModifier):
+    """
+    Execute an MDGModifier or MDagModifier and record it in the undo queue.
+    """
+    commit(modifier.doIt, modifier.undoIt)
+
+
+def take_pending_commit() -> Tuple[Callable, Callable]:
+    """
+    Return the (do_it, undo_it) functions of the change being committed, and clear them.
+    Called by the `pulseCommit` command.
+    """
+    global _pending_commit
+    if _pending_commit is None:
+        raise RuntimeError("There is no pending change to commit, use pulse.modifiers.commit()")
+    result = _pending_commit
+    _pending_commit = None
+    return result
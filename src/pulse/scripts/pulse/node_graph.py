@@ -0,0 +1,437 @@
+"""
+A deferred node graph builder, for creating large networks of utility nodes as a single operation.
+
+Inside a `deferred_graph` block, `util_nodes` functions return DeferredNodes and DeferredAttrs instead of
+PyNodes and Attributes. They record every node creation, attribute value, and connection, and the whole
+network is created with one MDGModifier when the block exits. The deferred objects can then be converted
+to real nodes and attributes using `py_node`, `py_attr`, or `resolve`.
+
+Examples:
+    with node_graph.deferred_graph():
+        total = util_nodes.add(node.tx, node.ty)
+        scaled = util_nodes.multiply(total, 2)
+    scaled = scaled.py_attr()
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+import maya.api.OpenMaya as om2
+import pymel.core as pm
+
+from . import modifiers
+
+LOG = logging.getLogger(__name__)
+
+# the graph that util nodes are currently being recorded into, see `deferred_graph`
+_active_graph: Optional["NodeGraph"] = None
+
+# numeric types that are set as ints or bools
+_INT_NUMERIC_TYPES = (
+    om2.MFnNumericData.kByte,
+    om2.MFnNumericData.kChar,
+    om2.MFnNumericData.kShort,
+    om2.MFnNumericData.kInt,
+    om2.MFnNumericData.kInt64,
+    om2.MFnNumericData.kAddr,
+)
+
+
+def get_active_graph() -> Optional["NodeGraph"]:
+    """
+    Return the NodeGraph that nodes are currently being recorded into, if any.
+    """
+    return _active_graph
+
+
+def is_deferred(value) -> bool:
+    """
+    Return True if a value is a DeferredNode or DeferredAttr.
+    """
+    return isinstance(value, (DeferredNode, DeferredAttr))
+
+
+def resolve(value):
+    """
+    Return the real node or attribute for a deferred node or attribute, once its graph has been committed.
+    Lists, tuples, and dicts are resolved recursively, and all other values are returned unchanged.
+    """
+    if isinstance(value, DeferredNode):
+        return value.py_node()
+    elif isinstance(value, DeferredAttr):
+        return value.py_attr()
+    elif isinstance(value, (list, tuple)):
+        return type(value)(resolve(v) for v in value)
+    elif isinstance(value, dict):
+        return {k: resolve(v) for k, v in value.items()}
+    return value
+
+
+def _get_plug(attr) -> om2.MPlug:
+    """
+    Return the MPlug of a DeferredAttr or Attribute.
+    """
+    if isinstance(attr, DeferredAttr):
+        return attr.get_plug()
+    sel = om2.MSelectionList()
+    sel.add(str(attr))
+    plug = sel.getPlug(0)
+    if plug.isArray:
+        # connect the first element like connectAttr does, e.g. for worldMatrix
+        plug = plug.elementByLogicalIndex(0)
+    return plug
+
+
+def _find_attribute(node_class: om2.MNodeClass, name: str) -> Optional[om2.MObject]:
+    try:
+        attribute = node_class.attribute(name)
+    except (RuntimeError, TypeError):
+        return None
+    if attribute.isNull():
+        return None
+    return attribute
+
+
+class DeferredNode(object):
+    """
+    A node that will be created when its NodeGraph is committed.
+
+    Supports the subset of the PyNode interface used by `util_nodes`,
+    such as `attr`, `hasAttr`, `nodeType`, and accessing attributes by name.
+    """
+
+    def __init__(self, graph: "NodeGraph", node_type: str, index: int):
+        self.graph = graph
+        self.node_type = node_type
+        self.index = index
+        self.node_class = om2.MNodeClass(node_type)
+        # the created node, set when the graph is committed
+        self.m_object: Optional[om2.MObject] = None
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.attr(name)
+
+    def __str__(self):
+        return self.name()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}('{self.name()}')"
+
+    def name(self) -> str:
+        """
+        Return the name of the node, or a placeholder name if it has not been created yet.
+        """
+        if self.m_object is not None:
+            return om2.MFnDependencyNode(self.m_object).name()
+        return f"<{self.node_type}#{self.index}>"
+
+    def nodeType(self) -> str:
+        return self.node_type
+
+    def node(self) -> "DeferredNode":
+        return self
+
+    def hasAttr(self, name: str) -> bool:
+        return _find_attribute(self.node_class, name) is not None
+
+    def attr(self, name: str) -> "DeferredAttr":
+        """
+        Return an attribute of the node by long or short name, including children of compound attributes.
+        """
+        attribute = _find_attribute(self.node_class, name)
+        if attribute is None:
+            raise AttributeError(f"{self.node_type} has no attribute '{name}'")
+
+        # build the chain of parents, which must not be arrays since no index was given
+        chain = [attribute]
+        parent = om2.MFnAttribute(attribute).parent
+        while not parent.isNull():
+            chain.insert(0, parent)
+            parent = om2.MFnAttribute(parent).parent
+        result = None
+        for attribute in chain:
+            if result is not None and om2.MFnAttribute(result.attribute).array:
+                raise AttributeError(f"{self.node_type}.{name} requires an index for its parent attribute")
+            result = DeferredAttr(self, attribute, result)
+        return result
+
+    def py_node(self) -> pm.PyNode:
+        """
+        Return the PyNode of the created node.
+        """
+        if self.m_object is None:
+            raise RuntimeError(f"{self} has not been created yet, the graph must be committed first")
+        return pm.PyNode(om2.MFnDependencyNode(self.m_object).name())
+
+
+class DeferredAttr(object):
+    """
+    An attribute of a DeferredNode.
+
+    Supports the subset of the Attribute interface used by `util_nodes`, such as `isCompound`, `getChildren`,
+    `set`, and connecting with `>>`. Setting and connecting are recorded in the node's graph.
+    """
+
+    def __init__(self, node: DeferredNode, attribute: om2.MObject, parent: "DeferredAttr" = None, index=None):
+        """
+        Args:
+            node: The node of the attribute.
+            attribute: The attribute's MObject, from the node's MNodeClass.
+            parent: The compound attribute (or compound array element) that contains this attribute.
+            index: The logical index of this attribute if it is an element of an array attribute.
+        """
+        self._node = node
+        self.attribute = attribute
+        self.parent = parent
+        self.index = index
+        self._fn_attr = om2.MFnAttribute(attribute)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        for child in self.getChildren():
+            if name in (child.longName(), child.shortName()):
+                return child
+        raise AttributeError(f"{self} has no child attribute '{name}'")
+
+    def __getitem__(self, index: int) -> "DeferredAttr":
+        if not self._fn_attr.array or self.index is not None:
+            raise TypeError(f"{self} is not an array attribute")
+        return DeferredAttr(self._node, self.attribute, self.parent, index)
+
+    def __rshift__(self, other):
+        self._node.graph.connect_attr(self, other)
+
+    def __eq__(self, other):
+        if isinstance(other, DeferredAttr):
+            return self._node is other._node and self.path() == other.path()
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._node), self.path()))
+
+    def __str__(self):
+        return self.name()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}('{self.name()}')"
+
+    def path(self) -> str:
+        """
+        Return the path of the attribute relative to its node, e.g. 'input3D[0].input3Dx'.
+        """
+        result = self.longName()
+        if self.parent is not None:
+            result = f"{self.parent.path()}.{result}"
+        if self.index is not None:
+            result = f"{result}[{self.index}]"
+        return result
+
+    def name(self) -> str:
+        return f"{self._node.name()}.{self.path()}"
+
+    def node(self) -> DeferredNode:
+        return self._node
+
+    def longName(self) -> str:
+        return self._fn_attr.name
+
+    def shortName(self) -> str:
+        return self._fn_attr.shortName
+
+    def isCompound(self) -> bool:
+        return self.attribute.hasFn(om2.MFn.kCompoundAttribute)
+
+    def isChild(self) -> bool:
+        return self.parent is not None
+
+    def isArray(self) -> bool:
+        return self._fn_attr.array and self.index is None
+
+    def getParent(self) -> Optional["DeferredAttr"]:
+        return self.parent
+
+    def numChildren(self) -> int:
+        if not self.isCompound():
+            return 0
+        return om2.MFnCompoundAttribute(self.attribute).numChildren()
+
+    def getChildren(self) -> List["DeferredAttr"]:
+        if not self.isCompound():
+            return []
+        fn_compound = om2.MFnCompoundAttribute(self.attribute)
+        return [DeferredAttr(self._node, fn_compound.child(i), self) for i in range(fn_compound.numChildren())]
+
+    def set(self, value):
+        self._node.graph.set_attr(self, value)
+
+    def get(self):
+        return self.py_attr().get()
+
+    def get_plug(self) -> om2.MPlug:
+        """
+        Return the MPlug of the attribute on the created node.
+        """
+        if self._node.m_object is None:
+            raise RuntimeError(f"{self} has not been created yet, the graph must be committed first")
+        if self.parent is None:
+            plug = om2.MPlug(self._node.m_object, self.attribute)
+        else:
+            plug = self.parent.get_plug().child(self.attribute)
+        if self.index is not None:
+            plug = plug.elementByLogicalIndex(self.index)
+        return plug
+
+    def py_attr(self) -> pm.Attribute:
+        """
+        Return the Attribute on the created node.
+        """
+        return pm.Attribute(f"{self._node.py_node()}.{self.path()}")
+
+
+class NodeGraph(object):
+    """
+    Records the creation of nodes, attribute values, and connections,
+    and then creates them all at once as a single undoable operation.
+    """
+
+    def __init__(self):
+        self.nodes: List[DeferredNode] = []
+        # the operations to perform in order, either ('set', attr, value) or ('connect', src, dst)
+        self.operations: List[Tuple[str, object, object]] = []
+        self.is_committed = False
+
+    def create_node(self, node_type: str) -> DeferredNode:
+        """
+        Record the creation of a utility node and return it.
+        """
+        node = DeferredNode(self, node_type, len(self.nodes))
+        self.nodes.append(node)
+        return node
+
+    def set_attr(self, attr: DeferredAttr, value):
+        """
+        Record setting the value of an attribute.
+        """
+        self.operations.append(("set", attr, value))
+
+    def connect_attr(self, src, dst):
+        """
+        Record a connection between two attributes, either of which may be a DeferredAttr.
+        """
+        self.operations.append(("connect", src, dst))
+
+    def commit(self):
+        """
+        Create all recorded nodes, values, and connections using a single MDGModifier.
+        """
+        if self.is_committed:
+            raise RuntimeError("NodeGraph has already been committed")
+        modifier = om2.MDGModifier()
+        for node in self.nodes:
+            node.m_object = modifier.createNode(node.node_type)
+        for operation, a, b in self.operations:
+            if operation == "set":
+                _add_plug_value(modifier, a.get_plug(), b)
+            else:
+                modifier.connect(_get_plug(a), _get_plug(b))
+        self._add_to_utility_list(modifier)
+        modifiers.commit_modifier(modifier)
+        self.is_committed = True
+        LOG.debug("Created %d nodes with %d operations", len(self.nodes), len(self.operations))
+
+    def _add_to_utility_list(self, modifier: om2.MDGModifier):
+        """
+        Connect all nodes to the default render utility list, as `pm.shadingNode(asUtility=True)` does.
+        """
+        try:
+            utilities_plug = _get_plug("defaultRenderUtilityList1.utilities")
+        except RuntimeError:
+            return
+        indices = utilities_plug.getExistingArrayAttributeIndices()
+        next_index = max(indices) + 1 if indices else 0
+        for i, node in enumerate(self.nodes):
+            message_plug = om2.MFnDependencyNode(node.m_object).findPlug("message", False)
+            modifier.connect(message_plug, utilities_plug.elementByLogicalIndex(next_index + i))
+
+
+def _get_matrix_values(value) -> List[float]:
+    """
+    Return a flat list of 16 floats from a matrix or matrix-like value.
+    """
+    values = list(value)
+    if len(values) == 4:
+        values = [c for row in values for c in row]
+    return [float(v) for v in values]
+
+
+def _add_plug_value(modifier: om2.MDGModifier, plug: om2.MPlug, value):
+    """
+    Add setting the value of a plug to a modifier, using UI units for angles and distances like `Attribute.set`.
+    """
+    attribute = plug.attribute()
+    if plug.isCompound and isinstance(value, (list, tuple, pm.dt.Vector, pm.dt.Point, pm.dt.Color)):
+        if len(value) != plug.numChildren():
+            raise ValueError(f"Expected {plug.numChildren()} values for {plug.name()}, got: {value}")
+        for i, child_value in enumerate(value):
+            _add_plug_value(modifier, plug.child(i), child_value)
+    elif attribute.hasFn(om2.MFn.kMatrixAttribute) or (
+        attribute.hasFn(om2.MFn.kTypedAttribute) and om2.MFnTypedAttribute(attribute).attrType() == om2.MFnData.kMatrix
+    ):
+        data = om2.MFnMatrixData().create(om2.MMatrix(_get_matrix_values(value)))
+        modifier.newPlugValue(plug, data)
+    elif attribute.hasFn(om2.MFn.kNumericAttribute):
+        numeric_type = om2.MFnNumericAttribute(attribute).numericType()
+        if numeric_type == om2.MFnNumericData.kBoolean:
+            modifier.newPlugValueBool(plug, bool(value))
+        elif numeric_type in _INT_NUMERIC_TYPES:
+            modifier.newPlugValueInt(plug, int(value))
+        elif numeric_type == om2.MFnNumericData.kFloat:
+            modifier.newPlugValueFloat(plug, float(value))
+        else:
+            modifier.newPlugValueDouble(plug, float(value))
+    elif attribute.hasFn(om2.MFn.kEnumAttribute):
+        modifier.newPlugValueInt(plug, int(value))
+    elif attribute.hasFn(om2.MFn.kUnitAttribute):
+        unit_type = om2.MFnUnitAttribute(attribute).unitType()
+        if unit_type == om2.MFnUnitAttribute.kAngle:
+            modifier.newPlugValueMAngle(plug, om2.MAngle(float(value), om2.MAngle.uiUnit()))
+        elif unit_type == om2.MFnUnitAttribute.kDistance:
+            modifier.newPlugValueMDistance(plug, om2.MDistance(float(value), om2.MDistance.uiUnit()))
+        elif unit_type == om2.MFnUnitAttribute.kTime:
+            modifier.newPlugValueMTime(plug, om2.MTime(float(value), om2.MTime.uiUnit()))
+        else:
+            modifier.newPlugValueDouble(plug, float(value))
+    else:
+        raise TypeError(f"Setting {plug.name()} is not supported in a deferred graph: {value}")
+
+
+class deferred_graph(object):
+    """
+    Context manager that records all utility nodes created by `util_nodes` within the block,
+    and creates them as a single undoable operation when the block exits.
+
+    Nested blocks record into the outermost graph. If an exception is raised, nothing is created.
+    """
+
+    def __init__(self):
+        self.graph: Optional[NodeGraph] = None
+        self._is_owner = False
+
+    def __enter__(self) -> NodeGraph:
+        global _active_graph
+        if _active_graph is None:
+            _active_graph = NodeGraph()
+            self._is_owner = True
+        self.graph = _active_graph
+        return self.graph
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _active_graph
+        if not self._is_owner:
+            return
+        _active_graph = None
+        if exc_type is None:
+            self.graph.commit()
@@ -1,11 +1,20 @@
 import logging
+import math
 from enum import IntEnum
-from typing import Optional
+from typing import List, Optional, Tuple
 
+import maya.api.OpenMaya as om2
 import maya.cmds as cmds
 import pymel.core as pm
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from pulse.colors import LinearColor
+from pulse import modifiers
+from pulse import traversal
 
 LOG = logging.getLogger(__name__)
 
@@ -45,11 +54,7 @@ def get_all_parents(node, include_node=False):
     if isinstance(node, str):
         split = node.split("|")
         return ["|".join(split[:i]) for i in reversed(range(2, len(split)))]
-    parents = []
-    parent = node.getParent()
-    if parent is not None:
-        parents.append(parent)
-        parents.extend(get_all_parents(parent))
+    parents = traversal.to_py_nodes(traversal.get_ancestors(node))
     if include_node:
         parents.insert(0, node)
     return parents
@@ -63,13 +68,7 @@ def get_parent_nodes(nodes):
     Args:
         nodes: A list of nodes
     """
-    # TODO: optimize using long names and string matching
-    result = []
-    for n in nodes:
-        if any([p in nodes for p in get_all_parents(n)]):
-            continue
-        result.append(n)
-    return result
+    return traversal.get_top_nodes(nodes)
 
 
 def get_node_branch(root, end):
@@ -146,7 +145,15 @@ def get_descendants_top_to_bottom(node, **kwargs):
         node (PyNode): A dag node with children
         **kwargs: Kwargs given to the listRelatives command
     """
-    return reversed(node.listRelatives(ad=True, **kwargs))
+    node_types = kwargs.get("type", kwargs.get("typ"))
+    if isinstance(node_types, str):
+        node_types = [node_types]
+    other_kwargs = set(kwargs.keys()) - {"type", "typ"}
+    if other_kwargs or any(t not in traversal.NODE_TYPE_FN_TYPES for t in node_types or []):
+        # fall back to listRelatives for anything the traversal doesn't support
+        return list(reversed(node.listRelatives(ad=True, **kwargs)))
+    fn_types = traversal.get_fn_types(node_types)
+    return traversal.to_py_nodes(traversal.iter_descendants(node, fn_types))
 
 
 def get_transform_hierarchy(transform, include_parent=True):
@@ -758,6 +765,123 @@ def get_world_matrix(node, negate_rotate_axis=True):
         return pm.dt.TransformationMatrix()
 
 
+# the names of each rotate order, by rotateOrder attribute value
+ROTATE_ORDER_NAMES = ["XYZ", "YZX", "ZXY", "XZY", "YXZ", "ZYX"]
+
+
+def _get_world_transformations(nodes, negate_rotate_axis=True) -> List[Tuple[om2.MTransformationMatrix, int]]:
+    """
+    Return the world transformation of many nodes using one selection list and the API.
+
+    Returns:
+        A list of (MTransformationMatrix, rotate order) for each node, where the transformation
+        has its rotation in the node's rotate order, and rotate order is the rotateOrder attribute value.
+        Nodes that aren't transforms have an identity transformation, the same as `get_world_matrix`.
+
+    Raises:
+        ValueError: If a node does not exist, or its name matches more than one node.
+    """
+    # reuse one selection list, adding all nodes at once would merge duplicates
+    sel = om2.MSelectionList()
+    result = []
+    for node in nodes:
+        sel.clear()
+        try:
+            sel.add(str(node))
+        except RuntimeError:
+            raise ValueError(f"Node does not exist: {node}")
+        if sel.length() != 1:
+            raise ValueError(f"More than one node matches name: {node}")
+        try:
+            dag_path = sel.getDagPath(0)
+        except (TypeError, RuntimeError):
+            # not a dag node
+            dag_path = None
+        if dag_path is None or not dag_path.hasFn(om2.MFn.kTransform):
+            result.append((om2.MTransformationMatrix(), 0))
+            continue
+
+        fn = om2.MFnTransform(dag_path)
+        # MTransformationMatrix rotation orders start at 1 for XYZ
+        rotate_order = fn.rotationOrder()
+        world_mtx = dag_path.inclusiveMatrix()
+        transformation = om2.MTransformationMatrix(world_mtx)
+        if negate_rotate_axis:
+            # remove the rotate axis, leaving only the world orientation of the rotate values
+            rotate_axis_mtx = fn.rotateOrientation(om2.MSpace.kTransform).asMatrix()
+            rotate_mtx = rotate_axis_mtx.inverse() * transformation.asRotateMatrix()
+            transformation.reorderRotation(rotate_order)
+            transformation.setRotation(om2.MEulerRotation.decompose(rotate_mtx, rotate_order - 1))
+        else:
+            transformation.reorderRotation(rotate_order)
+        result.append((transformation, rotate_order - 1))
+    return result
+
+
+def _get_rotation_degrees(transformation: om2.MTransformationMatrix) -> List[float]:
+    euler = transformation.rotation()
+    return [math.degrees(euler.x), math.degrees(euler.y), math.degrees(euler.z)]
+
+
+def get_world_matrices(nodes, negate_rotate_axis=True, as_numpy=False):
+    """
+    Return the world matrices of many nodes at once. Equivalent to calling `get_world_matrix` for each node,
+    but reads every matrix from the API in one pass.
+
+    Args:
+        nodes: A list of PyNodes or string node names.
+        negate_rotate_axis: If true, remove the rotate axis from each matrix's rotation.
+        as_numpy: If true, return a (num_nodes, 4, 4) numpy array instead of a list of TransformationMatrix.
+    """
+    transformations = _get_world_transformations(nodes, negate_rotate_axis)
+    if as_numpy:
+        return np.array([list(t.asMatrix()) for t, _ in transformations], dtype=np.float64).reshape(-1, 4, 4)
+
+    result = []
+    for transformation, rotate_order in transformations:
+        wm = pm.dt.TransformationMatrix(pm.dt.Matrix(list(transformation.asMatrix())))
+        if negate_rotate_axis:
+            r = _get_rotation_degrees(transformation)
+            wm.setRotation(r, ROTATE_ORDER_NAMES[rotate_order])
+        result.append(wm)
+    return result
+
+
+def get_world_transforms(nodes, negate_rotate_axis=True, as_numpy=False):
+    """
+    Return the decomposed world translate, rotate, and scale of many nodes at once.
+    Rotations are in degrees, in the rotate order of each node.
+
+    Args:
+        nodes: A list of PyNodes or string node names.
+        negate_rotate_axis: If true, remove the rotate axis from each rotation.
+        as_numpy: If true, return numpy arrays instead of lists of PyMEL data types.
+
+    Returns:
+        A tuple of (translates, rotates, scales, rotate_orders). When `as_numpy` is true, these are
+        (num_nodes, 3) float arrays and a (num_nodes,) int array. Otherwise they are lists of
+        pm.dt.Vector, pm.dt.EulerRotation, pm.dt.Vector, and rotate order names, e.g. 'XYZ'.
+    """
+    transformations = _get_world_transformations(nodes, negate_rotate_axis)
+    translates = [list(t.translation(om2.MSpace.kWorld)) for t, _ in transformations]
+    rotates = [_get_rotation_degrees(t) for t, _ in transformations]
+    scales = [t.scale(om2.MSpace.kWorld) for t, _ in transformations]
+    rotate_orders = [rotate_order for _, rotate_order in transformations]
+    if as_numpy:
+        return (
+            np.array(translates, dtype=np.float64).reshape(-1, 3),
+            np.array(rotates, dtype=np.float64).reshape(-1, 3),
+            np.array(scales, dtype=np.float64).reshape(-1, 3),
+            np.array(rotate_orders, dtype=np.int64),
+        )
+    return (
+        [pm.dt.Vector(t) for t in translates],
+        [pm.dt.EulerRotation(r, ROTATE_ORDER_NAMES[o], unit="degrees") for r, o in zip(rotates, rotate_orders)],
+        [pm.dt.Vector(s) for s in scales],
+        [ROTATE_ORDER_NAMES[rotate_order] for rotate_order in rotate_orders],
+    )
+
+
 def set_world_matrix(node, matrix, translate=True, rotate=True, scale=True):
     """
     Set the world matrix of a node.
@@ -787,6 +911,164 @@ def set_world_matrix(node, matrix, translate=True, rotate=True, scale=True):
             cmds.xform(node.longName(), scale=local_scale_matrix.getScale("world"))
 
 
+def set_world_matrices(items, chunk_name="Set World Matrices"):
+    """
+    Set the world matrices of many nodes at once, as a single undoable operation.
+
+    Nodes are updated parent-first, regardless of the order they are given in, so that
+    each node reaches its target even when its parents are also being moved.
+    Transforms without pivots, rotate axis, or shear are updated using the API, computing
+    each parent's inverse matrix only once. All other nodes (e.g. joints) use `set_world_matrix`.
+
+    Args:
+        items: A list of (node, matrix) or (node, matrix, (translate, rotate, scale)) tuples,
+            where the optional components indicate which parts of the matrix to apply.
+        chunk_name: The name of the undo chunk.
+    """
+    entries = []
+    for item in items:
+        node, matrix = item[0], item[1]
+        components = tuple(item[2]) if len(item) > 2 else (True, True, True)
+        dag_path = _get_dag_path(node)
+        entries.append((dag_path.length(), node, dag_path, matrix, components))
+    # stable sort by depth, so parents are always updated before their children
+    entries.sort(key=lambda entry: entry[0])
+
+    cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+    try:
+        batch = _WorldMatrixBatch()
+        for _, node, dag_path, matrix, components in entries:
+            if _is_simple_transform(dag_path):
+                batch.add(dag_path, matrix, components)
+            else:
+                # apply the batch so far to preserve parent-first order
+                batch.apply()
+                if not isinstance(node, pm.PyNode):
+                    node = pm.PyNode(dag_path.fullPathName())
+                set_world_matrix(node, matrix, *components)
+        batch.apply()
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+def _get_dag_path(node) -> om2.MDagPath:
+    sel = om2.MSelectionList()
+    sel.add(node.longName() if isinstance(node, pm.PyNode) else str(node))
+    return sel.getDagPath(0)
+
+
+def _is_simple_transform(dag_path: om2.MDagPath) -> bool:
+    """
+    Return True if a node is a transform (not a joint) with no pivots, rotate axis, or shear,
+    that inherits its parent's transform, meaning its local matrix can be set directly from a decomposed matrix.
+    """
+    node = dag_path.node()
+    if not node.hasFn(om2.MFn.kTransform) or node.hasFn(om2.MFn.kJoint):
+        return False
+    fn = om2.MFnTransform(dag_path)
+    if not fn.findPlug("inheritsTransform", False).asBool():
+        return False
+    space = om2.MSpace.kTransform
+    return (
+        all(abs(value) < 1e-10 for value in fn.shear())
+        and fn.rotatePivot(space).isEquivalent(om2.MPoint.kOrigin)
+        and fn.scalePivot(space).isEquivalent(om2.MPoint.kOrigin)
+        and fn.rotatePivotTranslation(space).isEquivalent(om2.MVector.kZeroVector)
+        and fn.scalePivotTranslation(space).isEquivalent(om2.MVector.kZeroVector)
+        and fn.rotateOrientation(space).isEquivalent(om2.MQuaternion.kIdentity)
+    )
+
+
+class _WorldMatrixBatch(object):
+    """
+    A list of world matrices to apply to simple transforms using the API.
+    Items must be added parent-first.
+    """
+
+    def __init__(self):
+        # list of (MDagPath, MMatrix, (translate, rotate, scale))
+        self.items = []
+
+    def add(self, dag_path: om2.MDagPath, matrix, components):
+        if not isinstance(matrix, om2.MMatrix):
+            matrix = om2.MMatrix([c for r in matrix for c in r])
+        self.items.append((dag_path, matrix, components))
+
+    def apply(self):
+        """
+        Apply all items as a single undoable change, and clear the batch.
+        """
+        if not self.items:
+            return
+
+        items = self.items
+        self.items = []
+        # list of (MFnTransform, MTransformationMatrix) to restore on undo
+        old_transforms = []
+
+        def do_it():
+            old_transforms[:] = []
+            # {parent full path: parent inverse matrix}, parents are always updated before children are computed
+            parent_inverse_mtxs = {}
+            for dag_path, matrix, components in items:
+                fn = om2.MFnTransform(dag_path)
+                old_transforms.append((fn, fn.transformation()))
+                local_mtx = matrix * _get_parent_inverse_matrix(dag_path, parent_inverse_mtxs)
+                offset_mtx = _get_offset_parent_matrix(fn)
+                if offset_mtx is not None:
+                    local_mtx = local_mtx * offset_mtx.inverse()
+                _set_local_matrix(fn, local_mtx, *components)
+
+        def undo_it():
+            for fn, transformation in reversed(old_transforms):
+                fn.setTransformation(transformation)
+
+        modifiers.commit(do_it, undo_it)
+
+
+def _get_parent_inverse_matrix(dag_path: om2.MDagPath, cache: dict) -> om2.MMatrix:
+    parent_path = om2.MDagPath(dag_path)
+    parent_path.pop()
+    key = parent_path.fullPathName()
+    result = cache.get(key)
+    if result is None:
+        result = parent_path.inclusiveMatrixInverse() if parent_path.length() else om2.MMatrix()
+        cache[key] = result
+    return result
+
+
+def _get_offset_parent_matrix(fn: om2.MFnTransform) -> Optional[om2.MMatrix]:
+    """
+    Return the offsetParentMatrix of a transform, or None if it is identity or doesn't exist.
+    """
+    if not fn.hasAttribute("offsetParentMatrix"):
+        return None
+    plug = fn.findPlug("offsetParentMatrix", False)
+    matrix = om2.MFnMatrixData(plug.asMObject()).matrix()
+    if matrix.isEquivalent(om2.MMatrix.kIdentity):
+        return None
+    return matrix
+
+
+def _set_local_matrix(fn: om2.MFnTransform, local_mtx: om2.MMatrix, translate=True, rotate=True, scale=True):
+    """
+    Set the translate, rotate, and scale of a simple transform from a local matrix.
+    """
+    transformation = om2.MTransformationMatrix(local_mtx)
+    transformation.reorderRotation(fn.rotationOrder())
+    if translate and rotate and scale:
+        fn.setTransformation(transformation)
+        return
+
+    space = om2.MSpace.kTransform
+    if translate:
+        fn.setTranslation(transformation.translation(space), space)
+    if rotate:
+        fn.setRotation(transformation.rotation(asQuaternion=False), space)
+    if scale:
+        fn.setScale(transformation.scale(space))
+
+
 def match_world_matrix(leader: pm.nt.Transform, *followers: pm.nt.Transform):
     """
     Set the world matrix of one or more nodes to match a leader's world matrix.
@@ -796,8 +1078,7 @@ def match_world_matrix(leader: pm.nt.Transform, *followers: pm.nt.Transform):
         followers: One or more transforms to update
     """
     world_mtx = leader.wm.get()
-    for follower in followers:
-        set_world_matrix(follower, world_mtx)
+    set_world_matrices([(follower, world_mtx) for follower in followers])
 
 
 def get_relative_matrix(node, base_node):
@@ -0,0 +1,570 @@
+"""
+Skin weights data that can be stored and processed without Maya, and a binary .weights file format.
+
+Weights are stored as CSR-style sparse arrays, where the weights of vertex `i` are
+`weights[offsets[i]:offsets[i + 1]]`, for the influences `influence_indices[offsets[i]:offsets[i + 1]]`.
+
+Binary weights files contain a short fixed header, a json header describing every skin,
+and then the raw arrays of each skin, optionally compressed. Uncompressed arrays
+are loaded using memory maps, so only the pages that are used are read from disk.
+
+Weights may also store the rest positions of each vertex, which allows transferring
+them to meshes with different topology, see `SkinWeights.transfer`.
+"""
+
+import json
+import logging
+import re
+import struct
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from . import kdtree
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+LOG = logging.getLogger(__name__)
+
+# identifies binary weights files
+MAGIC = b"PLSW"
+VERSION = 1
+# magic, version, json header size
+_FILE_HEADER = struct.Struct("<4sHI")
+# alignment of each array in the file
+ALIGNMENT = 64
+
+COMPRESSION_NONE = None
+COMPRESSION_ZLIB = "zlib"
+COMPRESSION_LZ4 = "lz4"
+
+# the dtype names of each array
+_ARRAY_DTYPES = {
+    "offsets": "<i8",
+    "influence_indices": "<u2",
+    "weights": "<f4",
+}
+
+# arrays that may not exist for every skin, stored flattened
+_OPTIONAL_ARRAY_DTYPES = {
+    "positions": "<f4",
+}
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("numpy is required for binary skin weights")
+
+
+class SkinWeights(object):
+    """
+    The sparse vertex weights of a single skin cluster.
+
+    Attributes:
+        influences: The list of influence names, referenced by `influence_indices`.
+        offsets: An int array of length num_vertices + 1, the start of each vertex's weights.
+        influence_indices: An int array of the influence index for each weight.
+        weights: A float64 array of weight values, only stored as float32 when written to a weights file.
+        positions: An optional (num_vertices, 3) float32 array of the rest position of each vertex.
+    """
+
+    def __init__(self, influences: List[str], offsets, influence_indices, weights, positions=None):
+        self.influences = list(influences)
+        self.offsets = offsets
+        self.influence_indices = influence_indices
+        self.weights = weights
+        self.positions = positions
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} {self.num_vertices} vertices, "
+            f"{len(self.influences)} influences, {self.num_weights} weights>"
+        )
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def num_weights(self) -> int:
+        return len(self.weights)
+
+    def get_vertex_weights(self, vertex: int) -> List[Tuple[str, float]]:
+        """
+        Return the (influence name, weight) pairs of a single vertex.
+        """
+        start, end = self.offsets[vertex], self.offsets[vertex + 1]
+        return [
+            (self.influences[i], float(w)) for i, w in zip(self.influence_indices[start:end], self.weights[start:end])
+        ]
+
+    @classmethod
+    def from_list(cls, weights: list) -> "SkinWeights":
+        """
+        Create SkinWeights from a list of vertex weights, as given by `skins.get_skin_weights`.
+
+        Args:
+            weights: A list of (vertex index, [(influence name, weight), ...]) tuples.
+        """
+        _require_numpy()
+        influence_map: Dict[str, int] = {}
+        vertex_weights = {}
+        for vertex, vert_weights in weights:
+            vertex_weights[vertex] = [
+                (influence_map.setdefault(str(inf), len(influence_map)), weight) for inf, weight in vert_weights
+            ]
+
+        num_vertices = max(vertex_weights.keys()) + 1 if vertex_weights else 0
+        counts = np.zeros(num_vertices + 1, dtype=np.int64)
+        for vertex, vert_weights in vertex_weights.items():
+            counts[vertex + 1] = len(vert_weights)
+        offsets = np.cumsum(counts)
+
+        influence_indices = np.empty(offsets[-1], dtype=np.uint16)
+        values = np.empty(offsets[-1], dtype=np.float64)
+        for vertex, vert_weights in vertex_weights.items():
+            start = offsets[vertex]
+            for i, (inf_index, weight) in enumerate(vert_weights):
+                influence_indices[start + i] = inf_index
+                values[start + i] = weight
+
+        influences = sorted(influence_map.keys(), key=influence_map.get)
+        return cls(influences, offsets, influence_indices, values)
+
+    @classmethod
+    def from_dense(cls, influences: List[str], weights, threshold=0.0) -> "SkinWeights":
+        """
+        Create SkinWeights from a dense array of weights.
+
+        Args:
+            influences: The influence name of each column.
+            weights: A (num_vertices, num_influences) array of weights.
+            threshold: Weights with an absolute value less than or equal to this are omitted.
+        """
+        _require_numpy()
+        weights = np.asarray(weights)
+        mask = np.abs(weights) > threshold
+        offsets = np.zeros(weights.shape[0] + 1, dtype=np.int64)
+        np.cumsum(mask.sum(axis=1), out=offsets[1:])
+        # nonzero returns indices in row-major order, which matches the vertex offsets
+        rows, cols = np.nonzero(mask)
+        return cls(influences, offsets, cols.astype(np.uint16), weights[rows, cols].astype(np.float64))
+
+    def to_dense(self, influences: List[str] = None, dtype=None):
+        """
+        Return the weights as a dense (num_vertices, num_influences) array.
+
+        Args:
+            influences: The influence name of each column, defaults to this object's influences.
+                Weights for influences that aren't in the list are omitted.
+            dtype: The dtype of the array, defaults to float64.
+        """
+        _require_numpy()
+        rows = self.get_vertex_indices()
+        cols = np.asarray(self.influence_indices, dtype=np.int64)
+        values = np.asarray(self.weights)
+        if influences is None:
+            num_cols = len(self.influences)
+        else:
+            column_map = {name: i for i, name in enumerate(influences)}
+            remap = np.array([column_map.get(name, -1) for name in self.influences], dtype=np.int64)
+            cols = remap[cols] if len(remap) else cols
+            valid = cols >= 0
+            rows, cols, values = rows[valid], cols[valid], values[valid]
+            num_cols = len(influences)
+
+        result = np.zeros((self.num_vertices, num_cols), dtype=dtype or np.float64)
+        np.add.at(result, (rows, cols), values)
+        return result
+
+    def get_vertex_indices(self):
+        """
+        Return an array of the vertex index of every weight, the 'row' of each weight.
+        """
+        _require_numpy()
+        return np.repeat(np.arange(self.num_vertices, dtype=np.int64), np.diff(self.offsets))
+
+    def _with_weights(self, rows, influence_indices, weights, influences=None) -> "SkinWeights":
+        """
+        Return new SkinWeights from row-sorted coordinate arrays.
+        """
+        offsets = np.zeros(self.num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=self.num_vertices), out=offsets[1:])
+        return SkinWeights(
+            self.influences if influences is None else influences,
+            offsets,
+            np.asarray(influence_indices, dtype=np.uint16),
+            np.asarray(weights, dtype=np.float64),
+            self.positions,
+        )
+
+    def normalize(self) -> "SkinWeights":
+        """
+        Return a copy with the weights of every vertex scaled to sum to 1.
+        Vertices whose weights sum to 0 are unchanged.
+        """
+        _require_numpy()
+        rows = self.get_vertex_indices()
+        weights = np.asarray(self.weights, dtype=np.float64)
+        totals = np.bincount(rows, weights=weights, minlength=self.num_vertices)
+        scale = np.ones_like(totals)
+        np.divide(1.0, totals, out=scale, where=totals > 0)
+        return self._with_weights(rows, self.influence_indices, weights * scale[rows])
+
+    def prune(self, threshold=0.0001) -> "SkinWeights":
+        """
+        Return a copy without any weights whose absolute value is less than a threshold.
+        """
+        _require_numpy()
+        rows = self.get_vertex_indices()
+        keep = np.abs(self.weights) >= threshold
+        return self._with_weights(rows[keep], self.influence_indices[keep], self.weights[keep])
+
+    def limit_influences(self, max_influences: int) -> "SkinWeights":
+        """
+        Return a copy with only the largest `max_influences` weights of each vertex.
+        Remaining weights keep their order, and are not normalized.
+        """
+        _require_numpy()
+        rows = self.get_vertex_indices()
+        offsets = np.asarray(self.offsets)
+        counts = np.diff(offsets)
+        if not len(counts) or counts.max() <= max_influences:
+            return self._with_weights(rows, self.influence_indices, self.weights)
+
+        # find the rank of each weight within its vertex, by descending weight
+        max_count = counts.max()
+        positions = np.arange(len(rows)) - offsets[rows]
+        if len(counts) * max_count <= 4 * len(rows):
+            # sort each vertex separately using a padded (num_vertices, max_count) array, much faster than a full sort
+            padded = np.full((len(counts), max_count), np.inf, dtype=np.float64)
+            padded[rows, positions] = -np.asarray(self.weights)
+            padded_ranks = np.argsort(np.argsort(padded, axis=1, kind="stable"), axis=1)
+            ranks = padded_ranks[rows, positions]
+        else:
+            order = np.lexsort((-np.asarray(self.weights), rows))
+            ranks = np.empty(len(order), dtype=np.int64)
+            ranks[order] = np.arange(len(order)) - offsets[rows[order]]
+        keep = ranks < max_influences
+        return self._with_weights(rows[keep], self.influence_indices[keep], self.weights[keep])
+
+    def remap_influences(self, influence_map: Dict[str, str]) -> "SkinWeights":
+        """
+        Return a copy where influences are replaced by other influences, combining the weights
+        of any influences that are merged within a vertex. This is equivalent to multiplying
+        the vertex x influence matrix by a column-merge matrix.
+
+        Args:
+            influence_map: A dict of {influence name: new influence name}, for only the influences to replace.
+        """
+        _require_numpy()
+        # build the new influence table and the old -> new column mapping once
+        new_influences: List[str] = []
+        new_index_map: Dict[str, int] = {}
+        column_map = np.empty(len(self.influences), dtype=np.int64)
+        for i, name in enumerate(self.influences):
+            new_name = influence_map.get(name, name)
+            if new_name not in new_index_map:
+                new_index_map[new_name] = len(new_influences)
+                new_influences.append(new_name)
+            column_map[i] = new_index_map[new_name]
+
+        rows = self.get_vertex_indices()
+        cols = column_map[np.asarray(self.influence_indices, dtype=np.int64)]
+        # sum duplicate (vertex, influence) entries, keys are sorted so rows stay in order
+        num_cols = max(len(new_influences), 1)
+        unique_keys, inverse = np.unique(rows * num_cols + cols, return_inverse=True)
+        weights = np.bincount(inverse, weights=self.weights, minlength=len(unique_keys))
+        return self._with_weights(unique_keys // num_cols, unique_keys % num_cols, weights, new_influences)
+
+    def transfer(self, positions, k=4, power=2.0) -> Tuple["SkinWeights", Dict[str, float]]:
+        """
+        Return weights for a different set of vertices, such as a mesh with different topology,
+        by blending the weights of the k nearest stored rest positions using inverse distance weighting.
+        Requires `positions` to be set.
+
+        Args:
+            positions: A (num_vertices, 3) array of the rest positions of the new vertices.
+            k: The number of nearest stored vertices to blend for each new vertex.
+            power: The inverse distance weighting exponent, higher values favor the nearest vertex more.
+
+        Returns:
+            A tuple of (SkinWeights, stats), where the weights are normalized, and stats is a dict
+            describing the distance from each new vertex to its nearest stored vertex,
+            with keys "mean_distance", "max_distance", "rms_distance", and "exact_matches".
+        """
+        _require_numpy()
+        if self.positions is None:
+            raise ValueError("Cannot transfer skin weights that have no rest positions")
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        num_vertices = len(positions)
+        k = min(k, self.num_vertices)
+
+        tree = kdtree.create_kd_tree(np.asarray(self.positions, dtype=np.float64))
+        distances, neighbors = kdtree.query_nearest(tree, positions, k)
+
+        # inverse distance weights, with exact matches copying that vertex entirely
+        exact = distances[:, 0] < 1e-6
+        factors = 1.0 / np.maximum(distances, 1e-6) ** power
+        factors[exact] = 0.0
+        factors[exact, 0] = 1.0
+        factors /= factors.sum(axis=1, keepdims=True)
+
+        # expand each (new vertex, neighbor) pair into that neighbor's weights
+        offsets = np.asarray(self.offsets)
+        counts = np.diff(offsets)
+        neighbors = neighbors.ravel()
+        pair_counts = counts[neighbors]
+        pair_starts = np.cumsum(pair_counts) - pair_counts
+        pair_ids = np.repeat(np.arange(len(neighbors)), pair_counts)
+        sources = offsets[neighbors][pair_ids] + np.arange(len(pair_ids)) - pair_starts[pair_ids]
+        rows = pair_ids // k
+        cols = np.asarray(self.influence_indices, dtype=np.int64)[sources]
+        values = np.asarray(self.weights, dtype=np.float64)[sources] * factors.ravel()[pair_ids]
+
+        # sum weights of the same influence from different neighbors
+        num_cols = max(len(self.influences), 1)
+        unique_keys, inverse = np.unique(rows * num_cols + cols, return_inverse=True)
+        values = np.bincount(inverse, weights=values, minlength=len(unique_keys))
+        nonzero = values > 0
+        unique_keys, values = unique_keys[nonzero], values[nonzero]
+        offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(unique_keys // num_cols, minlength=num_vertices), out=offsets[1:])
+        result = SkinWeights(
+            self.influences,
+            offsets,
+            (unique_keys % num_cols).astype(np.uint16),
+            values,
+            positions.astype(np.float32),
+        ).normalize()
+
+        nearest = distances[:, 0]
+        stats = {
+            "mean_distance": float(nearest.mean()) if num_vertices else 0.0,
+            "max_distance": float(nearest.max()) if num_vertices else 0.0,
+            "rms_distance": float(np.sqrt(np.mean(nearest**2))) if num_vertices else 0.0,
+            "exact_matches": int(exact.sum()),
+        }
+        return result, stats
+
+    def to_list(self) -> list:
+        """
+        Return the weights as a list of vertex weights, as given by `skins.get_skin_weights`.
+        Vertices without any weights are omitted.
+        """
+        offsets = self.offsets.tolist()
+        influence_indices = self.influence_indices.tolist()
+        values = self.weights.tolist()
+        influences = self.influences
+        result = []
+        for vertex in range(len(offsets) - 1):
+            start, end = offsets[vertex], offsets[vertex + 1]
+            if start == end:
+                continue
+            result.append((vertex, [(influences[influence_indices[i]], values[i]) for i in range(start, end)]))
+        return result
+
+
+def is_binary_weights_file(file_path: str) -> bool:
+    """
+    Return True if a file is a binary weights file, False if it is any other format.
+    """
+    with open(file_path, "rb") as fp:
+        return fp.read(len(MAGIC)) == MAGIC
+
+
+def _compress(data: bytes, compression: Optional[str]) -> bytes:
+    if compression == COMPRESSION_ZLIB:
+        return zlib.compress(data)
+    elif compression == COMPRESSION_LZ4:
+        if lz4_frame is None:
+            raise RuntimeError("lz4 is not installed, cannot compress weights with lz4")
+        return lz4_frame.compress(data)
+    return data
+
+
+def _decompress(data: bytes, compression: Optional[str]) -> bytes:
+    if compression == COMPRESSION_ZLIB:
+        return zlib.decompress(data)
+    elif compression == COMPRESSION_LZ4:
+        if lz4_frame is None:
+            raise RuntimeError("lz4 is not installed, cannot read weights compressed with lz4")
+        return lz4_frame.decompress(data)
+    return data
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def save_weights_file(file_path: str, skin_weights: Dict[str, SkinWeights], compression: Optional[str] = None):
+    """
+    Write skin weights to a binary weights file.
+
+    Args:
+        file_path: The path to the .weights file to write.
+        skin_weights: A dict of {skin name: SkinWeights}.
+        compression: The compression to use for each array, None, COMPRESSION_ZLIB, or COMPRESSION_LZ4.
+    """
+    _require_numpy()
+
+    # gather array data and describe it in the json header, with offsets relative to the data block
+    skins_header = []
+    chunks = []
+    data_size = 0
+    for skin_name, weights in skin_weights.items():
+        arrays_header = {}
+        array_dtypes = dict(_ARRAY_DTYPES)
+        if weights.positions is not None:
+            array_dtypes.update(_OPTIONAL_ARRAY_DTYPES)
+        for array_name, dtype in array_dtypes.items():
+            raw = np.ascontiguousarray(getattr(weights, array_name), dtype=dtype).tobytes()
+            data = _compress(raw, compression)
+            data_size = _align(data_size)
+            arrays_header[array_name] = {
+                "offset": data_size,
+                "size": len(data),
+                "count": len(raw) // np.dtype(dtype).itemsize,
+            }
+            chunks.append((data_size, data))
+            data_size += len(data)
+
+        skins_header.append(
+            {
+                "name": skin_name,
+                "influences": weights.influences,
+                "arrays": arrays_header,
+            }
+        )
+
+    header = json.dumps({"compression": compression, "skins": skins_header}).encode("utf-8")
+    data_start = _align(_FILE_HEADER.size + len(header))
+
+    with open(file_path, "wb") as fp:
+        fp.write(_FILE_HEADER.pack(MAGIC, VERSION, len(header)))
+        fp.write(header)
+        for offset, data in chunks:
+            fp.seek(data_start + offset)
+            fp.write(data)
+
+
+def read_weights_file_header(file_path: str) -> Tuple[dict, int]:
+    """
+    Read the json header of a binary weights file.
+
+    Returns:
+        A tuple of (header, data_start), where header contains the "compression" and "skins"
+        descriptions, and data_start is the file offset that array offsets are relative to.
+    """
+    with open(file_path, "rb") as fp:
+        magic, version, header_size = _FILE_HEADER.unpack(fp.read(_FILE_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"Not a binary weights file: {file_path}")
+        if version > VERSION:
+            raise ValueError(f"Unsupported weights file version {version}: {file_path}")
+        header = json.loads(fp.read(header_size).decode("utf-8"))
+    return header, _align(_FILE_HEADER.size + header_size)
+
+
+def _get_skin_array_dtypes(skin_header: dict) -> Dict[str, str]:
+    array_dtypes = dict(_ARRAY_DTYPES)
+    array_dtypes.update({n: d for n, d in _OPTIONAL_ARRAY_DTYPES.items() if n in skin_header["arrays"]})
+    return array_dtypes
+
+
+def get_skin_data_size(skin_header: dict) -> int:
+    """
+    Return the number of bytes used by the decoded arrays of one skin described in a weights file header.
+    """
+    _require_numpy()
+    dtypes = _get_skin_array_dtypes(skin_header)
+    return sum(skin_header["arrays"][n]["count"] * np.dtype(d).itemsize for n, d in dtypes.items())
+
+
+def read_skin_weights(
+    file_path: str, skin_header: dict, data_start: int, compression: Optional[str] = None, use_memmap=True
+) -> SkinWeights:
+    """
+    Read the weights of one skin from a binary weights file. Safe to call from worker threads.
+
+    Args:
+        file_path: The path to the .weights file to read.
+        skin_header: The description of the skin from the file's header, see `read_weights_file_header`.
+        data_start: The file offset of the data block, see `read_weights_file_header`.
+        compression: The compression of the file's arrays.
+        use_memmap: If true, memory map uncompressed arrays instead of reading them into memory.
+    """
+    _require_numpy()
+    arrays = {}
+    with open(file_path, "rb") as fp:
+        for array_name, dtype in _get_skin_array_dtypes(skin_header).items():
+            array_header = skin_header["arrays"][array_name]
+            offset = data_start + array_header["offset"]
+            count = array_header["count"]
+            if not count:
+                arrays[array_name] = np.zeros(0, dtype=dtype)
+            elif compression:
+                fp.seek(offset)
+                raw = _decompress(fp.read(array_header["size"]), compression)
+                arrays[array_name] = np.frombuffer(raw, dtype=dtype, count=count)
+            elif use_memmap:
+                arrays[array_name] = np.memmap(file_path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+            else:
+                fp.seek(offset)
+                arrays[array_name] = np.fromfile(fp, dtype=dtype, count=count)
+
+    if "positions" in arrays:
+        arrays["positions"] = arrays["positions"].reshape(-1, 3)
+    return SkinWeights(skin_header["influences"], **arrays)
+
+
+def load_weights_file(file_path: str) -> Dict[str, SkinWeights]:
+    """
+    Read skin weights from a binary weights file.
+    Uncompressed arrays are memory mapped and read from disk only when accessed.
+
+    Args:
+        file_path: The path to the .weights file to read.
+
+    Returns:
+        A dict of {skin name: SkinWeights}.
+    """
+    _require_numpy()
+    header, data_start = read_weights_file_header(file_path)
+    compression = header.get("compression")
+    return {
+        skin_header["name"]: read_skin_weights(file_path, skin_header, data_start, compression)
+        for skin_header in header["skins"]
+    }
+
+
+def get_parent_influence_map(influences: List[str], ancestors: Dict[str, List[str]], pattern: str) -> Dict[str, str]:
+    """
+    Return a map of influences that match a pattern to their first ancestor that doesn't match,
+    for use with `SkinWeights.remap_influences`.
+
+    Args:
+        influences: The influence names to remap.
+        ancestors: A dict of {influence name: [parent, grandparent, ...]}, see `skins.get_influence_ancestors`.
+        pattern: A regex pattern matching the names of influences to remove.
+
+    Returns:
+        A dict of {influence name: new influence name}. Influences without a valid ancestor are not included.
+    """
+    pat = re.compile(pattern)
+    result = {}
+    for name in influences:
+        if not pat.match(name):
+            continue
+        for parent in ancestors.get(name, []):
+            if not pat.match(parent):
+                result[name] = parent
+                break
+    return result
@@ -1,12 +1,23 @@
 import logging
 import re
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 import maya.OpenMaya as api
 import maya.OpenMayaAnim as apianim
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaAnim as oma2
 import pymel.core as pm
 from maya import cmds
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import modifiers
+from . import skin_weights as skin_weights_io
 from .vendor import pymetanode as meta
 from .vendor.mayacoretools import preserved_selection
 
@@ -48,24 +59,26 @@ def get_meshes_from_skin(skin):
     return list(set(skin.outputGeometry.listConnections()))
 
 
-def get_skin_influences(skin):
+def get_skin_influences(skin, as_handles=False):
     """
     Return all influences affecting a sking.
 
     Args:
         skin (PyNode): A skin cluster node
+        as_handles (bool): Return influences as NodeHandles instead of PyNodes
 
     Returns:
         A dictionary with influence index (id) as keys
         and influence nodes as values.
     """
     result = {}
-    skin_fn = apianim.MFnSkinCluster(skin.__apimobject__())
+    skin_fn = apianim.MFnSkinCluster(meta.get_m_object(skin))
     infl_paths = api.MDagPathArray()
     skin_fn.influenceObjects(infl_paths)
 
+    node_cls = meta.NodeHandle if as_handles else pm.PyNode
     for i in range(infl_paths.length()):
-        influence = pm.PyNode(infl_paths[i].node())
+        influence = node_cls(infl_paths[i].node())
         index = skin_fn.indexForInfluenceObject(infl_paths[i])
         result[index] = influence
 
@@ -77,6 +90,9 @@ def get_skin_weights(skin, indices=None, influences=None, influences_as_strings=
     Return the vertex weights of a skin, optionally filtered to only
     a set of vertex indices or influences.
 
+    Uses `get_skin_weights_array` when possible, only vertices and influences with
+    non-zero weights are included in that case.
+
     Args:
         skin (PyNode): A skin cluster node
         indices (list of int): If given, only return weights for the vertices
@@ -91,10 +107,32 @@ def get_skin_weights(skin, indices=None, influences=None, influences_as_strings=
         each influence.
             e.g. [(index, [(influence, weight), ...]), ...]
     """
-    result = []
     if influences is None:
         influences = get_skin_influences(skin)
 
+    if not _can_use_weights_arrays(skin):
+        return _get_skin_weights_from_plugs(skin, indices, influences, influences_as_strings)
+
+    weights, influence_ids = get_skin_weights_array(skin)
+    column_values = [influences.get(inf_id) for inf_id in influence_ids]
+    if influences_as_strings:
+        column_values = [inf.nodeName() if inf is not None else None for inf in column_values]
+
+    vertices = range(weights.shape[0]) if indices is None else sorted(set(indices))
+    result = []
+    for vert in vertices:
+        row = weights[vert]
+        cols = np.flatnonzero(row).tolist()
+        result.append((vert, [(column_values[c], float(row[c])) for c in cols if column_values[c] is not None]))
+    return result
+
+
+def _get_skin_weights_from_plugs(skin, indices, influences, influences_as_strings):
+    """
+    Return the vertex weights of a skin by reading each weight plug, see `get_skin_weights`.
+    """
+    result = []
+
     inf_ids = api.MIntArray()
     weight_list_plug = skin.wl.__apiobject__()
     weight_list_plug.getExistingArrayAttributeIndices(inf_ids)
@@ -119,15 +157,267 @@ def get_skin_weights(skin, indices=None, influences=None, influences_as_strings=
     return result
 
 
+def _get_skin_fn(skin) -> oma2.MFnSkinCluster:
+    sel = om2.MSelectionList()
+    sel.add(str(skin))
+    return oma2.MFnSkinCluster(sel.getDependNode(0))
+
+
+def _get_skin_mesh_components(skin_fn: oma2.MFnSkinCluster) -> Optional[Tuple[om2.MDagPath, om2.MObject, int]]:
+    """
+    Return the mesh, a component of all its vertices, and the number of vertices for the first
+    geometry of a skin cluster, or None if the skin cluster doesn't deform a mesh.
+    """
+    if not skin_fn.numOutputConnections():
+        return None
+    mesh_path = skin_fn.getPathAtIndex(skin_fn.indexForOutputConnection(0))
+    if not mesh_path.hasFn(om2.MFn.kMesh):
+        return None
+    num_vertices = om2.MFnMesh(mesh_path).numVertices
+    component_fn = om2.MFnSingleIndexedComponent()
+    components = component_fn.create(om2.MFn.kMeshVertComponent)
+    component_fn.setCompleteData(num_vertices)
+    return mesh_path, components, num_vertices
+
+
+def _can_use_weights_arrays(skin) -> bool:
+    """
+    Return True if the weights of a skin can be accessed as arrays, which requires numpy and a skinned mesh.
+    """
+    return np is not None and _get_skin_mesh_components(_get_skin_fn(skin)) is not None
+
+
+def get_skin_weights_array(skin) -> Tuple["np.ndarray", List[int]]:
+    """
+    Return the weights of every vertex of a skinned mesh as a dense array, using a single
+    `MFnSkinCluster.getWeights` call. Requires numpy.
+
+    Args:
+        skin (PyNode): A skin cluster node that deforms a mesh
+
+    Returns:
+        A tuple of (weights, influence_ids), where weights is a (num_vertices, num_influences) float64
+        array, and influence_ids is the list of influence indices (as used by `get_skin_influences`)
+        for each column.
+    """
+    skin_fn = _get_skin_fn(skin)
+    mesh_components = _get_skin_mesh_components(skin_fn)
+    if mesh_components is None:
+        raise ValueError(f"Skin cluster does not deform a mesh: {skin}")
+    mesh_path, components, num_vertices = mesh_components
+
+    influence_ids = [skin_fn.indexForInfluenceObject(path) for path in skin_fn.influenceObjects()]
+    weights, num_influences = skin_fn.getWeights(mesh_path, components)
+    weights = np.array(weights, dtype=np.float64).reshape(num_vertices, num_influences)
+    return weights, influence_ids
+
+
+def set_skin_weights_array(skin, weights, influence_ids: List[int] = None, normalize=False):
+    """
+    Set the weights of every vertex of a skinned mesh from a dense array, using a single
+    undoable `MFnSkinCluster.setWeights` call. Requires numpy.
+
+    Args:
+        skin (PyNode): A skin cluster node that deforms a mesh
+        weights: A (num_vertices, num_columns) array of weights.
+        influence_ids: The influence index (as used by `get_skin_influences`) of each column,
+            defaults to the order given by `get_skin_weights_array`. Influences without a column
+            will have their weights set to 0.
+        normalize: If true, let the skin cluster normalize the new weights.
+    """
+    skin_fn = _get_skin_fn(skin)
+    mesh_components = _get_skin_mesh_components(skin_fn)
+    if mesh_components is None:
+        raise ValueError(f"Skin cluster does not deform a mesh: {skin}")
+    mesh_path, components, num_vertices = mesh_components
+
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.shape[0] != num_vertices:
+        raise ValueError(f"Expected weights for {num_vertices} vertices, got {weights.shape[0]}: {skin}")
+
+    skin_influence_ids = [skin_fn.indexForInfluenceObject(path) for path in skin_fn.influenceObjects()]
+    if influence_ids is not None and list(influence_ids) != skin_influence_ids:
+        # reorder columns to match the skin's influences
+        column_map = {inf_id: i for i, inf_id in enumerate(influence_ids)}
+        full_weights = np.zeros((num_vertices, len(skin_influence_ids)), dtype=np.float64)
+        for skin_col, inf_id in enumerate(skin_influence_ids):
+            col = column_map.get(inf_id)
+            if col is not None:
+                full_weights[:, skin_col] = weights[:, col]
+        weights = full_weights
+    elif weights.shape[1] != len(skin_influence_ids):
+        raise ValueError(f"Expected weights for {len(skin_influence_ids)} influences, got {weights.shape[1]}: {skin}")
+
+    influence_indices = om2.MIntArray(list(range(len(skin_influence_ids))))
+    new_weights = om2.MDoubleArray(weights.ravel().tolist())
+    old_weights = []
+
+    def do_it():
+        old_weights[:] = [skin_fn.setWeights(mesh_path, components, influence_indices, new_weights, normalize, True)]
+
+    def undo_it():
+        skin_fn.setWeights(mesh_path, components, influence_indices, old_weights[0], False)
+
+    modifiers.commit(do_it, undo_it)
+
+
+def get_skin_rest_positions(skin) -> "np.ndarray":
+    """
+    Return the world space positions of every vertex of a skinned mesh before it is deformed
+    by the skin cluster, as a (num_vertices, 3) float64 array. Requires numpy.
+
+    Args:
+        skin (PyNode): A skin cluster node that deforms a mesh
+    """
+    skin_fn = _get_skin_fn(skin)
+    mesh_components = _get_skin_mesh_components(skin_fn)
+    if mesh_components is None:
+        raise ValueError(f"Skin cluster does not deform a mesh: {skin}")
+    mesh_path = mesh_components[0]
+
+    input_shape = skin_fn.inputShapeAtIndex(skin_fn.indexForOutputConnection(0))
+    points = om2.MFnMesh(input_shape).getPoints(om2.MSpace.kObject)
+    positions = np.array(points, dtype=np.float64).reshape(-1, 4)
+    matrix = np.array(list(mesh_path.inclusiveMatrix()), dtype=np.float64).reshape(4, 4)
+    return positions.dot(matrix)[:, :3]
+
+
+def get_skin_weights_data(skin, include_positions=False) -> skin_weights_io.SkinWeights:
+    """
+    Return the weights of a skinned mesh as SkinWeights, see `get_skin_weights_array`.
+
+    Args:
+        skin (PyNode): A skin cluster node that deforms a mesh
+        include_positions (bool): If true, include the rest positions of each vertex,
+            which allows transferring the weights to meshes with different topology.
+    """
+    weights, influence_ids = get_skin_weights_array(skin)
+    influences = get_skin_influences(skin)
+    names = [influences[inf_id].nodeName() for inf_id in influence_ids]
+    result = skin_weights_io.SkinWeights.from_dense(names, weights)
+    if include_positions:
+        result.positions = get_skin_rest_positions(skin).astype(np.float32)
+    return result
+
+
+def set_skin_weights_data(skin, weights: skin_weights_io.SkinWeights, prune=True):
+    """
+    Set the weights of a skinned mesh from SkinWeights, matching influences by name.
+    Vertices beyond the number of vertices in the weights data are not changed.
+
+    Args:
+        skin (PyNode): A skin cluster node that deforms a mesh
+        weights: The SkinWeights to apply
+        prune (bool): If true, remove influences that have no weights
+
+    Returns:
+        The set of influence names that were not found in the skin.
+    """
+    current_weights, influence_ids = get_skin_weights_array(skin)
+    influences = get_skin_influences(skin)
+    names = [influences[inf_id].nodeName() for inf_id in influence_ids]
+
+    new_weights = weights.to_dense(names)
+    num_vertices = min(new_weights.shape[0], current_weights.shape[0])
+    current_weights[:num_vertices] = new_weights[:num_vertices]
+    set_skin_weights_array(skin, current_weights, influence_ids)
+
+    if prune:
+        pm.skinPercent(skin, skin.getGeometry(), nrm=False, prw=0)
+
+    missing_influences = set(weights.influences) - set(names)
+    _warn_missing_influences(skin, missing_influences)
+    return missing_influences
+
+
+def transfer_skin_weights_data(skin, weights: skin_weights_io.SkinWeights, k=4) -> Dict[str, float]:
+    """
+    Set the weights of a skinned mesh from SkinWeights that were saved for a mesh with different topology,
+    blending the weights of the nearest saved vertices to each vertex. See `SkinWeights.transfer`.
+
+    Args:
+        skin (PyNode): A skin cluster node that deforms a mesh
+        weights: The SkinWeights to apply, which must include rest positions
+        k (int): The number of nearest saved vertices to blend for each vertex
+
+    Returns:
+        A dict of transfer error stats, see `SkinWeights.transfer`.
+    """
+    transferred, stats = weights.transfer(get_skin_rest_positions(skin), k=k)
+    set_skin_weights_data(skin, transferred)
+    return stats
+
+
+def _warn_missing_influences(skin, missing_influences):
+    for inf in missing_influences:
+        meshes = skin.getGeometry()
+        mesh = meshes[0] if meshes else None
+        LOG.warning("Mesh %s is missing influence: %s ", mesh, inf)
+
+
 def set_skin_weights(skin, weights, prune=True):
     """
     Set the exact weights for a skin.
 
+    Uses `set_skin_weights_array` when possible, replacing the weights of only the given vertices.
+    Weights for vertex indices that don't exist on the mesh are skipped with a warning.
+
     Args:
         skin (PyNode): A skin cluster node
         weights (list): A list of vertex weights, as given by `get_skin_weights`
         prune (bool): If true, remove influences that have no weights
     """
+    if not _can_use_weights_arrays(skin):
+        return _set_skin_weights_with_plugs(skin, weights, prune)
+
+    current_weights, influence_ids = get_skin_weights_array(skin)
+    influences = get_skin_influences(skin)
+    column_map = {}
+    for col, inf_id in enumerate(influence_ids):
+        column_map[influences[inf_id]] = col
+        column_map[influences[inf_id].nodeName()] = col
+
+    # keep track of missing influences
+    missing_influences = set()
+    # vertex indices that don't exist on the mesh, e.g. weights saved for an older version of it
+    invalid_indices = []
+
+    num_vertices = current_weights.shape[0]
+    for vert_index, vert_weights in weights:
+        if not 0 <= vert_index < num_vertices:
+            invalid_indices.append(vert_index)
+            continue
+        row = current_weights[vert_index]
+        row[:] = 0
+        for inf, weight in vert_weights:
+            col = column_map.get(inf)
+            if col is None:
+                missing_influences.add(inf)
+                continue
+            row[col] = weight
+
+    if invalid_indices:
+        LOG.warning(
+            "Skipped weights for %d vertices that don't exist on %s (%d vertices): %s",
+            len(invalid_indices),
+            skin,
+            num_vertices,
+            invalid_indices[:10],
+        )
+
+    set_skin_weights_array(skin, current_weights, influence_ids)
+
+    if prune:
+        pm.skinPercent(skin, skin.getGeometry(), nrm=False, prw=0)
+
+    _warn_missing_influences(skin, missing_influences)
+    return missing_influences
+
+
+def _set_skin_weights_with_plugs(skin, weights, prune=True):
+    """
+    Set the exact weights for a skin by setting each weight plug, see `set_skin_weights`.
+    """
     # make sure the weight data is equal in length to the indices,
     # or the current weight list of the skin cluster
 
@@ -167,10 +457,7 @@ def set_skin_weights(skin, weights, prune=True):
     if prune:
         pm.skinPercent(skin, skin.getGeometry(), nrm=False, prw=0)
 
-    for inf in missing_influences:
-        meshes = skin.getGeometry()
-        mesh = meshes[0] if meshes else None
-        LOG.warning("Mesh %s is missing influence: %s ", mesh, inf)
+    _warn_missing_influences(skin, missing_influences)
 
     return missing_influences
 
@@ -184,6 +471,9 @@ def normalize_weights_data(weights):
     Args:
         weights (list): A list of vertex weights, as given by `get_skin_weights`
     """
+    if np is not None:
+        normalized = skin_weights_io.SkinWeights.from_list(weights).normalize()
+        return [(vert, normalized.get_vertex_weights(vert)) for vert, _ in weights]
 
     def normalize(wts):
         total = sum([w[1] for w in wts])
@@ -203,6 +493,23 @@ def normalize_weights_data(weights):
     return weights_copy
 
 
+def get_influence_ancestors(influences: List[str]) -> Dict[str, List[str]]:
+    """
+    Return the ancestors of multiple influences, using a single query of their full paths.
+
+    Args:
+        influences: A list of influence names.
+
+    Returns:
+        A dict of {influence name: [parent, grandparent, ...]}
+    """
+    result = {}
+    for long_name in cmds.ls(influences, long=True):
+        path = long_name.split("|")
+        result.setdefault(path[-1], path[-2:0:-1])
+    return result
+
+
 def move_inf_weights_to_parents(weights, inf_pattern):
     """
     Find influences by pattern, and move their weights to the first parent not removed.
@@ -210,6 +517,18 @@ def move_inf_weights_to_parents(weights, inf_pattern):
     Return:
         A tuple of (new_weights, changed) where changed is true if any influences were remapped.
     """
+    if np is not None:
+        data = skin_weights_io.SkinWeights.from_list(weights)
+        ancestors = get_influence_ancestors(data.influences)
+        influence_map = skin_weights_io.get_parent_influence_map(data.influences, ancestors, inf_pattern)
+        for inf, new_inf in influence_map.items():
+            LOG.info(f"Replacing {inf} with {new_inf}")
+
+        data = data.remap_influences(influence_map).prune(0.0001)
+        # round weights that are nearly 1
+        data.weights = np.where(np.abs(1.0 - data.weights) < 0.0001, 1.0, data.weights)
+        return [(vert, data.get_vertex_weights(vert)) for vert, _ in weights], bool(influence_map)
+
     pat = re.compile(inf_pattern)
     inf_parent_map = {}
 
@@ -287,9 +606,17 @@ def normalize_skin_weights(skin):
     Normalize the weights of a skin manually be retrieving the weights,
     applying numerical normalization, then reapplying the new weights.
     """
-    weights = get_skin_weights(skin)
-    norm_weights = normalize_weights_data(weights)
-    set_skin_weights(skin, norm_weights)
+    if not _can_use_weights_arrays(skin):
+        weights = get_skin_weights(skin)
+        norm_weights = normalize_weights_data(weights)
+        set_skin_weights(skin, norm_weights)
+        return
+
+    weights, influence_ids = get_skin_weights_array(skin)
+    totals = weights.sum(axis=1, keepdims=True)
+    np.divide(weights, totals, out=weights, where=totals > 0)
+    set_skin_weights_array(skin, weights, influence_ids)
+    pm.skinPercent(skin, skin.getGeometry(), nrm=False, prw=0)
 
 
 def get_skin_weights_map(*skins):
@@ -309,61 +636,272 @@ def get_skin_weights_map(*skins):
     return skin_weights
 
 
-def apply_skin_weights_map(skin_weights, *skins: List[pm.nt.SkinCluster]):
+def apply_skin_weights_map(skin_weights, *skins: List[pm.nt.SkinCluster]) -> Dict[str, Dict[str, float]]:
     """
     Set the skin weights for multiple skin clusters.
 
+    SkinWeights that include rest positions are transferred by position when the
+    number of vertices doesn't match the mesh, see `transfer_skin_weights_data`.
+
     Args:
         skin_weights (dict): A map of skin node names to weights data,
-            as given by `get_skin_weights`
+            as given by `get_skin_weights`, or SkinWeights
         *skins (PyNode): One or more skin cluster nodes
+
+    Returns:
+        A dict of {skinName: stats} with the transfer error stats of any skins whose
+        weights were transferred by position.
     """
+    transfer_stats = {}
     for skin in skins:
         weights = skin_weights.get(skin.nodeName(), None)
         if not weights:
             LOG.warning("Could not find weights for skin: %s", skin)
             continue
+        if isinstance(weights, skin_weights_io.SkinWeights):
+            if _can_use_weights_arrays(skin):
+                num_vertices = _get_skin_mesh_components(_get_skin_fn(skin))[2]
+                num_saved = len(weights.positions) if weights.positions is not None else weights.num_vertices
+                if num_saved != num_vertices:
+                    if weights.positions is not None:
+                        transfer_stats[skin.nodeName()] = transfer_skin_weights_data(skin, weights)
+                        continue
+                    LOG.warning(
+                        "Weights for %s have %d vertices but the mesh has %d, and no positions to transfer by",
+                        skin,
+                        num_saved,
+                        num_vertices,
+                    )
+                set_skin_weights_data(skin, weights)
+                continue
+            weights = weights.to_list()
         set_skin_weights(skin, weights)
+    return transfer_stats
 
 
-def save_skin_weights_to_file(file_path, *skins):
+def save_skin_weights_to_file(file_path, *skins, binary=False, compression=None):
     """
     Save skin weights to a .weights file for one or more skin clusters.
 
     Args:
         file_path (str): A full path to the .weights file to write
         *skins (PyNode): One or more skin cluster nodes
+        binary (bool): If true, write a binary weights file, see `skin_weights.py`. Requires numpy.
+        compression (str): The compression to use for binary weights files, 'zlib', 'lz4', or None.
     """
     pm.progressWindow(t="Saving Weights...", min=0, max=100, status=None)
 
     pm.progressWindow(e=True, progress=0)
-    skin_weights = get_skin_weights_map(*skins)
-
-    pm.progressWindow(e=True, progress=80)
-    skin_weights_str = meta.encode_metadata(skin_weights)
-
-    pm.progressWindow(e=True, progress=90)
-    with open(file_path, "w") as fp:
-        fp.write(skin_weights_str)
+    if binary:
+        # store rest positions so the weights can be transferred if the mesh topology changes
+        skin_weights = {}
+        for skin in skins:
+            if _can_use_weights_arrays(skin):
+                skin_weights[skin.nodeName()] = get_skin_weights_data(skin, include_positions=True)
+            else:
+                skin_weights[skin.nodeName()] = skin_weights_io.SkinWeights.from_list(get_skin_weights(skin))
+        pm.progressWindow(e=True, progress=90)
+        skin_weights_io.save_weights_file(file_path, skin_weights, compression=compression)
+    else:
+        skin_weights = get_skin_weights_map(*skins)
+        pm.progressWindow(e=True, progress=80)
+        skin_weights_str = meta.encode_metadata(skin_weights)
+
+        pm.progressWindow(e=True, progress=90)
+        with open(file_path, "w") as fp:
+            fp.write(skin_weights_str)
 
     pm.progressWindow(endProgress=True)
     LOG.info(file_path)
 
 
-def apply_skin_weights_from_file(file_path, *skins: List[pm.nt.SkinCluster]):
+def load_skin_weights_file(file_path) -> dict:
     """
-    Load skin weights from a .weights file, and apply it to
-    one or more skin clusters.
+    Load skin weights from a .weights file, detecting whether it is a binary or text weights file.
 
     Args:
         file_path (str): A full path to the .weights file to read
-        *skins (PyNode): One or more skin cluster nodes
+
+    Returns:
+        A dict of {skinName: weights} for all skin clusters in the file, where weights
+        are SkinWeights for binary files, or lists as given by `get_skin_weights` for text files.
     """
+    if skin_weights_io.is_binary_weights_file(file_path):
+        return skin_weights_io.load_weights_file(file_path)
+
     with open(file_path, "r") as fp:
         content = fp.read()
+    return meta.decode_metadata(content)
+
+
+def apply_skin_weights_from_file(file_path, *skins: List[pm.nt.SkinCluster]) -> Dict[str, Dict[str, float]]:
+    """
+    Load skin weights from a binary or text .weights file, and apply it to
+    one or more skin clusters.
+
+    Args:
+        file_path (str): A full path to the .weights file to read
+        *skins (PyNode): One or more skin cluster nodes
+
+    Returns:
+        A dict of {skinName: stats} for any skins whose weights were transferred by position,
+        see `apply_skin_weights_map`.
+    """
+    skin_weights = load_skin_weights_file(file_path)
+    return apply_skin_weights_map(skin_weights, *skins)
 
-    skin_weights = meta.decode_metadata(content)
-    apply_skin_weights_map(skin_weights, *skins)
+
+class SkinWeightsFileLoader(object):
+    """
+    Reads and decodes the weights of each skin in a .weights file on a thread pool, so that
+    weights can be prepared while skin clusters are being created on the main thread.
+
+    Skins are decoded in the order given to `start`, and should be retrieved with `get` in the same
+    order. Decoded weights count towards a memory budget until they are retrieved, so workers wait
+    instead of decoding far ahead of the main thread.
+
+    Binary files are decoded per skin. Text files can only be parsed as a whole, so they are
+    parsed by a single worker.
+
+    Example:
+        with SkinWeightsFileLoader(file_path) as loader:
+            loader.start(["body_skcl", "head_skcl"])
+            for name in ["body_skcl", "head_skcl"]:
+                skin = create_skin(...)
+                apply_skin_weights_map({name: loader.get(name)}, skin)
+    """
+
+    def __init__(self, file_path: str, max_workers=4, max_memory=512 * 1024 * 1024):
+        """
+        Args:
+            file_path: The full path to the .weights file to read.
+            max_workers: The maximum number of worker threads.
+            max_memory: The maximum number of bytes of decoded weights that may be waiting to be retrieved.
+                A skin larger than this is still decoded, but only once no other weights are waiting.
+        """
+        self.file_path = file_path
+        self.max_memory = max_memory
+        self.is_binary = np is not None and skin_weights_io.is_binary_weights_file(file_path)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers if self.is_binary else 1)
+        self._memory_cond = threading.Condition()
+        self._memory_in_use = 0
+        self._closed = False
+        # the skin the main thread is waiting for, which is allowed to exceed the budget
+        self._waiting_for = None
+        # futures for each skin in the order they were submitted, and the memory they hold once decoded
+        self._futures = {}
+        self._order: List[str] = []
+        self._sizes: Dict[str, int] = {}
+        self._held: Dict[str, int] = {}
+
+        if self.is_binary:
+            header, self._data_start = skin_weights_io.read_weights_file_header(file_path)
+            self._compression = header.get("compression")
+            self._skin_headers = {skin_header["name"]: skin_header for skin_header in header["skins"]}
+        else:
+            self._text_future = self._executor.submit(load_skin_weights_file, file_path)
+            self._skin_headers = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def start(self, skin_names: List[str] = None):
+        """
+        Start decoding weights in the background.
+
+        Args:
+            skin_names: The names of the skins to decode, in the order they will be retrieved.
+                Names that aren't in the file are ignored. Defaults to all skins in the file.
+        """
+        if not self.is_binary:
+            return
+        if skin_names is None:
+            skin_names = list(self._skin_headers.keys())
+        for skin_name in skin_names:
+            if skin_name in self._skin_headers and skin_name not in self._sizes:
+                self._sizes[skin_name] = skin_weights_io.get_skin_data_size(self._skin_headers[skin_name])
+                with self._memory_cond:
+                    self._order.append(skin_name)
+                self._futures[skin_name] = self._executor.submit(self._decode_skin, skin_name)
+
+    def get(self, skin_name: str):
+        """
+        Return the weights for a skin, waiting for them to be decoded if necessary.
+
+        Skins that were started before this one but not retrieved are considered skipped, and
+        no longer count towards the memory budget.
+
+        Returns:
+            SkinWeights for binary files, a list of vertex weights for text files, or None if
+            the file doesn't contain weights for the skin.
+        """
+        if not self.is_binary:
+            return self._text_future.result().get(skin_name)
+        if skin_name not in self._skin_headers:
+            return None
+
+        with self._memory_cond:
+            if skin_name in self._order:
+                # release any skipped skins, and let this skin be decoded regardless of the budget
+                index = self._order.index(skin_name)
+                skipped, self._order = self._order[:index], self._order[index + 1 :]
+                for name in skipped:
+                    self._futures.pop(name)
+                    self._memory_in_use -= self._held.pop(name, 0)
+                self._waiting_for = skin_name
+                self._memory_cond.notify_all()
+                future = self._futures.pop(skin_name)
+            else:
+                # not started or already skipped
+                future = None
+
+        if future is None:
+            return self._read_skin(skin_name)
+        try:
+            return future.result()
+        finally:
+            with self._memory_cond:
+                self._memory_in_use -= self._held.pop(skin_name, 0)
+                self._waiting_for = None
+                self._memory_cond.notify_all()
+
+    def close(self):
+        """
+        Stop decoding weights and shut down the worker threads.
+        """
+        with self._memory_cond:
+            self._closed = True
+            self._memory_cond.notify_all()
+        for future in self._futures.values():
+            future.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _read_skin(self, skin_name: str) -> skin_weights_io.SkinWeights:
+        # read into memory rather than memory mapping, so the disk reads happen on the worker
+        skin_header = self._skin_headers[skin_name]
+        return skin_weights_io.read_skin_weights(
+            self.file_path, skin_header, self._data_start, self._compression, use_memmap=False
+        )
+
+    def _is_over_budget(self, skin_name: str, size: int) -> bool:
+        if self._closed or skin_name == self._waiting_for or not self._memory_in_use:
+            return False
+        return self._memory_in_use + size > self.max_memory
+
+    def _decode_skin(self, skin_name: str) -> Optional[skin_weights_io.SkinWeights]:
+        size = self._sizes[skin_name]
+        with self._memory_cond:
+            while self._is_over_budget(skin_name, size):
+                self._memory_cond.wait()
+            if self._closed or (skin_name != self._waiting_for and skin_name not in self._order):
+                # shutting down, or skipped by the main thread
+                return None
+            self._memory_in_use += size
+            self._held[skin_name] = size
+        return self._read_skin(skin_name)
 
 
 def smooth_mesh_border_normals(meshes, merge_threshold=0.001):
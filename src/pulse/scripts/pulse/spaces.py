@@ -25,7 +25,7 @@ Space Switching Constraint Setup (2019 and older)
 """
 
 import logging
-from typing import Union
+from typing import Dict, List, Union
 
 import maya.cmds as cmds
 import pymel.core as pm
@@ -41,18 +41,24 @@ SPACE_CONSTRAINT_METACLASS = "pulse_space_con"
 SPACE_SWITCH_ATTR = "space"
 
 
-def get_all_spaces():
+def get_all_spaces(as_handles=False):
     """
     Return a list of all space nodes
+
+    Args:
+        as_handles: Return NodeHandles instead of PyNodes
     """
-    return meta.find_meta_nodes(SPACE_METACLASS)
+    return meta.find_meta_nodes(SPACE_METACLASS, as_handles=as_handles)
 
 
-def get_all_spaces_indexed_by_name():
+def get_all_spaces_indexed_by_name(as_handles=False):
     """
     Return all space nodes in a dict indexed by their space name
+
+    Args:
+        as_handles: Return NodeHandles instead of PyNodes
     """
-    all_space_nodes = get_all_spaces()
+    all_space_nodes = get_all_spaces(as_handles)
     result = {}
     for spaceNode in all_space_nodes:
         space_data = meta.get_metadata(spaceNode, SPACE_METACLASS)
@@ -65,16 +71,19 @@ def is_space(node):
     Return True if the node is a space
 
     Args:
-        node: A PyNode or string node name
+        node: A PyNode, NodeHandle, or string node name
     """
     return meta.has_metaclass(node, SPACE_METACLASS)
 
 
-def get_all_space_constraints():
+def get_all_space_constraints(as_handles=False):
     """
     Return a list of all space constrained nodes
+
+    Args:
+        as_handles: Return NodeHandles instead of PyNodes
     """
-    return meta.find_meta_nodes(SPACE_CONSTRAINT_METACLASS)
+    return meta.find_meta_nodes(SPACE_CONSTRAINT_METACLASS, as_handles=as_handles)
 
 
 def is_space_constraint(node):
@@ -82,7 +91,7 @@ def is_space_constraint(node):
     Return True if the node is space constrained
 
     Args:
-        node: A PyNode or string node name
+        node: A PyNode, NodeHandle, or string node name
     """
     return meta.has_metaclass(node, SPACE_CONSTRAINT_METACLASS)
 
@@ -208,17 +217,113 @@ def _setup_space_constraint_attrs(node, space_names):
     space_attr.setKeyable(True)
 
 
+class SpaceRegistry(object):
+    """
+    An index of space nodes and space constraints, gathered once so that many
+    constraints can be connected without finding and decoding metadata repeatedly.
+
+    Attributes:
+        spaces: A dict of {space name: space node}.
+        constraints: A dict of {space constraint node: decoded space constraint data}.
+        pending: A dict of {space constraint node: [space data]} for the spaces in each
+            constraint that have not been connected yet.
+    """
+
+    def __init__(self):
+        self.spaces: Dict[str, pm.PyNode] = {}
+        self.constraints: Dict[pm.PyNode, dict] = {}
+        self.pending: Dict[pm.PyNode, List[dict]] = {}
+        # constraints whose data has changed and needs to be saved
+        self._modified: List[pm.PyNode] = []
+
+    def load(self, constraint_nodes=None):
+        """
+        Gather all spaces, and the data of space constraints.
+
+        Args:
+            constraint_nodes: The space constraint nodes to index, defaults to all space constraints.
+        """
+        for space_node in get_all_spaces():
+            self.add_space(space_node, meta.get_metadata(space_node, SPACE_METACLASS)["name"])
+
+        if constraint_nodes is None:
+            constraint_nodes = get_all_space_constraints()
+        for node in constraint_nodes:
+            data = meta.get_metadata(node, SPACE_CONSTRAINT_METACLASS)
+            if data:
+                self.add_constraint(node, data)
+
+    def add_space(self, node, name: str):
+        self.spaces[name] = node
+
+    def add_constraint(self, node, data: dict):
+        self.constraints[node] = data
+        pending = [space_data for space_data in data["spaces"] if not space_data["switch"]]
+        if pending:
+            self.pending[node] = pending
+
+    def connect_constraints(self) -> int:
+        """
+        Connect every pending space of all space constraints, then save the updated constraint data.
+
+        Returns:
+            The number of spaces that were connected.
+        """
+        num_connected = 0
+        for node in list(self.pending.keys()):
+            num_connected += self.connect_constraint(node)
+        self.save()
+        return num_connected
+
+    def connect_constraint(self, node) -> int:
+        """
+        Connect the pending spaces of a space constraint. Changes to the constraint's data
+        are not saved until `save` is called.
+
+        Returns:
+            The number of spaces that were connected.
+        """
+        data = self.constraints[node]
+        pending = self.pending.pop(node, [])
+        still_pending = []
+        for space_data in pending:
+            space_node = self.spaces.get(space_data["name"], None)
+            if space_node:
+                _connect_space_to_constraint(data, space_data["index"], space_node)
+                space_data["switch"] = True
+            else:
+                LOG.warning("Space node not found: %s", space_data["name"])
+                still_pending.append(space_data)
+
+        if still_pending:
+            self.pending[node] = still_pending
+        num_connected = len(pending) - len(still_pending)
+        if num_connected:
+            _connect_space_constraint_output(data)
+            self._modified.append(node)
+        return num_connected
+
+    def save(self):
+        """
+        Save the data of all space constraints that have changed.
+        """
+        for node in self._modified:
+            meta.set_metadata(node, SPACE_CONSTRAINT_METACLASS, self.constraints[node])
+        self._modified = []
+
+
 def connect_space_constraints(nodes):
     """
     Create the actual constraints for a list of prepared space constraints.
     This is more efficient than calling connect_space_constraint for each node since all
-    spaces are gathered only once.
-    """
-    space_nodes_by_name = get_all_spaces_indexed_by_name()
+    spaces are gathered only once. Spaces that are already connected are skipped.
 
-    all_constraints = get_all_space_constraints()
-    for constraint in all_constraints:
-        _connect_space_constraint(constraint, space_nodes_by_name)
+    Args:
+        nodes (list of PyNode): The space constraint nodes
+    """
+    registry = SpaceRegistry()
+    registry.load(nodes)
+    registry.connect_constraints()
 
 
 def connect_space_constraint(node):
@@ -233,51 +338,32 @@ def connect_space_constraint(node):
         # TODO: warn
         return
 
-    space_nodes_by_name = get_all_spaces_indexed_by_name()
-    _connect_space_constraint(node, space_nodes_by_name)
+    connect_space_constraints([node])
 
 
-def _connect_space_constraint(node, space_nodes_by_name):
+def _connect_space_constraint_output(data):
     """
-    Connect all spaces defined in the node's space data
-    to the space constraint utility nodes.
+    Connect the output of a space constraint to its follower, once at least one space is connected.
 
     Args:
-        node (PyNode): The space constraint node
-        space_nodes_by_name (dict): A dict of the space
-            nodes index by name.
+        data (dict): The loaded space constraint data from the space constraint node
     """
-    data = meta.get_metadata(node, SPACE_CONSTRAINT_METACLASS)
-    did_connect_any = False
-    for spaceData in data["spaces"]:
-        index = spaceData["index"]
-        # ensure the switch is not already created
-        if not spaceData["switch"]:
-            space_node = space_nodes_by_name.get(spaceData["name"], None)
-            if space_node:
-                _connect_space_to_constraint(data, index, space_node)
-                did_connect_any = True
-            else:
-                LOG.warning("Space node not found: %s", spaceData["name"])
-
-    if did_connect_any:
-        # connect final output now that at least one space is connected
-        # TODO: make sure the space 0 is setup, or whatever the attrs value is
-        follower = data["follower"]
-        use_offset_matrix = data["useOffsetMatrix"]
-
-        if use_offset_matrix:
-            mult_matrix = data["multMatrix"]
-            nodes.connect_matrix(mult_matrix.matrixSum, follower, nodes.ConnectMatrixMethod.CONNECT_ONLY)
-        else:
-            # TODO: support joint matrix constraints that don't disable inheritsTransform,
-            #       or just remove this path altogether
-            decomp = data["decompose"]
-            decomp.outputTranslate >> follower.translate
-            decomp.outputRotate >> follower.rotate
-            decomp.outputScale >> follower.scale
-            # no longer need to inherit transform
-            follower.inheritsTransform.set(False)
+    # TODO: make sure the space 0 is setup, or whatever the attrs value is
+    follower = data["follower"]
+    use_offset_matrix = data["useOffsetMatrix"]
+
+    if use_offset_matrix:
+        mult_matrix = data["multMatrix"]
+        nodes.connect_matrix(mult_matrix.matrixSum, follower, nodes.ConnectMatrixMethod.CONNECT_ONLY)
+    else:
+        # TODO: support joint matrix constraints that don't disable inheritsTransform,
+        #       or just remove this path altogether
+        decomp = data["decompose"]
+        decomp.outputTranslate >> follower.translate
+        decomp.outputRotate >> follower.rotate
+        decomp.outputScale >> follower.scale
+        # no longer need to inherit transform
+        follower.inheritsTransform.set(False)
 
 
 def _connect_space_to_constraint(space_constraint_data, index, space_node):
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import re
+import time
 from abc import ABC
 from copy import copy
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
+import maya.cmds as cmds
 import pymel.core as pm
 
 from . import editor_utils
@@ -49,11 +51,14 @@ class MirrorMode(object):
     ALIGNED = "aligned"
 
 
-def get_all_mirror_nodes():
+def get_all_mirror_nodes(as_handles=False):
     """
     Return all nodes that have mirroring data
+
+    Args:
+        as_handles: Return NodeHandles instead of PyNodes
     """
-    return meta.find_meta_nodes(MIRROR_METACLASS)
+    return meta.find_meta_nodes(MIRROR_METACLASS, as_handles=as_handles)
 
 
 def is_mirror_node(node):
@@ -96,8 +101,133 @@ def cleanup_all_mirror_nodes():
     Remove mirroring metadata from any nodes in the scene
     that are no longer valid (missing their counterpart node).
     """
-    for node in get_all_mirror_nodes():
-        validate_mirror_node(node)
+    MirrorPairingTable().validate_nodes()
+
+
+class MirrorPairingTable(object):
+    """
+    A table of all mirror pairs in the scene, built from a single metaclass query.
+
+    Decodes the mirroring data of every mirror node once, and then provides fast lookups
+    of paired nodes in both directions, as well as validating many pairs at once.
+    Intended to be built once per mirroring operation or build, since it is not
+    updated when pairs are changed by anything other than the table itself.
+    """
+
+    def __init__(self):
+        # {node: other node} the raw pairing data of every mirror node, other node may be None
+        self._pairs: Dict[meta.NodeHandle, Optional[meta.NodeHandle]] = {}
+        self.refresh()
+
+    def refresh(self):
+        """
+        Rebuild the table from all mirror nodes in the scene.
+        """
+        self._pairs = {}
+        for node in get_all_mirror_nodes(as_handles=True):
+            data = meta.get_metadata(node, MIRROR_METACLASS, as_handles=True)
+            self._pairs[node] = data.get("otherNode")
+
+    def __len__(self):
+        return len(self._pairs)
+
+    def _is_pair_valid(self, node: meta.NodeHandle) -> bool:
+        """
+        Return True if a node's pairing is reciprocated by its other node.
+        """
+        other_node = self._pairs.get(node)
+        return other_node is not None and self._pairs.get(other_node) == node
+
+    def get_paired_node(self, node, validate=True) -> Optional[pm.PyNode]:
+        """
+        Return the paired node of a node.
+
+        Args:
+            node: A PyNode, NodeHandle, or node name.
+            validate: When true, ensure that the pairing is reciprocated by the other node.
+
+        Returns:
+            The paired PyNode, or None if the node is not paired.
+        """
+        handle = meta.NodeHandle.from_node(node)
+        if handle is None:
+            return
+        other_node = self._pairs.get(handle)
+        if other_node is None:
+            return
+        if validate and self._pairs.get(other_node) != handle:
+            LOG.debug("%s pairing not reciprocated", node)
+            return
+        return other_node.py_node()
+
+    def is_mirror_node(self, node) -> bool:
+        """
+        Return True if a node has mirroring data.
+        """
+        handle = meta.NodeHandle.from_node(node)
+        return handle in self._pairs
+
+    def validate_nodes(self, nodes=None) -> List[meta.NodeHandle]:
+        """
+        Remove mirroring data from any nodes whose pairing is not valid.
+
+        Args:
+            nodes: The list of nodes to validate, or None to validate every mirror node.
+
+        Returns:
+            The list of nodes that were invalid, and had their mirroring data removed.
+        """
+        if nodes is None:
+            handles = list(self._pairs.keys())
+        else:
+            handles = [meta.NodeHandle.from_node(n) for n in nodes]
+            handles = [h for h in handles if h in self._pairs]
+
+        # find all invalid nodes before removing any data, since removing changes validity
+        invalid_nodes = [h for h in handles if not self._is_pair_valid(h)]
+        for node in invalid_nodes:
+            if self._pairs[node] is None:
+                LOG.debug("%s paired node not found, removing mirroring data", node)
+            else:
+                LOG.debug("%s pairing is not reciprocated, removing mirror data", node)
+            meta.remove_metadata(node, MIRROR_METACLASS)
+            del self._pairs[node]
+
+        return invalid_nodes
+
+    def add_pair(self, node_a, node_b):
+        """
+        Record a pair of nodes in the table, e.g. after `pair_mirror_nodes` was called.
+        Does not modify the mirroring data of the nodes.
+        """
+        handle_a = meta.NodeHandle.from_node(node_a)
+        handle_b = meta.NodeHandle.from_node(node_b)
+        self._pairs[handle_a] = handle_b
+        self._pairs[handle_b] = handle_a
+
+
+# the pairing table to use for mirroring BuildActions, see `mirror_pairing_scope`
+_active_pairing_table: Optional[MirrorPairingTable] = None
+
+
+class mirror_pairing_scope(object):
+    """
+    Context manager that shares a MirrorPairingTable with all MirrorActionUtils
+    created within the block, so that mirror pairs are only gathered once, e.g. for a whole build.
+    """
+
+    def __init__(self):
+        self._prev_table: Optional[MirrorPairingTable] = None
+
+    def __enter__(self) -> MirrorPairingTable:
+        global _active_pairing_table
+        self._prev_table = _active_pairing_table
+        _active_pairing_table = MirrorPairingTable()
+        return _active_pairing_table
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _active_pairing_table
+        _active_pairing_table = self._prev_table
 
 
 def pair_mirror_nodes(node_a, node_b):
@@ -272,8 +402,7 @@ def get_best_mirror_mode(node_a, node_b):
     SIMPLE performs a loose check to see if the nodes are
     aligned, and if not, returns the SIMPLE mirroring mode.
     """
-    awm = nodes.get_world_matrix(node_a)
-    bwm = nodes.get_world_matrix(node_b)
+    awm, bwm = nodes.get_world_matrices([node_a, node_b])
     a_axes = nodes.get_closest_aligned_axes(awm)
     b_axes = nodes.get_closest_aligned_axes(bwm)
     if a_axes == b_axes:
@@ -292,6 +421,8 @@ class MirrorOperation(object):
         self._axis: int = 0
         # if set, the custom matrix to use as the base for mirroring
         self._axis_mtx: Optional[pm.dt.Matrix] = None
+        # if set, the table to use when finding paired nodes
+        self._pairing_table: Optional[MirrorPairingTable] = None
 
     @property
     def axis(self):
@@ -307,12 +438,127 @@ class MirrorOperation(object):
     def set_axis_mtx(self, value: Optional[pm.dt.Matrix]):
         self._axis_mtx = value
 
+    def set_pairing_table(self, value: Optional[MirrorPairingTable]):
+        self._pairing_table = value
+
+    def get_paired_node(self, node) -> Optional[pm.PyNode]:
+        """
+        Return the paired node of a node, using the pairing table if one is set.
+        """
+        if self._pairing_table is not None:
+            return self._pairing_table.get_paired_node(node)
+        return get_paired_node(node)
+
     def mirror_node(self, source_node: pm.nt.Transform, dest_node: pm.nt.Transform, is_new_node: bool):
         """
         Implement in subclasses to perform the mirroring operation.
         """
         raise NotImplementedError
 
+    def mirror_nodes(self, pairs: List[Tuple[pm.nt.Transform, pm.nt.Transform]], new_nodes: Set[pm.nt.Transform]):
+        """
+        Perform the mirroring operation on multiple pairs of nodes.
+        Override in subclasses to batch changes for many nodes at once.
+
+        Args:
+            pairs: A list of (source, dest) node pairs, in hierarchical order.
+            new_nodes: The set of dest nodes that were newly created.
+        """
+        for source_node, dest_node in pairs:
+            self.mirror_node(source_node, dest_node, dest_node in new_nodes)
+
+    def ensure_nodes(self, pairs: List[Tuple[pm.nt.Transform, pm.nt.Transform]]):
+        """
+        Called with every mirrored pair after all operations have run, including pairs without
+        any planned changes. Override in subclasses to repair state that must always be kept in sync.
+
+        Args:
+            pairs: A list of (source, dest) node pairs, in hierarchical order.
+        """
+        pass
+
+    def plan_node(
+        self, source_node: pm.nt.Transform, dest_node: Optional[pm.nt.Transform], is_new_node: bool
+    ) -> Optional[MirrorChange]:
+        """
+        Return the change that `mirror_node` would make, without modifying the scene.
+        The default implementation assumes every node will change.
+
+        Args:
+            source_node: The node to mirror from.
+            dest_node: The node to mirror to, or None if it will be created.
+            is_new_node: Will the destination node be newly created?
+
+        Returns:
+            A MirrorChange, or None if the operation would not change the destination node.
+        """
+        return MirrorChange(source_node, dest_node)
+
+
+class MirrorChange(object):
+    """
+    A change that a MirrorOperation would make to a destination node.
+    """
+
+    def __init__(self, source_node, dest_node, old_value=None, new_value=None):
+        # the node to mirror from
+        self.source_node = source_node
+        # the node to mirror to, or None if it will be created
+        self.dest_node = dest_node
+        # optional description of the current and new values, depending on the operation
+        self.old_value = old_value
+        self.new_value = new_value
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} ({self.source_node} -> {self.dest_node}: {self.new_value})>"
+
+
+class MirrorPlan(object):
+    """
+    A preview of all changes that a MirrorUtil would make to mirror a set of nodes.
+    Created with `MirrorUtil.plan` without modifying the scene, and applied with `MirrorUtil.apply_plan`.
+    """
+
+    def __init__(self):
+        # the table of mirror pairs that existed when the plan was created
+        self.pairing_table: Optional[MirrorPairingTable] = None
+        # the filtered and expanded list of nodes to mirror
+        self.source_nodes: List[pm.nt.Transform] = []
+        # list of (source, dest) pairs, dest is None if it will be created
+        self.pairs: List[Tuple[pm.nt.Transform, Optional[pm.nt.Transform]]] = []
+        # source nodes that will have a new pair node created
+        self.nodes_to_create: List[pm.nt.Transform] = []
+        # source nodes that have no pair, and will be skipped since creation is not allowed
+        self.unpaired_nodes: List[pm.nt.Transform] = []
+        # {operation: list of MirrorChange} the changes each operation would make
+        self.changes: Dict[MirrorOperation, List[MirrorChange]] = {}
+        # the time in seconds it took to create the plan
+        self.plan_time = 0.0
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.get_counts()}>"
+
+    def get_changes(self, operation: MirrorOperation) -> List[MirrorChange]:
+        """
+        Return the changes an operation would make.
+        """
+        return self.changes.get(operation, [])
+
+    def get_counts(self) -> Dict[str, int]:
+        """
+        Return the estimated number of pairs, created nodes, and changes for each operation.
+        Operation counts are keyed by class name.
+        """
+        result = {
+            "pairs": len(self.pairs),
+            "create": len(self.nodes_to_create),
+            "unpaired": len(self.unpaired_nodes),
+        }
+        for operation, changes in self.changes.items():
+            op_name = operation.__class__.__name__
+            result[op_name] = result.get(op_name, 0) + len(changes)
+        return result
+
 
 class MirrorParenting(MirrorOperation):
     """
@@ -335,27 +581,58 @@ class MirrorParenting(MirrorOperation):
         so that segment scale compensate still works.
         """
         with preserved_selection():
-            # get parent of source node
-            if self.findCenteredJoints and isinstance(source_node, pm.nt.Joint):
-                src_parent = get_mirrored_or_centered_parent(source_node, self.axis)
+            dst_parent = self._get_dest_parent(source_node)
+            if dst_parent:
+                self._set_parent(dest_node, dst_parent)
             else:
-                src_parent = source_node.getParent()
+                self._set_parent(dest_node, self._get_source_parent(source_node))
 
-            if src_parent:
-                dst_parent = get_paired_node(src_parent)
-                if dst_parent:
-                    self._set_parent(dest_node, dst_parent)
-                else:
-                    self._set_parent(dest_node, src_parent)
-            else:
-                self._set_parent(dest_node, None)
+            self._connect_inverse_scale(dest_node)
 
-            # handle joint re-parenting
-            if isinstance(dest_node, pm.nt.Joint):
-                p = dest_node.getParent()
-                if p and isinstance(p, pm.nt.Joint):
-                    if not pm.isConnected(p.scale, dest_node.inverseScale):
-                        p.scale >> dest_node.inverseScale
+    def ensure_nodes(self, pairs: List[Tuple[pm.nt.Transform, pm.nt.Transform]]):
+        # joints may be missing inverse scale connections even if their parent doesn't change
+        for _, dest_node in pairs:
+            self._connect_inverse_scale(dest_node)
+
+    @staticmethod
+    def _connect_inverse_scale(node: pm.nt.Transform):
+        """
+        Connect the scale of a joint's parent joint to its inverse scale,
+        so that segment scale compensate still works.
+        """
+        if isinstance(node, pm.nt.Joint):
+            p = node.getParent()
+            if p and isinstance(p, pm.nt.Joint):
+                if not pm.isConnected(p.scale, node.inverseScale):
+                    p.scale >> node.inverseScale
+
+    def plan_node(
+        self, source_node: pm.nt.Transform, dest_node: Optional[pm.nt.Transform], is_new_node: bool
+    ) -> Optional[MirrorChange]:
+        src_parent = self._get_source_parent(source_node)
+        dst_parent = self._get_dest_parent(source_node)
+        if src_parent and not dst_parent:
+            # the parent may be paired with a node created during the same mirror
+            return MirrorChange(source_node, dest_node, new_value=src_parent)
+        if dest_node is None or dest_node.getParent() != dst_parent:
+            old_parent = dest_node.getParent() if dest_node else None
+            return MirrorChange(source_node, dest_node, old_parent, dst_parent)
+
+    def _get_source_parent(self, source_node: pm.nt.Transform) -> Optional[pm.nt.Transform]:
+        """
+        Return the parent of a source node, finding centered parents for joints if enabled.
+        """
+        if self.findCenteredJoints and isinstance(source_node, pm.nt.Joint):
+            return get_mirrored_or_centered_parent(source_node, self.axis)
+        return source_node.getParent()
+
+    def _get_dest_parent(self, source_node: pm.nt.Transform) -> Optional[pm.nt.Transform]:
+        """
+        Return the paired node of a source node's parent.
+        """
+        src_parent = self._get_source_parent(source_node)
+        if src_parent:
+            return self.get_paired_node(src_parent)
 
     @staticmethod
     def _set_parent(node, parent):
@@ -404,12 +681,36 @@ class MirrorTransforms(MirrorOperation):
         if mirror_data:
             apply_mirror_data(mirror_data)
 
-    def _prepare_flip(self, source_node, dest_node):
+    def mirror_nodes(self, pairs: List[Tuple[pm.nt.Transform, pm.nt.Transform]], new_nodes: Set[pm.nt.Transform]):
+        """
+        Move multiple nodes to the mirrored positions of their source nodes,
+        gathering all mirror data first and then applying it in one batch.
+        """
+        world_matrices = self._get_world_matrices([source_node for source_node, _ in pairs])
+        mirror_data_list = []
+        for source_node, dest_node in pairs:
+            if self.params.mirror_rotate_order:
+                dest_node.rotateOrder.set(source_node.rotateOrder.get())
+            mirror_data = get_mirror_data(source_node, dest_node, self.params, world_matrices.get(source_node))
+            if mirror_data:
+                mirror_data_list.append(mirror_data)
+        apply_mirror_data_list(mirror_data_list)
+
+    def _get_world_matrices(self, nodes_to_read) -> Dict[pm.nt.Transform, pm.dt.TransformationMatrix]:
+        """
+        Return the world matrices of all non-joint nodes in one batch, for use with `get_mirror_data`.
+        """
+        transforms = [node for node in nodes_to_read if not isinstance(node, pm.nt.Joint)]
+        return dict(zip(transforms, nodes.get_world_matrices(transforms)))
+
+    def _prepare_flip(self, source_node, dest_node, world_matrices=None):
         """
         Return settings gathered in preparation for flipping two nodes.
         """
-        source_to_dest_data = get_mirror_data(source_node, dest_node, self.params)
-        dest_to_source_data = get_mirror_data(dest_node, source_node, self.params)
+        if world_matrices is None:
+            world_matrices = {}
+        source_to_dest_data = get_mirror_data(source_node, dest_node, self.params, world_matrices.get(source_node))
+        dest_to_source_data = get_mirror_data(dest_node, source_node, self.params, world_matrices.get(dest_node))
         return source_to_dest_data, dest_to_source_data
 
     def _apply_flip(self, flip_data):
@@ -419,8 +720,7 @@ class MirrorTransforms(MirrorOperation):
         """
         source_to_dest_data, dest_to_source_data = flip_data
         if source_to_dest_data and dest_to_source_data:
-            apply_mirror_data(source_to_dest_data)
-            apply_mirror_data(dest_to_source_data)
+            apply_mirror_data_list([source_to_dest_data, dest_to_source_data])
 
     def flip(self, source_node, dest_node):
         """
@@ -438,13 +738,17 @@ class MirrorTransforms(MirrorOperation):
         Args:
             node_pairs: A list of (source, dest) node pairs to flip.
         """
+        world_matrices = self._get_world_matrices([node for pair in node_pairs for node in pair])
         flip_data_list = []
         for source_node, dest_node in node_pairs:
-            flip_data = self._prepare_flip(source_node, dest_node)
+            flip_data = self._prepare_flip(source_node, dest_node, world_matrices)
             flip_data_list.append(flip_data)
 
-        for flip_data in flip_data_list:
-            self._apply_flip(flip_data)
+        mirror_data_list = []
+        for source_to_dest_data, dest_to_source_data in flip_data_list:
+            if source_to_dest_data and dest_to_source_data:
+                mirror_data_list.extend([source_to_dest_data, dest_to_source_data])
+        apply_mirror_data_list(mirror_data_list)
 
     def flip_center(self, nodes):
         """
@@ -461,10 +765,9 @@ class MirrorTransforms(MirrorOperation):
             mirror_data = get_mirror_data(node, node, params)
             all_mirror_data.append(mirror_data)
 
-        # TODO: attempt to automatically handle parent/child relationships
+        # TODO: attempt to automatically handle parent/child relationships of joints
         #       to lift the requirement of giving nodes in hierarchical order
-        for mirror_data in all_mirror_data:
-            apply_mirror_data(mirror_data)
+        apply_mirror_data_list([data for data in all_mirror_data if data])
 
 
 class MirrorCurveShapes(MirrorOperation):
@@ -494,6 +797,14 @@ class MirrorCurveShapes(MirrorOperation):
             self.replace_curve_shapes(source_node, dest_node)
             MirrorCurveShapes.flip_all_curve_shapes(dest_node, self.axis, self.mirrorMode)
 
+    def plan_node(
+        self, source_node: pm.nt.Transform, dest_node: Optional[pm.nt.Transform], is_new_node: bool
+    ) -> Optional[MirrorChange]:
+        if is_new_node:
+            return MirrorChange(source_node, dest_node, new_value="flip")
+        elif self.replaceExistingShapes:
+            return MirrorChange(source_node, dest_node, new_value="replace")
+
     @staticmethod
     def flip_all_curve_shapes(node, axis=0, mirrorMode=MirrorMode.SIMPLE):
         """
@@ -556,6 +867,16 @@ class MirrorJointDisplay(MirrorOperation):
         if source_node.type() == "joint" and dest_node.type() == "joint":
             dest_node.radius.set(source_node.radius.get())
 
+    def plan_node(
+        self, source_node: pm.nt.Transform, dest_node: Optional[pm.nt.Transform], is_new_node: bool
+    ) -> Optional[MirrorChange]:
+        if source_node.type() != "joint":
+            return
+        if dest_node is None:
+            return MirrorChange(source_node, dest_node, new_value=source_node.radius.get())
+        if dest_node.type() == "joint" and dest_node.radius.get() != source_node.radius.get():
+            return MirrorChange(source_node, dest_node, dest_node.radius.get(), source_node.radius.get())
+
 
 class BlueprintMirrorOperation(MirrorOperation, ABC):
     """
@@ -655,6 +976,14 @@ class MirrorNames(BlueprintMirrorOperation):
         dest_name = _get_mirrored_name_with_replacements(name, self._get_replacements())
         dest_node.rename(dest_name)
 
+    def plan_node(
+        self, source_node: pm.nt.Transform, dest_node: Optional[pm.nt.Transform], is_new_node: bool
+    ) -> Optional[MirrorChange]:
+        dest_name = _get_mirrored_name_with_replacements(source_node.nodeName(), self._get_replacements())
+        old_name = dest_node.nodeName() if dest_node else None
+        if old_name != dest_name:
+            return MirrorChange(source_node, dest_node, old_name, dest_name)
+
 
 class MirrorColors(BlueprintMirrorOperation):
     """
@@ -676,7 +1005,10 @@ class MirrorColors(BlueprintMirrorOperation):
             self._replacements = _generate_mirror_name_replacements(self.get_config())
         return self._replacements
 
-    def mirror_node(self, source_node: pm.nt.Transform, dest_node: pm.nt.Transform, is_new_node: bool):
+    def _get_dest_color(self, source_node: pm.nt.Transform):
+        """
+        Return the mirrored override color for a source node, or None if it has no mirrored color.
+        """
         source_color = nodes.get_override_color(source_node)
         if source_color:
             # get name of source color
@@ -685,9 +1017,22 @@ class MirrorColors(BlueprintMirrorOperation):
                 # mirror the name
                 dest_name = _get_mirrored_name_with_replacements(source_name, self._get_replacements())
                 # get color of mirrored name
-                dest_color = editor_utils.get_named_color(dest_name)
-                if dest_color:
-                    nodes.set_override_color(dest_node, tuple(dest_color))
+                return editor_utils.get_named_color(dest_name)
+
+    def mirror_node(self, source_node: pm.nt.Transform, dest_node: pm.nt.Transform, is_new_node: bool):
+        dest_color = self._get_dest_color(source_node)
+        if dest_color:
+            nodes.set_override_color(dest_node, tuple(dest_color))
+
+    def plan_node(
+        self, source_node: pm.nt.Transform, dest_node: Optional[pm.nt.Transform], is_new_node: bool
+    ) -> Optional[MirrorChange]:
+        dest_color = self._get_dest_color(source_node)
+        if not dest_color:
+            return
+        old_color = nodes.get_override_color(dest_node) if dest_node else None
+        if old_color != dest_color:
+            return MirrorChange(source_node, dest_node, old_color, dest_color)
 
 
 class MirrorLinks(BlueprintMirrorOperation):
@@ -710,7 +1055,7 @@ class MirrorLinks(BlueprintMirrorOperation):
 
             source_target_nodes = source_link_data.get("targetNodes")
             if source_target_nodes:
-                dest_target_nodes = [get_paired_node(n) for n in source_target_nodes]
+                dest_target_nodes = [self.get_paired_node(n) for n in source_target_nodes]
                 if dest_target_nodes:
                     dest_link_data["targetNodes"] = dest_target_nodes
                     links.set_link_meta_data(dest_node, dest_link_data)
@@ -722,6 +1067,18 @@ class MirrorLinks(BlueprintMirrorOperation):
             # remove link data from dest node
             links.unlink(dest_node)
 
+    def plan_node(
+        self, source_node: pm.nt.Transform, dest_node: Optional[pm.nt.Transform], is_new_node: bool
+    ) -> Optional[MirrorChange]:
+        source_link_data = links.get_link_meta_data(source_node)
+        if source_link_data:
+            source_target_nodes = source_link_data.get("targetNodes", [])
+            dest_target_nodes = [self.get_paired_node(n) for n in source_target_nodes]
+            return MirrorChange(source_node, dest_node, new_value=dest_target_nodes)
+        elif dest_node and links.is_linked(dest_node):
+            # the link will be removed
+            return MirrorChange(source_node, dest_node, new_value=None)
+
 
 class MirrorUtil(object):
     """
@@ -757,6 +1114,9 @@ class MirrorUtil(object):
         # after creating node pairs, but before run() has finished
         self._new_nodes = []
 
+        # the table of mirror pairs, gathered once at the start of each run
+        self.pairing_table: Optional[MirrorPairingTable] = None
+
     def add_operation(self, operation):
         self._operations.append(operation)
 
@@ -764,15 +1124,89 @@ class MirrorUtil(object):
         """
         Run all mirror operations on the given source nodes.
         """
-        filtered_nodes = self.gather_nodes(source_nodes)
-        pairs = self.create_node_pairs(filtered_nodes)
+        self.apply_plan(self.plan(source_nodes))
+
+    def plan(self, source_nodes) -> MirrorPlan:
+        """
+        Return a MirrorPlan describing all the changes that mirroring the source nodes would make,
+        without modifying the scene. Does not validate pairing data or create any nodes.
+        Plans are not cached, since any scene change or undo can make them stale.
+
+        Args:
+            source_nodes: The nodes to mirror, usually the current selection.
+        """
+        start_time = time.perf_counter()
+        plan = MirrorPlan()
+        plan.pairing_table = MirrorPairingTable()
+        plan.source_nodes = self.gather_nodes(source_nodes)
+
+        for source_node in plan.source_nodes:
+            dest_node = plan.pairing_table.get_paired_node(source_node)
+            if dest_node:
+                plan.pairs.append((source_node, dest_node))
+            elif self.is_creation_allowed:
+                plan.pairs.append((source_node, None))
+                plan.nodes_to_create.append(source_node)
+            else:
+                plan.unpaired_nodes.append(source_node)
+
         for operation in self._operations:
-            # ensure consistent mirroring settings for all operations
-            self.configure_operation(operation)
-            for pair in pairs:
-                is_new_node = pair[1] in self._new_nodes
-                operation.mirror_node(pair[0], pair[1], is_new_node)
-        self._new_nodes = []
+            self.configure_operation(operation, plan.pairing_table)
+            changes = []
+            for source_node, dest_node in plan.pairs:
+                change = operation.plan_node(source_node, dest_node, dest_node is None)
+                if change:
+                    changes.append(change)
+            plan.changes[operation] = changes
+            operation.set_pairing_table(None)
+
+        plan.plan_time = time.perf_counter() - start_time
+        LOG.debug("Created mirror plan in %.3fs: %s", plan.plan_time, plan)
+        return plan
+
+    def apply_plan(self, plan: MirrorPlan):
+        """
+        Apply a MirrorPlan, creating any new nodes and then running each operation
+        on only the pairs it will change, as a single undoable operation.
+        """
+        start_time = time.perf_counter()
+        self.pairing_table = plan.pairing_table
+
+        cmds.undoInfo(openChunk=True, chunkName="Mirror")
+        try:
+            if self.validate_nodes:
+                self.pairing_table.validate_nodes(plan.source_nodes)
+
+            pairs = []
+            for source_node, dest_node in plan.pairs:
+                if dest_node is None:
+                    dest_node = duplicate_and_pair_node(source_node)
+                    self.pairing_table.add_pair(source_node, dest_node)
+                    self._new_nodes.append(dest_node)
+                pairs.append((source_node, dest_node))
+            for source_node in plan.unpaired_nodes:
+                LOG.warning("Could not get pair node for: %s", source_node)
+
+            new_nodes = set(self._new_nodes)
+            for operation in self._operations:
+                changed_nodes = set(change.source_node for change in plan.get_changes(operation))
+                op_pairs = [pair for pair in pairs if pair[0] in changed_nodes]
+                if op_pairs:
+                    # ensure consistent mirroring settings for all operations
+                    self.configure_operation(operation)
+                    operation.mirror_nodes(op_pairs, new_nodes)
+                    operation.set_pairing_table(None)
+
+            for operation in self._operations:
+                self.configure_operation(operation)
+                operation.ensure_nodes(pairs)
+                operation.set_pairing_table(None)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+            self._new_nodes = []
+            self.pairing_table = None
+
+        LOG.debug("Applied mirror plan in %.3fs", time.perf_counter() - start_time)
 
     def should_mirror_node(self, source_node) -> bool:
         """
@@ -788,12 +1222,13 @@ class MirrorUtil(object):
 
         return True
 
-    def configure_operation(self, operation: MirrorOperation):
+    def configure_operation(self, operation: MirrorOperation, pairing_table: Optional[MirrorPairingTable] = None):
         """
         Configure a MirrorOperation instance.
         """
         operation.set_axis(self.axis)
         operation.set_axis_mtx(self.axis_mtx)
+        operation.set_pairing_table(pairing_table if pairing_table is not None else self.pairing_table)
 
     def gather_nodes(self, source_nodes):
         """
@@ -829,16 +1264,19 @@ class MirrorUtil(object):
         """
         pairs = []
 
-        for source_node in source_nodes:
-            if self.validate_nodes:
-                validate_mirror_node(source_node)
+        if self.pairing_table is None:
+            self.pairing_table = MirrorPairingTable()
 
+        if self.validate_nodes:
+            self.pairing_table.validate_nodes(source_nodes)
+
+        for source_node in source_nodes:
             if self.is_creation_allowed:
                 dest_node, is_new_node = self._get_or_create_pair_node(source_node)
                 if dest_node and is_new_node:
                     self._new_nodes.append(dest_node)
             else:
-                dest_node = get_paired_node(source_node)
+                dest_node = self.pairing_table.get_paired_node(source_node)
 
             if dest_node:
                 pairs.append((source_node, dest_node))
@@ -855,11 +1293,16 @@ class MirrorUtil(object):
         Returns:
             The pair node (PyNode), and a bool that is True if the node was just created, False otherwise.
         """
-        dest_node = get_paired_node(source_node)
+        if self.pairing_table is not None:
+            dest_node = self.pairing_table.get_paired_node(source_node)
+        else:
+            dest_node = get_paired_node(source_node)
         if dest_node:
             return dest_node, False
         else:
             dest_node = duplicate_and_pair_node(source_node)
+            if self.pairing_table is not None:
+                self.pairing_table.add_pair(source_node, dest_node)
             return dest_node, True
 
     def get_or_create_pair_node(self, source_node) -> pm.nt.Transform:
@@ -917,7 +1360,10 @@ class MirrorData(object):
 
 
 def get_mirror_data(
-    source_node: pm.nt.Transform, dest_node: pm.nt.Transform = None, params: MirrorParams = None
+    source_node: pm.nt.Transform,
+    dest_node: pm.nt.Transform = None,
+    params: MirrorParams = None,
+    world_matrix: pm.dt.TransformationMatrix = None,
 ) -> Optional[MirrorData]:
     """
     Return a MirrorData object that represents mirroring to apply from a source node to a target node.
@@ -926,6 +1372,7 @@ def get_mirror_data(
         source_node: The source node of the mirroring.
         dest_node: The destination node that would be updated to match the source node.
         params: The parameters controlling how to perform mirroring.
+        world_matrix: The world matrix of the source node if already known, see `nodes.get_world_matrices`.
 
     Returns:
         A MirrorData object.
@@ -944,7 +1391,7 @@ def get_mirror_data(
     out_params = copy(params)
 
     result = MirrorData(source_node, dest_node, out_params)
-    result.matrices = get_mirrored_matrices(source_node, params=out_params)
+    result.matrices = get_mirrored_matrices(source_node, params=out_params, world_matrix=world_matrix)
 
     # gather mirrored attributes from custom expressions
     for attr_name, expression in params.custom_mirror_attr_exps.items():
@@ -970,21 +1417,51 @@ def apply_mirror_data(mirror_data: MirrorData):
     """
     Apply MirrorData matrices or attribute values to it's destination node.
     """
-    LOG.debug("Applying Mirror Settings: %s", mirror_data)
-    params = mirror_data.params
-    if any([params.affect_translate, params.affect_rotate, params.affect_scale]):
-        set_mirrored_matrices(
-            mirror_data.dest_node,
-            mirror_data.matrices,
-            translate=params.affect_translate,
-            rotate=params.affect_rotate,
-            scale=params.affect_scale,
-        )
+    apply_mirror_data_list([mirror_data])
+
+
+def apply_mirror_data_list(mirror_data_list: List[MirrorData]):
+    """
+    Apply the matrices and attribute values of multiple MirrorData objects as a single undoable operation.
+
+    Transform matrices are set together using `nodes.set_world_matrices`, which updates parents
+    before children. Joints are updated individually in the order given, so any joints
+    should be given in hierarchical order.
+    """
+    cmds.undoInfo(openChunk=True, chunkName="Apply Mirror Data")
+    try:
+        # consecutive transform matrices to apply together
+        world_matrix_items = []
+        for mirror_data in mirror_data_list:
+            LOG.debug("Applying Mirror Settings: %s", mirror_data)
+            params = mirror_data.params
+            components = (params.affect_translate, params.affect_rotate, params.affect_scale)
+            if not any(components):
+                continue
+
+            if mirror_data.matrices["type"] == "node":
+                world_matrix_items.append((mirror_data.dest_node, mirror_data.matrices["matrices"][0], components))
+            else:
+                # apply pending transforms first in case they are parents of this joint
+                if world_matrix_items:
+                    nodes.set_world_matrices(world_matrix_items)
+                    world_matrix_items = []
+                set_mirrored_matrices(mirror_data.dest_node, mirror_data.matrices, *components)
 
-    if params.affect_attrs:
+        if world_matrix_items:
+            nodes.set_world_matrices(world_matrix_items)
+
+        for mirror_data in mirror_data_list:
+            _apply_mirror_data_attrs(mirror_data)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+def _apply_mirror_data_attrs(mirror_data: MirrorData):
+    if mirror_data.params.affect_attrs:
         for attr_name, val in mirror_data.attrs.items():
             LOG.debug("%s -> %s", attr_name, val)
-            attr = mirror_data["destNode"].attr(attr_name)
+            attr = mirror_data.dest_node.attr(attr_name)
             attr.set(val)
 
 
@@ -1014,7 +1491,7 @@ def eval_custom_mirror_attr_exp(source_node, dest_node, attr, exp):
     return result
 
 
-def get_mirrored_matrices(node, params: MirrorParams) -> dict:
+def get_mirrored_matrices(node, params: MirrorParams, world_matrix: pm.dt.TransformationMatrix = None) -> dict:
     """
     Return the mirrored matrix or matrices for the given node
     Automatically handles Transform vs. Joint differences
@@ -1022,6 +1499,7 @@ def get_mirrored_matrices(node, params: MirrorParams) -> dict:
     Args:
         node: The node whose matrices should be mirrored.
         params: The params defining how to mirror the node.
+        world_matrix: The world matrix of the node if already known, ignored for joints.
 
     Returns:
         A dict with a 'type' key ('node' or 'joint'), and the corresponding mirrored matrices.
@@ -1032,7 +1510,7 @@ def get_mirrored_matrices(node, params: MirrorParams) -> dict:
         jnt_matrices = joints.get_joint_matrices(node)
         result["matrices"] = get_mirrored_joint_matrices(*jnt_matrices, params=params)
     else:
-        node_wm = nodes.get_world_matrix(node)
+        node_wm = world_matrix if world_matrix is not None else nodes.get_world_matrix(node)
         result["type"] = "node"
         result["matrices"] = [get_mirrored_transform_matrix(node_wm, params=params)]
     return result
@@ -1175,8 +1653,17 @@ class MirrorActionUtil(object):
     A util class for mirroring BuildAction data.
     """
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, pairing_table: MirrorPairingTable = None):
         self.config = config
+        # the table of mirror pairs, uses the table from `mirror_pairing_scope` if one is active,
+        # otherwise one is gathered when first needed
+        self._pairing_table = pairing_table if pairing_table is not None else _active_pairing_table
+
+    @property
+    def pairing_table(self) -> MirrorPairingTable:
+        if self._pairing_table is None:
+            self._pairing_table = MirrorPairingTable()
+        return self._pairing_table
 
     def mirror_action(self, src_action: BuildActionProxy, dst_action: BuildActionProxy):
         """
@@ -1237,7 +1724,7 @@ class MirrorActionUtil(object):
             """
             Return the paired node of a node, if one exists, otherwise return the node.
             """
-            paired_node = get_paired_node(node)
+            paired_node = self.pairing_table.get_paired_node(node)
             if paired_node:
                 return paired_node
             return node
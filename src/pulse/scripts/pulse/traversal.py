@@ -0,0 +1,238 @@
+"""
+Utils for traversing DAG hierarchies using the API.
+
+Functions in this module work with MDagPaths so that a whole hierarchy can be gathered
+in a single native iteration, and only convert to PyNodes at the boundary, see `to_py_nodes`.
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import maya.api.OpenMaya as om2
+import pymel.core as pm
+
+# API function set types for common node type names, used when filtering by node type
+NODE_TYPE_FN_TYPES = {
+    "transform": om2.MFn.kTransform,
+    "joint": om2.MFn.kJoint,
+    "shape": om2.MFn.kShape,
+    "mesh": om2.MFn.kMesh,
+    "nurbsCurve": om2.MFn.kNurbsCurve,
+    "nurbsSurface": om2.MFn.kNurbsSurface,
+    "locator": om2.MFn.kLocator,
+    "constraint": om2.MFn.kConstraint,
+}
+
+
+def get_dag_path(node) -> Optional[om2.MDagPath]:
+    """
+    Return the MDagPath of a node, or None if the node is not a dag node or does not exist.
+
+    Args:
+        node: A PyNode, MDagPath, or string node name.
+    """
+    if isinstance(node, om2.MDagPath):
+        return node
+    sel = om2.MSelectionList()
+    try:
+        sel.add(str(node))
+        return sel.getDagPath(0)
+    except (RuntimeError, TypeError):
+        return None
+
+
+def to_py_nodes(dag_paths: Iterable[om2.MDagPath]) -> List[pm.PyNode]:
+    """
+    Return a list of PyNodes for a list of MDagPaths.
+    """
+    return [pm.PyNode(dag_path.fullPathName()) for dag_path in dag_paths]
+
+
+def get_fn_types(node_types: Union[str, Sequence[str], None]) -> Optional[List[int]]:
+    """
+    Return the list of API function set types for one or more node type names.
+
+    Raises:
+        ValueError: If a node type is not in `NODE_TYPE_FN_TYPES`.
+    """
+    if node_types is None:
+        return None
+    if isinstance(node_types, str):
+        node_types = [node_types]
+    fn_types = []
+    for node_type in node_types:
+        if node_type not in NODE_TYPE_FN_TYPES:
+            raise ValueError(f"Unsupported node type for traversal: {node_type}")
+        fn_types.append(NODE_TYPE_FN_TYPES[node_type])
+    return fn_types
+
+
+def _has_any_fn(dag_path: om2.MDagPath, fn_types: Optional[List[int]]) -> bool:
+    return fn_types is None or any(dag_path.node().hasFn(fn_type) for fn_type in fn_types)
+
+
+def iter_descendants(root, fn_types: List[int] = None, include_root=False) -> Iterator[om2.MDagPath]:
+    """
+    Iterate over all descendants of a node from top to bottom, so that parents always come before their children.
+
+    Args:
+        root: A PyNode, MDagPath, or string node name.
+        fn_types: A list of MFn types, if given only descendants that have one of the function sets are returned.
+            All descendants are still traversed, regardless of their type.
+        include_root: If true, include the root node itself.
+    """
+    root_path = get_dag_path(root)
+    if root_path is None:
+        return
+    it = om2.MItDag()
+    it.reset(root_path, om2.MItDag.kDepthFirst, om2.MFn.kInvalid)
+    if not include_root:
+        # the root is always the first item
+        it.next()
+    while not it.isDone():
+        dag_path = it.getPath()
+        if _has_any_fn(dag_path, fn_types):
+            yield dag_path
+        it.next()
+
+
+def get_descendants(root, fn_types: List[int] = None, include_root=False) -> List[om2.MDagPath]:
+    """
+    Return all descendants of a node from top to bottom, see `iter_descendants`.
+    """
+    return list(iter_descendants(root, fn_types, include_root))
+
+
+def get_ancestors(node, include_node=False) -> List[om2.MDagPath]:
+    """
+    Return all parents of a node, from the immediate parent to the top-most parent.
+
+    Args:
+        node: A PyNode, MDagPath, or string node name.
+        include_node: If true, include the node itself as the first item.
+    """
+    dag_path = get_dag_path(node)
+    if dag_path is None:
+        return []
+    result = [dag_path] if include_node else []
+    dag_path = om2.MDagPath(dag_path)
+    while dag_path.length() > 1:
+        dag_path.pop()
+        result.append(om2.MDagPath(dag_path))
+    return result
+
+
+def get_top_nodes(nodes: Sequence) -> list:
+    """
+    Return the nodes from a list that do not have any of their parents in the list, keeping their order.
+
+    Args:
+        nodes: A list of PyNodes or string node names.
+    """
+    full_paths = []
+    for node in nodes:
+        dag_path = get_dag_path(node)
+        full_paths.append(dag_path.fullPathName() if dag_path else None)
+    path_set = set(p for p in full_paths if p)
+
+    result = []
+    for node, full_path in zip(nodes, full_paths):
+        if full_path:
+            parts = full_path.split("|")
+            if any("|".join(parts[:i]) in path_set for i in range(2, len(parts))):
+                continue
+        result.append(node)
+    return result
+
+
+def get_first_descendants(root, fn_types: List[int]) -> List[om2.MDagPath]:
+    """
+    Return the first descendants of each branch below a node that have one of the function sets,
+    without traversing below them.
+
+    Args:
+        root: A PyNode, MDagPath, or string node name.
+        fn_types: A list of MFn types to find.
+    """
+    root_path = get_dag_path(root)
+    if root_path is None:
+        return []
+    result = []
+    it = om2.MItDag()
+    it.reset(root_path, om2.MItDag.kDepthFirst, om2.MFn.kInvalid)
+    it.next()
+    while not it.isDone():
+        dag_path = it.getPath()
+        if _has_any_fn(dag_path, fn_types):
+            result.append(dag_path)
+            it.prune()
+        it.next()
+    return result
+
+
+def get_leaf_descendants(root, fn_type: int, include_root=True) -> List[om2.MDagPath]:
+    """
+    Return the nodes below a node that have no children of the same type, only
+    traversing through nodes of that type.
+
+    Args:
+        root: A PyNode, MDagPath, or string node name.
+        fn_type: The MFn type to traverse, e.g. om2.MFn.kJoint.
+        include_root: If true, the root can be returned when it has no children of the type.
+    """
+    root_path = get_dag_path(root)
+    if root_path is None:
+        return []
+    result = []
+    it = om2.MItDag()
+    it.reset(root_path, om2.MItDag.kDepthFirst, om2.MFn.kInvalid)
+    while not it.isDone():
+        dag_path = it.getPath()
+        is_root = dag_path == root_path
+        if not is_root and not dag_path.node().hasFn(fn_type):
+            it.prune()
+        elif not any(dag_path.child(i).hasFn(fn_type) for i in range(dag_path.childCount())):
+            if include_root or not is_root:
+                result.append(dag_path)
+        it.next()
+    return result
+
+
+class AncestorLookup(object):
+    """
+    Finds the nearest ancestor of nodes that matches a predicate, remembering the result for every
+    node visited along the way so that nodes in the same hierarchy are only checked once.
+
+    Results are cached by full path, so a lookup should only be used while the hierarchy is unchanged,
+    e.g. for the duration of a single operation.
+    """
+
+    def __init__(self, predicate: Callable[[om2.MDagPath], bool]):
+        """
+        Args:
+            predicate: A function that takes an MDagPath and returns True if it is a match.
+        """
+        self.predicate = predicate
+        # {full path: full path of the matching ancestor or None}
+        self._results: Dict[str, Optional[str]] = {}
+
+    def find(self, node) -> Optional[str]:
+        """
+        Return the full path of the nearest matching ancestor of a node, including the node itself.
+
+        Args:
+            node: A PyNode, MDagPath, or string node name.
+        """
+        visited = []
+        result = None
+        for dag_path in get_ancestors(node, include_node=True):
+            full_path = dag_path.fullPathName()
+            if full_path in self._results:
+                result = self._results[full_path]
+                break
+            visited.append(full_path)
+            if self.predicate(dag_path):
+                result = full_path
+                break
+        for full_path in visited:
+            self._results[full_path] = result
+        return result
@@ -19,7 +19,7 @@ from .utils import dpi_scale
 from .. import editor_utils
 from ..core import Blueprint, BlueprintSettings, BlueprintBuilder, BlueprintValidator
 from ..core import BuildStep, BuildAction
-from ..core import get_all_rigs
+from ..core import disable_rig_index, enable_rig_index, get_all_rigs
 from ..core import load_actions
 from ..core import serialize_attr_value
 from ..editor_utils import open_blueprint_scene
@@ -376,6 +376,9 @@ class BlueprintUIModel(QtCore.QObject):
         # load actions if they haven't been already
         load_actions()
 
+        # index rigs while the ui is open, since rigs are looked up constantly while editing and animating
+        enable_rig_index()
+
         # the current Blueprint asset
         self._blueprint: Blueprint | None = None
 
@@ -399,7 +402,10 @@ class BlueprintUIModel(QtCore.QObject):
             self.try_open_file(self.get_blueprint_file_path_for_scene())
 
     def on_delete(self):
+        # end any paused build, so that it doesn't leave registries enabled or rig events suspended
+        self.cancel_interactive_build()
         self._remove_scene_callbacks()
+        disable_rig_index()
 
     @property
     def blueprint(self) -> Blueprint | None:
@@ -741,6 +747,7 @@ class BlueprintUIModel(QtCore.QObject):
 
     def _on_before_open_scene(self, client_data=None):
         self.is_changing_scenes = True
+        self.cancel_interactive_build()
         self.close_file()
 
     def _on_after_open_scene(self, client_data=None):
@@ -752,6 +759,7 @@ class BlueprintUIModel(QtCore.QObject):
 
     def _on_before_new_scene(self, client_data=None):
         self.is_changing_scenes = True
+        self.cancel_interactive_build()
         self.close_file()
 
     def _on_after_new_scene(self, client_data=None):
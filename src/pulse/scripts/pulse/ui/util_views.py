@@ -120,7 +120,7 @@ class CopyPasteMatrixWidget(QtWidgets.QWidget):
             self.clipboard["matrices"] = [nodes.get_relative_matrix(n, base_node) for n in transforms]
             LOG.debug("copied relative to {0}".format(base_node))
         else:
-            self.clipboard["matrices"] = [nodes.get_world_matrix(n) for n in transforms]
+            self.clipboard["matrices"] = nodes.get_world_matrices(transforms)
 
     def paste_over_time(self, transforms, base_node=None):
         """
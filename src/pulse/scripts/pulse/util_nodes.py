@@ -1,8 +1,11 @@
 import logging
 from enum import IntEnum
+from typing import Callable, Optional
 
+import maya.OpenMaya as api
 import pymel.core as pm
 
+from . import node_graph
 from . import nodes
 
 LOG = logging.getLogger(__name__)
@@ -135,6 +138,352 @@ def get_constraint_weight_attr(leader, constraint):
             return constraint.getWeightAliasList()[i]
 
 
+def _is_attr(value) -> bool:
+    """
+    Return True if a value is an Attribute or DeferredAttr.
+    """
+    return isinstance(value, (pm.Attribute, node_graph.DeferredAttr))
+
+
+def _get_dimension(attr_or_value) -> int:
+    """
+    Return the dimension of an attribute or value, supporting deferred attributes.
+    """
+    if isinstance(attr_or_value, node_graph.DeferredAttr):
+        return nodes.get_attr_dimension(attr_or_value)
+    return nodes.get_attr_or_value_dimension(attr_or_value)
+
+
+def _create_node(node_type):
+    """
+    Create a utility node, or record its creation if a deferred graph is active, see `node_graph.deferred_graph`.
+    """
+    graph = node_graph.get_active_graph()
+    if graph is not None:
+        return graph.create_node(node_type)
+    return pm.shadingNode(node_type, asUtility=True)
+
+
+# Node Cache
+# ----------
+
+# the cache used to reuse and fold utility nodes, see `node_cache_scope`
+_active_node_cache: Optional["UtilNodeCache"] = None
+
+
+class UtilNodeCache(object):
+    """
+    Reuses utility nodes that have already been created with the same type and inputs,
+    and optionally evaluates expressions whose inputs are all constants in Python instead of creating nodes.
+
+    Cached nodes are found by (node type, operation and inputs), where attribute inputs are compared by name,
+    so a cache should only be used while nodes are not renamed or reconnected, e.g. for a single build.
+    Only the functions that return an output attribute use the cache, since the nodes returned by
+    `create_utility_node` are expected to be modified further.
+    """
+
+    def __init__(self, fold_constants=False):
+        """
+        Args:
+            fold_constants: If true, expressions whose inputs are all constant values return the resulting
+                value instead of an attribute. Only enable this when all callers support values as results.
+        """
+        self.fold_constants = fold_constants
+        # {cache key: output attribute or node}
+        self._results = {}
+        # the number of nodes that were not created because an existing node was reused
+        self.num_reused = 0
+        # the number of nodes that were not created because the result was evaluated in Python
+        self.num_folded = 0
+
+    @property
+    def num_saved(self) -> int:
+        """
+        The total number of nodes that were not created.
+        """
+        return self.num_reused + self.num_folded
+
+    def get_or_create(self, key: tuple, create_func: Callable):
+        """
+        Return the cached result for a key, or call `create_func` to create and cache it.
+        """
+        result = self._results.get(key)
+        if result is not None:
+            if node_graph.is_deferred(result):
+                if result.node().graph.is_committed:
+                    result = node_graph.resolve(result)
+                self.num_reused += 1
+                return result
+            if result.node().exists():
+                self.num_reused += 1
+                return result
+        result = create_func()
+        self._results[key] = result
+        return result
+
+    def fold(self, node_type: str, inputs: dict):
+        """
+        Return the value of a utility node evaluated with constant inputs,
+        or None if constants are not being folded, or the inputs are not all supported constants.
+        """
+        if not self.fold_constants or _contains_attr(inputs):
+            return None
+        evaluator = _CONSTANT_EVALUATORS.get(node_type)
+        if not evaluator:
+            return None
+        try:
+            result = evaluator(**inputs)
+        except (KeyError, TypeError, ValueError, ZeroDivisionError, OverflowError):
+            return None
+        if result is not None:
+            self.num_folded += 1
+        return result
+
+
+def get_active_node_cache() -> Optional[UtilNodeCache]:
+    """
+    Return the UtilNodeCache that is currently in use, if any.
+    """
+    return _active_node_cache
+
+
+def enable_node_cache(fold_constants=False) -> UtilNodeCache:
+    """
+    Start reusing utility nodes with a new UtilNodeCache, and return it. See `node_cache_scope`.
+    """
+    global _active_node_cache
+    _active_node_cache = UtilNodeCache(fold_constants)
+    return _active_node_cache
+
+
+def disable_node_cache() -> Optional[UtilNodeCache]:
+    """
+    Stop reusing utility nodes, and return the cache that was in use, if any.
+    """
+    global _active_node_cache
+    cache = _active_node_cache
+    _active_node_cache = None
+    return cache
+
+
+class node_cache_scope(object):
+    """
+    Context manager that reuses identical utility nodes created within the block, and
+    optionally folds constant expressions, see `UtilNodeCache`.
+    """
+
+    def __init__(self, fold_constants=False):
+        self.fold_constants = fold_constants
+        self._prev_cache: Optional[UtilNodeCache] = None
+
+    def __enter__(self) -> UtilNodeCache:
+        global _active_node_cache
+        self._prev_cache = _active_node_cache
+        _active_node_cache = UtilNodeCache(self.fold_constants)
+        return _active_node_cache
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _active_node_cache
+        cache = _active_node_cache
+        _active_node_cache = self._prev_cache
+        if cache.num_saved:
+            LOG.debug(
+                "Saved %d utility nodes (%d reused, %d folded)", cache.num_saved, cache.num_reused, cache.num_folded
+            )
+
+
+def _contains_attr(value) -> bool:
+    """
+    Return True if a value is an attribute or node, or a list or dict that contains one.
+    """
+    if _is_attr(value) or isinstance(value, (pm.PyNode, node_graph.DeferredNode)):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_attr(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_attr(v) for v in value)
+    return False
+
+
+def _get_cache_key(value):
+    """
+    Return a hashable key representing an input value or attribute.
+    """
+    if isinstance(value, pm.Attribute):
+        return "attr", value.name(fullAttrPath=True, fullDagPath=True)
+    elif isinstance(value, pm.PyNode):
+        return "node", value.longName()
+    elif isinstance(value, (node_graph.DeferredAttr, node_graph.DeferredNode)):
+        return "deferred", value
+    elif isinstance(value, dict):
+        return tuple(sorted((k, _get_cache_key(v)) for k, v in value.items()))
+    elif isinstance(value, str):
+        return value
+    elif isinstance(value, bool):
+        return bool(value)
+    elif isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return tuple(_get_cache_key(v) for v in value)
+    except TypeError:
+        return value
+
+
+def _create_cached(key: tuple, create_func: Callable):
+    """
+    Return the result of `create_func`, reusing a previous result with the same key if a node cache is active.
+    """
+    if _active_node_cache is None:
+        return create_func()
+    return _active_node_cache.get_or_create(key, create_func)
+
+
+def _fold_constants(node_type: str, inputs: dict):
+    """
+    Return the value of a utility node evaluated in Python if a node cache is active
+    and folding constants, or None if the node must be created.
+    """
+    if _active_node_cache is None:
+        return None
+    return _active_node_cache.fold(node_type, inputs)
+
+
+def _is_sequence(value) -> bool:
+    return not isinstance(value, str) and hasattr(value, "__len__")
+
+
+def _map_constants(func: Callable, *values, broadcast=()):
+    """
+    Apply a function to constant scalar values, or to each element of constant vector values.
+
+    Args:
+        func: The function to apply to each set of scalar values.
+        *values: The values, which must either all be scalars or all be vectors of the same length.
+        broadcast: The indices of values which must be scalars, and are passed to every call of func.
+
+    Returns:
+        A float or list of floats, or None if the values are not supported.
+    """
+    vectors = [v for i, v in enumerate(values) if i not in broadcast]
+    if any(_is_sequence(values[i]) for i in broadcast):
+        return None
+    if all(_is_sequence(v) for v in vectors):
+        dims = set(len(v) for v in vectors)
+        if len(dims) != 1:
+            return None
+        dim = dims.pop()
+        rows = [[values[i] if i in broadcast else values[i][d] for i in range(len(values))] for d in range(dim)]
+        result = [func(*row) for row in rows]
+    elif not any(_is_sequence(v) for v in vectors):
+        result = func(*values)
+    else:
+        return None
+    for v in result if isinstance(result, list) else [result]:
+        if isinstance(v, complex):
+            return None
+    return result
+
+
+def _evaluate_multiply_divide(input1, input2, operation=MultiplyDivideOperation.MULTIPLY):
+    funcs = {
+        MultiplyDivideOperation.NO_OPERATION: lambda a, b: float(a),
+        MultiplyDivideOperation.MULTIPLY: lambda a, b: float(a * b),
+        MultiplyDivideOperation.DIVIDE: lambda a, b: float(a / b),
+        MultiplyDivideOperation.POWER: lambda a, b: float(a**b),
+    }
+    return _map_constants(funcs[operation], input1, input2)
+
+
+def _evaluate_float_math(floatA, floatB, operation=FloatMathOperation.ADD):
+    funcs = {
+        FloatMathOperation.ADD: lambda a, b: a + b,
+        FloatMathOperation.SUBTRACT: lambda a, b: a - b,
+        FloatMathOperation.MULTIPLY: lambda a, b: a * b,
+        FloatMathOperation.DIVIDE: lambda a, b: a / b,
+        FloatMathOperation.MIN: lambda a, b: min(a, b),
+        FloatMathOperation.MAX: lambda a, b: max(a, b),
+        FloatMathOperation.POWER: lambda a, b: a**b,
+    }
+    if _is_sequence(floatA) or _is_sequence(floatB):
+        return None
+    return _map_constants(lambda a, b: float(funcs[operation](a, b)), floatA, floatB)
+
+
+def _evaluate_set_range(value, min, max, oldMin, oldMax):
+    def _set_range(v, new_min, new_max, old_min, old_max):
+        # values are clamped to the old range
+        v = sorted((old_min, v, old_max))[1]
+        return float(new_min + (v - old_min) / (old_max - old_min) * (new_max - new_min))
+
+    return _map_constants(_set_range, value, min, max, oldMin, oldMax)
+
+
+def _evaluate_condition(firstTerm, secondTerm, colorIfTrue, colorIfFalse, operation=ConditionOperation.EQUAL):
+    funcs = {
+        ConditionOperation.EQUAL: lambda a, b: a == b,
+        ConditionOperation.NOT_EQUAL: lambda a, b: a != b,
+        ConditionOperation.GREATER_THAN: lambda a, b: a > b,
+        ConditionOperation.GREATER_OR_EQUAL: lambda a, b: a >= b,
+        ConditionOperation.LESS_THAN: lambda a, b: a < b,
+        ConditionOperation.LESS_OR_EQUAL: lambda a, b: a <= b,
+    }
+    if _is_sequence(firstTerm) or _is_sequence(secondTerm):
+        return None
+    is_true = funcs[operation](firstTerm, secondTerm)
+    return _map_constants(lambda t, f: float(t if is_true else f), colorIfTrue, colorIfFalse)
+
+
+def _evaluate_vector_product(input1, input2, operation=VectorProductOperation.DOT_PRODUCT):
+    if not (_is_sequence(input1) and _is_sequence(input2) and len(input1) == len(input2) == 3):
+        return None
+    a, b = pm.dt.Vector(input1), pm.dt.Vector(input2)
+    if operation == VectorProductOperation.DOT_PRODUCT:
+        return float(a.dot(b))
+    elif operation == VectorProductOperation.CROSS_PRODUCT:
+        return [float(v) for v in a.cross(b)]
+
+
+def _evaluate_plus_minus_average(inputs, operation=PlusMinusAverageOperation.SUM):
+    if not inputs:
+        return None
+    funcs = {
+        PlusMinusAverageOperation.SUM: lambda *values: sum(values),
+        PlusMinusAverageOperation.SUBTRACT: lambda *values: values[0] - sum(values[1:]),
+        PlusMinusAverageOperation.AVERAGE: lambda *values: sum(values) / len(values),
+    }
+    if operation not in funcs:
+        return None
+    return _map_constants(lambda *values: float(funcs[operation](*values)), *inputs)
+
+
+def _evaluate_mult_matrix(matrices):
+    if not matrices:
+        return None
+    result = pm.dt.Matrix(matrices[0])
+    for matrix in matrices[1:]:
+        result = result * pm.dt.Matrix(matrix)
+    return result
+
+
+# functions that evaluate utility nodes in Python, by node type.
+# each takes the same keyword args as the node's input attributes, and returns None if the inputs are unsupported.
+_CONSTANT_EVALUATORS = {
+    "blendColors": lambda color1, color2, blender: _map_constants(
+        lambda a, b, w: float(a * w + b * (1 - w)), color1, color2, blender, broadcast=(2,)
+    ),
+    "clamp": lambda input, min, max: _map_constants(lambda v, lo, hi: float(sorted((lo, v, hi))[1]), input, min, max),
+    "condition": _evaluate_condition,
+    "floatMath": _evaluate_float_math,
+    "inverseMatrix": lambda inputMatrix: pm.dt.Matrix(inputMatrix).inverse(),
+    "multMatrix": _evaluate_mult_matrix,
+    "multiplyDivide": _evaluate_multiply_divide,
+    "plusMinusAverage": _evaluate_plus_minus_average,
+    "reverse": lambda input: _map_constants(lambda v: float(1 - v), input),
+    "setRange": _evaluate_set_range,
+    "vectorProduct": _evaluate_vector_product,
+}
+
+
 def get_output_attr(input):
     """
     Return the output attr of a utility node.
@@ -160,38 +509,63 @@ def get_output_attr(input):
         An Attribute that matches the input, or None if the input is unhandled
     """
 
-    def resolve_output_func(func):
-        if callable(func):
-            return func
-        elif func in globals():
-            return globals()[func]
-        return None
+    node = input.node()
+    if isinstance(node, pm.PyNode):
+        # use plugs for existing nodes, and only create an Attribute for the result
+        plug = input.__apimplug__() if isinstance(input, pm.Attribute) else None
+        node_type = api.MFnDependencyNode(node.__apimobject__()).typeName()
+    else:
+        plug = None
+        node_type = node.nodeType()
 
-    output_funcs = {name: resolve_output_func(func) for name, func in OUTPUT_ATTR_NAME_FUNCS.items()}
-    output_funcs = {name: func for name, func in output_funcs.items() if func}
+    output_func = _output_attr_funcs.get(node_type)
+    if output_func:
+        return output_func(input)
 
-    node = input.node()
-    node_type = node.nodeType()
-    if node_type not in OUTPUT_ATTR_NAMES and node_type not in output_funcs:
+    output_attr_name = OUTPUT_ATTR_NAMES.get(node_type)
+    if not output_attr_name:
         LOG.warning("No output found for utility type '%s'", node_type)
         return None
 
-    if node_type in output_funcs:
-        fnc = output_funcs[node_type]
-        return fnc(input)
+    if not isinstance(node, pm.PyNode):
+        return _get_deferred_output_attr(input, output_attr_name)
 
-    elif node_type in OUTPUT_ATTR_NAMES:
-        output_attr_name = OUTPUT_ATTR_NAMES[node_type]
-        output_attr = nodes.safe_get_attr(node, output_attr_name)
+    fn_node = api.MFnDependencyNode(node.__apimobject__())
+    if not fn_node.hasAttribute(output_attr_name):
+        return None
+    output_plug = fn_node.findPlug(output_attr_name, False)
+    if output_plug.isCompound() and plug is not None and plug.isChild():
+        # input and output are both compound, return
+        # child of output at the same child index
+        output_plug = output_plug.child(_get_child_index(node_type, plug))
+    return pm.Attribute(node, output_plug)
 
-        if output_attr and output_attr.isCompound():
-            if isinstance(input, pm.Attribute) and input.isChild():
-                # input and output are both compound, return
-                # child of output at the same child index
-                index = nodes.get_compound_attr_index(input)
-                return output_attr.getChildren()[index]
 
-        return output_attr
+def _get_deferred_output_attr(input, output_attr_name: str):
+    """
+    Return the output attribute of a deferred node, see `get_output_attr`.
+    """
+    node = input.node()
+    output_attr = nodes.safe_get_attr(node, output_attr_name)
+    if output_attr and output_attr.isCompound():
+        if _is_attr(input) and input.isChild():
+            index = nodes.get_compound_attr_index(input)
+            return output_attr.getChildren()[index]
+    return output_attr
+
+
+def _get_child_index(node_type: str, plug: api.MPlug) -> int:
+    """
+    Return the index of a compound child plug within its parent, cached by node type and attribute name.
+    """
+    key = (node_type, api.MFnAttribute(plug.attribute()).name())
+    index = _compound_child_indices.get(key)
+    if index is None:
+        parent = plug.parent()
+        attribute = plug.attribute()
+        index = next(i for i in range(parent.numChildren()) if parent.child(i).attribute() == attribute)
+        _compound_child_indices[key] = index
+    return index
 
 
 def get_plus_minus_average_output_attr(input):
@@ -209,9 +583,24 @@ def get_plus_minus_average_output_attr(input):
     """
     input_node = input.node()
 
-    if not isinstance(input, pm.Attribute):
+    if not _is_attr(input):
         return input_node.output1D
 
+    if isinstance(input, pm.Attribute):
+        plug = input.__apimplug__()
+        num_children = 0
+        if plug.isCompound():
+            num_children = plug.numChildren()
+        elif plug.isChild():
+            num_children = plug.parent().numChildren()
+        if num_children == 0:
+            return input_node.output1D
+        fn_node = api.MFnDependencyNode(input_node.__apimobject__())
+        output_plug = fn_node.findPlug("output{0}D".format(num_children), False)
+        if plug.isChild():
+            output_plug = output_plug.child(_get_child_index("plusMinusAverage", plug))
+        return pm.Attribute(input_node, output_plug)
+
     num_children = 0
     if input.isCompound():
         num_children = input.numChildren()
@@ -233,6 +622,28 @@ def get_plus_minus_average_output_attr(input):
     return input_node.output1D
 
 
+def refresh_output_attr_funcs():
+    """
+    Resolve the functions in `OUTPUT_ATTR_NAME_FUNCS`, must be called after modifying it.
+    """
+    global _output_attr_funcs
+    result = {}
+    for node_type, func in OUTPUT_ATTR_NAME_FUNCS.items():
+        if not callable(func):
+            func = globals().get(func)
+        if func:
+            result[node_type] = func
+    _output_attr_funcs = result
+
+
+# {node type: function} the resolved functions of `OUTPUT_ATTR_NAME_FUNCS`
+_output_attr_funcs = {}
+refresh_output_attr_funcs()
+
+# {(node type, child attribute name): index} the index of compound child attributes within their parent
+_compound_child_indices = {}
+
+
 def get_largest_dimension_attr(attrs):
     """
     Return the attr that has the largest dimension.
@@ -305,9 +716,9 @@ def get_input_connections(input_val, dest_attr):
         Return the child of an object whether it's a list-like object or compound attribute.
         If the dimension of obj is 1, returns obj.
         """
-        if nodes.get_attr_or_value_dimension(obj) == 1:
+        if _get_dimension(obj) == 1:
             return obj
-        if isinstance(obj, pm.Attribute):
+        if _is_attr(obj):
             return obj.getChildren()[index]
         else:
             return obj[index]
@@ -317,7 +728,7 @@ def get_input_connections(input_val, dest_attr):
         if len(input_val) == 1:
             input_val = input_val[0]
 
-    input_dim = nodes.get_attr_or_value_dimension(input_val)
+    input_dim = _get_dimension(input_val)
     dest_attr_dim = nodes.get_attr_dimension(dest_attr)
 
     # get the overlapping dimension
@@ -351,8 +762,11 @@ def set_or_connect_attr(attr, val):
     """
     cons = get_input_connections(val, attr)
     for srcVal, dstAttr in cons:
-        if isinstance(srcVal, pm.Attribute):
-            srcVal >> dstAttr
+        if _is_attr(srcVal):
+            if node_graph.is_deferred(dstAttr):
+                dstAttr.node().graph.connect_attr(srcVal, dstAttr)
+            else:
+                srcVal >> dstAttr
         else:
             dstAttr.set(srcVal)
     return [con[1] for con in cons]
@@ -379,11 +793,19 @@ def average(*inputs):
 
 
 def plus_minus_average(inputs, operation):
-    node = pm.shadingNode("plusMinusAverage", asUtility=True)
+    folded = _fold_constants("plusMinusAverage", dict(inputs=inputs, operation=operation))
+    if folded is not None:
+        return folded
+    key = ("plusMinusAverage", _get_cache_key(operation), _get_cache_key(inputs))
+    return _create_cached(key, lambda: _create_plus_minus_average(inputs, operation))
+
+
+def _create_plus_minus_average(inputs, operation):
+    node = _create_node("plusMinusAverage")
     node.operation.set(operation)
 
     if len(inputs) > 0:
-        input_dim = nodes.get_attr_or_value_dimension(inputs[0])
+        input_dim = _get_dimension(inputs[0])
         if input_dim == 1:
             multi_attr = node.input1D
         elif input_dim == 2:
@@ -421,6 +843,15 @@ def max_float(a, b):
     return _create_utility_and_return_output("floatMath", floatA=a, floatB=b, operation=FloatMathOperation.MAX)
 
 
+def float_math(a, b, operation: FloatMathOperation):
+    """
+    Return an attribute that represents a floatMath operation between a and b.
+    Only supports float values.
+    """
+    load_lookdev_kit_plugin()
+    return _create_utility_and_return_output("floatMath", floatA=a, floatB=b, operation=operation)
+
+
 def multiply(a, b):
     """Return an attribute that represents a * b."""
     return multiply_divide(a, b, MultiplyDivideOperation.MULTIPLY)
@@ -473,7 +904,7 @@ def blend2(a, b, blender):
     the output attribute. If 1D, returns the outputX, if 2D or 3D, returns the output.
     """
     # clamp blender
-    if not isinstance(blender, pm.Attribute):
+    if not _is_attr(blender):
         blender = max(min(blender, 1), 0)
     return _create_utility_and_return_output("blendColors", color1=a, color2=b, blender=blender)
 
@@ -493,9 +924,9 @@ def distance(a, b, ws=True, make_local=True):
     in_matrix1 = a.node().wm if ws and not make_local else a.node().m
     in_matrix2 = b.node().wm if ws or make_local else b.node().m
     if make_local:
-        mult = pm.createNode("multMatrix")
-        in_matrix2 >> mult.matrixIn[0]
-        a.node().pim >> mult.matrixIn[1]
+        mult = _create_node("multMatrix")
+        set_or_connect_attr(mult.matrixIn[0], in_matrix2)
+        set_or_connect_attr(mult.matrixIn[1], a.node().pim)
         in_matrix2 = mult.matrixSum
     n = create_utility_node(node_type=node_type, inMatrix1=in_matrix1, inMatrix2=in_matrix2)
     return n.distance
@@ -579,7 +1010,7 @@ def choice(selector, *inputs) -> pm.Attribute:
         selector: The selector value or attribute.
         *inputs: The array of input values or attributes to select based on the selector.
     """
-    choice_node = pm.shadingNode("choice", asUtility=True)
+    choice_node = _create_node("choice")
     set_or_connect_attr(choice_node.selector, selector)
     for i, input in enumerate(inputs):
         set_or_connect_attr(choice_node.input[i], input)
@@ -639,8 +1070,15 @@ def matrix_multiply_point(matrix, point) -> pm.Attribute:
 
 
 def mult_matrix(*matrices):
+    folded = _fold_constants("multMatrix", dict(matrices=matrices))
+    if folded is not None:
+        return folded
+    return _create_cached(("multMatrix", _get_cache_key(matrices)), lambda: _create_mult_matrix(matrices))
+
+
+def _create_mult_matrix(matrices):
     load_matrix_plugin()
-    mmtx = pm.shadingNode("multMatrix", asUtility=True)
+    mmtx = _create_node("multMatrix")
     for i, matrix in enumerate(matrices):
         set_or_connect_attr(mmtx.matrixIn[i], matrix)
     return mmtx.matrixSum
@@ -757,7 +1195,7 @@ def blend_matrix_multi(input_matrix, *targets_and_weights):
         input_matrix: A transformation matrix value or attribute
         *targets_and_weights: A list of tuples containing (target matrix, weight) values or attributes
     """
-    blend = pm.shadingNode("blendMatrix", asUtility=True)
+    blend = _create_node("blendMatrix")
     set_or_connect_attr(blend.inputMatrix, input_matrix)
     for i, (matrix, weight) in enumerate(targets_and_weights):
         set_or_connect_attr(blend.target[i].targetMatrix, matrix)
@@ -770,7 +1208,7 @@ def create_utility_node(node_type, **kwargs):
     Create and return a utility node.
     Sets or connects any attributes defined by kwargs.
     """
-    node = pm.shadingNode(node_type, asUtility=True)
+    node = _create_node(node_type)
     for key, value in kwargs.items():
         set_or_connect_attr(node.attr(key), value)
     return node
@@ -780,8 +1218,19 @@ def _create_utility_and_return_output(node_type, **kwargs):
     """
     Create and return a utility node, as well as the attrs
     on the node that were set or connected to based on kwargs.
+
+    If a node cache is active, returns the output of an identical existing node,
+    or the evaluated value if all inputs are constants and constants are being folded.
     """
-    node = pm.shadingNode(node_type, asUtility=True)
+    folded = _fold_constants(node_type, kwargs)
+    if folded is not None:
+        return folded
+    key = ("output", node_type, _get_cache_key(kwargs))
+    return _create_cached(key, lambda: _create_utility_and_get_output(node_type, kwargs))
+
+
+def _create_utility_and_get_output(node_type, kwargs):
+    node = _create_node(node_type)
     all_dst_attrs = []
     for key, value in kwargs.items():
         dst_attrs = set_or_connect_attr(node.attr(key), value)
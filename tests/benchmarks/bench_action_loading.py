@@ -0,0 +1,60 @@
+"""
+Compare Pulse startup time when loading actions by importing every action module vs. from a cached manifest.
+
+Each run happens in a new interpreter, so that no action modules are already imported.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from bench_utils import initialize_maya
+
+LOAD_ACTIONS_SCRIPT = """
+import time
+import maya.standalone
+maya.standalone.initialize()
+
+start = time.perf_counter()
+from pulse.core import BuildActionLoader, BuildActionPackageRegistry
+loader = BuildActionLoader(use_manifest={use_manifest})
+for package in BuildActionPackageRegistry.get().action_packages:
+    loader.load_actions_from_package(package)
+print(time.perf_counter() - start)
+"""
+
+
+def time_load_actions(name: str, use_manifest: bool, repeat=3) -> float:
+    """
+    Load all actions in a new process several times and print the best duration.
+    """
+    script = LOAD_ACTIONS_SCRIPT.format(use_manifest=use_manifest)
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=os.environ)
+        duration = float(result.stdout.strip().splitlines()[-1])
+        best = duration if best is None else min(best, duration)
+    print(f"{name}: {best:.4f}s (best of {repeat})")
+    return best
+
+
+def main():
+    initialize_maya()
+
+    from pulse import builtin_actions
+    from pulse.core import loader
+
+    # make sure the manifest is up-to-date before timing
+    start = time.perf_counter()
+    manifest = loader.generate_action_manifest(builtin_actions)
+    loader._write_action_manifest(manifest, loader.get_action_manifest_path(builtin_actions))
+    print(f"generate manifest ({len(manifest['actions'])} actions): {time.perf_counter() - start:.4f}s")
+
+    imported = time_load_actions("import all action modules", use_manifest=False)
+    lazy = time_load_actions("load from manifest", use_manifest=True)
+    print(f"speedup: {imported / lazy:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
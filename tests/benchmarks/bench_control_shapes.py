@@ -0,0 +1,49 @@
+"""
+Compare creating controls one at a time vs. as a single batch.
+"""
+
+from bench_utils import initialize_maya, time_func
+
+CONTROL_COUNT = 300
+
+
+def create_joints(count: int):
+    import pymel.core as pm
+
+    pm.select(clear=True)
+    return [pm.joint(position=(i, 0, 0)) for i in range(count)]
+
+
+def create_individually(shape_data, joints):
+    from pulse import control_shapes
+
+    for joint in joints:
+        control_shapes.create_control(shape_data, target_node=joint, link=True)
+
+
+def create_batch(shape_data, joints):
+    from pulse import control_shapes
+
+    control_shapes.create_controls(shape_data, target_nodes=joints, link=True)
+
+
+def main():
+    initialize_maya()
+
+    import pymel.core as pm
+    from pulse import control_shapes
+
+    control_shapes.load_builtin_control_shapes()
+    shape_data = control_shapes.get_control_shapes()[0]
+
+    def run(func):
+        pm.newFile(force=True)
+        func(shape_data, create_joints(CONTROL_COUNT))
+
+    print(f"Creating {CONTROL_COUNT} controls:")
+    time_func("  individually", lambda: run(create_individually))
+    time_func("  batch", lambda: run(create_batch))
+
+
+if __name__ == "__main__":
+    main()
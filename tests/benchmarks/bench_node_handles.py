@@ -0,0 +1,53 @@
+"""
+Compare finding and decoding meta nodes as PyNodes vs NodeHandles.
+"""
+
+from bench_utils import initialize_maya, time_func
+
+NODE_COUNT = 10000
+CLASS_NAME = "bench_class"
+
+
+def create_meta_nodes(count: int):
+    from maya import cmds
+    from pulse.vendor import pymetanode as meta
+
+    nodes = [cmds.createNode("transform", name=f"bench_node_{i}") for i in range(count)]
+    for i, node in enumerate(nodes):
+        # reference the previous node so that decoding has to resolve nodes
+        meta.set_metadata(node, CLASS_NAME, {"index": i, "other": nodes[i - 1]}, undoable=False)
+
+
+def main():
+    initialize_maya()
+
+    import pymel.core as pm
+    from pulse.vendor import pymetanode as meta
+
+    pm.newFile(force=True)
+    create_meta_nodes(NODE_COUNT)
+
+    print(f"Finding {NODE_COUNT} meta nodes:")
+    time_func("  find_meta_nodes (PyNode)", lambda: meta.find_meta_nodes(CLASS_NAME))
+    time_func("  find_meta_nodes (NodeHandle)", lambda: meta.find_meta_nodes(CLASS_NAME, as_handles=True))
+    with meta.registry_enabled():
+        time_func("  find_meta_nodes (NodeHandle, registry)", lambda: meta.find_meta_nodes(CLASS_NAME, as_handles=True))
+
+    py_nodes = meta.find_meta_nodes(CLASS_NAME)
+    handles = meta.find_meta_nodes(CLASS_NAME, as_handles=True)
+
+    print(f"Decoding metadata of {NODE_COUNT} meta nodes:")
+    time_func("  get_metadata (PyNode)", lambda: [meta.get_metadata(n, CLASS_NAME) for n in py_nodes], repeat=1)
+    time_func(
+        "  get_metadata (NodeHandle)",
+        lambda: [meta.get_metadata(n, CLASS_NAME, as_handles=True) for n in handles],
+        repeat=1,
+    )
+
+    print(f"Hashing {NODE_COUNT} nodes:")
+    time_func("  set (PyNode)", lambda: set(py_nodes))
+    time_func("  set (NodeHandle)", lambda: set(handles))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark vectorized skin weight processing on a large synthetic dataset. Does not require Maya.
+
+    python tests/benchmarks/bench_skin_weights.py
+"""
+
+import numpy as np
+
+from bench_utils import time_func
+
+VERTEX_COUNT = 500000
+INFLUENCE_COUNT = 150
+WEIGHTS_PER_VERTEX = 8
+
+
+def create_skin_weights():
+    from pulse.skin_weights import SkinWeights
+
+    rng = np.random.default_rng(0)
+    influences = [f"joint_{i}" for i in range(INFLUENCE_COUNT)]
+    offsets = np.arange(VERTEX_COUNT + 1, dtype=np.int64) * WEIGHTS_PER_VERTEX
+    # pick distinct influences for each vertex, sorted within the vertex
+    influence_indices = np.sort(
+        np.argsort(rng.random((VERTEX_COUNT, INFLUENCE_COUNT)), axis=1)[:, :WEIGHTS_PER_VERTEX], axis=1
+    )
+    weights = rng.random((VERTEX_COUNT, WEIGHTS_PER_VERTEX), dtype=np.float32)
+    return SkinWeights(influences, offsets, influence_indices.ravel().astype(np.uint16), weights.ravel())
+
+
+def main():
+    from pulse import skin_weights
+
+    weights = create_skin_weights()
+    print(f"Processing {weights}:")
+
+    # a chain of joints, where every third joint will be removed
+    ancestors = {name: [f"joint_{j}" for j in range(i - 1, -1, -1)] for i, name in enumerate(weights.influences)}
+    removed = [name for i, name in enumerate(weights.influences) if i % 3 == 2]
+    pattern = "|".join(f"{name}$" for name in removed)
+
+    time_func("normalize", weights.normalize)
+    time_func("prune", lambda: weights.prune(0.05))
+    time_func("limit_influences", lambda: weights.limit_influences(4))
+    time_func(
+        "remap_influences",
+        lambda: weights.remap_influences(skin_weights.get_parent_influence_map(weights.influences, ancestors, pattern)),
+    )
+    time_func("limit + normalize", lambda: weights.limit_influences(4).normalize())
+
+
+if __name__ == "__main__":
+    main()
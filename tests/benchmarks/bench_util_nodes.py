@@ -0,0 +1,66 @@
+"""
+Compare building a network of utility nodes immediately vs. with a deferred node graph,
+and measure resolving the output attributes of utility nodes.
+"""
+
+from bench_utils import initialize_maya, time_func
+
+# each iteration creates 4 nodes
+NODE_COUNT = 1000
+OUTPUT_ATTR_COUNT = 10000
+
+
+def build_network(count: int):
+    import pymel.core as pm
+    from pulse import util_nodes
+
+    node = pm.group(empty=True, name="bench_node")
+    result = node.tx
+    for i in range(count // 4):
+        result = util_nodes.add(result, node.ty, i)
+        result = util_nodes.multiply(result, 0.5)
+        result = util_nodes.blend2(result, node.tz, 0.25)
+        result = util_nodes.greater_than(result, 1, result, node.tz)
+    return result
+
+
+def build_network_deferred(count: int):
+    from pulse import node_graph
+
+    with node_graph.deferred_graph():
+        result = build_network(count)
+    return result.py_attr()
+
+
+def main():
+    initialize_maya()
+
+    import pymel.core as pm
+
+    def run(func):
+        pm.newFile(force=True)
+        func(NODE_COUNT)
+
+    print(f"Building a network of {NODE_COUNT} utility nodes:")
+    time_func("  immediate", lambda: run(build_network))
+    time_func("  deferred", lambda: run(build_network_deferred))
+
+    from pulse import util_nodes
+
+    pm.newFile(force=True)
+    mult = util_nodes.create_utility_node("multiplyDivide")
+    cond = util_nodes.create_utility_node("condition")
+    pma = util_nodes.create_utility_node("plusMinusAverage")
+    inputs = [mult, mult.input1, mult.input1X, cond.colorIfTrueR, pma.input3D[0].input3Dx]
+
+    def get_output_attrs():
+        for i in range(OUTPUT_ATTR_COUNT // len(inputs)):
+            for input_attr in inputs:
+                util_nodes.get_output_attr(input_attr)
+
+    print(f"Resolving {OUTPUT_ATTR_COUNT} output attributes:")
+    time_func("  get_output_attr", get_output_attrs)
+
+
+if __name__ == "__main__":
+    main()
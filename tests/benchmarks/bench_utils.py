@@ -0,0 +1,45 @@
+"""
+Shared utils for Pulse benchmarks.
+
+Benchmarks are standalone scripts that can be run with mayapy, e.g.
+
+    mayapy tests/benchmarks/bench_node_handles.py
+"""
+
+import time
+from typing import Callable
+
+
+def initialize_maya():
+    """
+    Initialize maya standalone if not already running inside Maya.
+    """
+    import maya.standalone
+
+    try:
+        maya.standalone.initialize()
+    except RuntimeError:
+        # already initialized
+        pass
+
+
+def time_func(name: str, func: Callable, repeat=3) -> float:
+    """
+    Run a function several times and print the best duration.
+
+    Args:
+        name: The name of the benchmark to print.
+        func: The function to run.
+        repeat: The number of times to run the function.
+
+    Returns:
+        The best duration in seconds.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    print(f"{name}: {best:.4f}s (best of {repeat})")
+    return best
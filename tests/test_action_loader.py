@@ -0,0 +1,54 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pulse import builtin_actions
+from pulse.core import loader
+from pulse.core import BuildActionLoader, BuildActionSpec
+
+
+class TestActionLoader(unittest.TestCase):
+    def setUp(self) -> None:
+        self._cache_dir = loader.ACTION_MANIFEST_CACHE_DIR
+        loader.ACTION_MANIFEST_CACHE_DIR = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(loader.ACTION_MANIFEST_CACHE_DIR)
+        loader.ACTION_MANIFEST_CACHE_DIR = self._cache_dir
+
+    def test_generateManifest(self):
+        manifest = loader.generate_action_manifest(builtin_actions)
+        entries = {entry["id"]: entry for entry in manifest["actions"]}
+        self.assertEqual(len(entries), len(manifest["actions"]))
+        entry = entries["Pulse.AimConstrain"]
+        self.assertEqual(entry["module"], "pulse.builtin_actions.constraints.aim_constrain")
+        self.assertEqual(entry["class_name"], "AimConstrainAction")
+        self.assertEqual(entry["display_name"], "Aim Constrain")
+        self.assertIn("pulse.builtin_actions.constraints.aim_constrain", manifest["modules"])
+
+    def test_lazySpec(self):
+        manifest = loader.generate_action_manifest(builtin_actions)
+        entry = [entry for entry in manifest["actions"] if entry["id"] == "Pulse.AimConstrain"][0]
+        spec = BuildActionSpec.from_manifest_entry(entry)
+        self.assertTrue(spec.is_valid())
+        self.assertFalse(spec.is_loaded())
+        self.assertEqual(spec.display_name, "Aim Constrain")
+        self.assertEqual(spec.attrs, entry["attrs"])
+
+        from pulse.builtin_actions.constraints.aim_constrain import AimConstrainAction
+
+        self.assertTrue(spec.is_equal(BuildActionSpec(AimConstrainAction, None)))
+        self.assertFalse(spec.is_loaded())
+        self.assertIs(spec.action_cls, AimConstrainAction)
+        self.assertTrue(spec.is_loaded())
+        self.assertEqual(spec.to_manifest_entry(), entry)
+
+    def test_loadFromManifest(self):
+        action_loader = BuildActionLoader(use_registry=False)
+        specs = action_loader.load_actions_from_package(builtin_actions)
+        self.assertTrue(os.path.isfile(loader.get_action_manifest_path(builtin_actions)))
+
+        lazy_specs = action_loader.load_actions_from_package(builtin_actions)
+        self.assertEqual({s.id for s in lazy_specs}, {s.id for s in specs})
+        self.assertTrue(all(not s.is_loaded() for s in lazy_specs))
@@ -0,0 +1,60 @@
+import io
+import unittest
+
+import pymel.core as pm
+
+from pulse import anim_interface
+from pulse.vendor import yaml
+
+
+def get_pymel_ctl_interface(ctl):
+    """
+    Return the interface of a control using PyMEL, for comparison.
+    """
+    interface = {"worldMatrix": anim_interface.get_approx_attr_value(ctl.wm), "attrs": {}}
+    for attr in ctl.listAttr(keyable=True):
+        attr_info = {"type": attr.type(), "default": anim_interface.get_approx_attr_value(attr)}
+        if attr.type() == "enum":
+            attr_info["enums"] = anim_interface.get_enum_dict_by_index(attr.getEnums())
+        interface["attrs"][attr.longName()] = attr_info
+    return interface
+
+
+class TestAnimInterface(unittest.TestCase):
+    def setUp(self) -> None:
+        pm.newFile(force=True)
+        self.ctls = []
+        for i in range(3):
+            ctl = pm.group(empty=True, name=f"test{i}_ctl")
+            ctl.translate.set((i, 2.5, -1))
+            ctl.rotate.set((45, 0, 10))
+            ctl.addAttr("space", attributeType="enum", enumName="root=0:world=2", keyable=True)
+            ctl.addAttr("blend", attributeType="double", keyable=True, defaultValue=0.25)
+            ctl.addAttr("enabled", attributeType="bool", keyable=True, defaultValue=True)
+            self.ctls.append(ctl)
+
+    def test_getInterface(self):
+        interface = anim_interface.get_rig_anim_interface(self.ctls)
+        for ctl in self.ctls:
+            self.assertEqual(interface["ctls"][ctl.nodeName()], get_pymel_ctl_interface(ctl))
+
+    def test_changedKeyableState(self):
+        ctl = self.ctls[0]
+        ctl.sx.setKeyable(False)
+        ctl.rotateOrder.setKeyable(True)
+        interface = anim_interface.get_anim_ctl_interface(ctl)
+        self.assertNotIn("scaleX", interface["attrs"])
+        self.assertIn("rotateOrder", interface["attrs"])
+        self.assertEqual(interface, get_pymel_ctl_interface(ctl))
+
+    def test_excludeAttrs(self):
+        interface = anim_interface.get_anim_ctl_interface(self.ctls[0], exclude_attrs=["blend", "visibility"])
+        self.assertNotIn("blend", interface["attrs"])
+        self.assertNotIn("visibility", interface["attrs"])
+        self.assertIn("space", interface["attrs"])
+
+    def test_writeInterface(self):
+        expected = yaml.safe_dump(anim_interface.get_rig_anim_interface(self.ctls), default_flow_style=False)
+        fp = io.StringIO()
+        anim_interface.write_rig_anim_interface(fp, reversed(self.ctls))
+        self.assertEqual(fp.getvalue(), expected)
@@ -5,6 +5,8 @@ import pymel.core as pm
 from pulse.core import Blueprint, BlueprintBuilder, BlueprintSettings
 from pulse.core import BuildStep
 from pulse.core import load_actions, get_all_rigs
+from pulse.events import RigLifecycleEvents
+from pulse.vendor import pymetanode as meta
 
 EXAMPLE_BLUEPRINT_A = """
 version: 1
@@ -148,6 +150,28 @@ class TestBlueprints(unittest.TestCase):
         self.assertEqual(step_z.get_full_path(), "/StepB/StepY/StepZ")
         self.assertTrue(step_x.num_children() == 0)
 
+    def test_build_state_released(self):
+        def raise_error():
+            raise ValueError("test error")
+
+        # a build that raises outside of an action
+        builder = BlueprintBuilder(Blueprint())
+        builder._generate_all_actions = raise_error
+        with self.assertRaises(ValueError):
+            builder.start()
+        self.assertFalse(meta.is_registry_enabled())
+        self.assertFalse(RigLifecycleEvents.get_shared().is_suspended)
+
+        # a paused build that is discarded
+        builder = BlueprintBuilder(Blueprint())
+        builder.start(run=False)
+        builder.next()
+        self.assertTrue(meta.is_registry_enabled())
+        self.assertTrue(RigLifecycleEvents.get_shared().is_suspended)
+        builder.generator.close()
+        self.assertFalse(meta.is_registry_enabled())
+        self.assertFalse(RigLifecycleEvents.get_shared().is_suspended)
+
     def test_deserialize(self):
         bp = Blueprint()
         bp.deserialize_yaml(EXAMPLE_BLUEPRINT_A)
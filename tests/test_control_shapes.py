@@ -0,0 +1,108 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pymel.core as pm
+
+from pulse import control_shapes
+from pulse import links
+from pulse.vendor import pymetanode as meta
+
+
+class TestControlShapes(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.controls_dir = os.path.join(self.temp_dir, "controls")
+        builtin_dir = os.path.join(os.path.dirname(control_shapes.__file__), "controls")
+        shutil.copytree(builtin_dir, self.controls_dir)
+        self._cache_dir = control_shapes.MANIFEST_CACHE_DIR
+        control_shapes.MANIFEST_CACHE_DIR = os.path.join(self.temp_dir, "cache")
+
+    def tearDown(self) -> None:
+        control_shapes.MANIFEST_CACHE_DIR = self._cache_dir
+        shutil.rmtree(self.temp_dir)
+
+    def test_manifestCache(self):
+        shapes = control_shapes.load_control_shapes_from_directory(self.controls_dir)
+        self.assertTrue(shapes)
+        self.assertTrue(all(shape.is_loaded for shape in shapes))
+
+        # shapes are loaded from the manifest, and curves are loaded on demand
+        cached_shapes = control_shapes.load_control_shapes_from_directory(self.controls_dir)
+        self.assertEqual([s["name"] for s in cached_shapes], [s["name"] for s in shapes])
+        self.assertFalse(any(shape.is_loaded for shape in cached_shapes))
+        self.assertEqual(cached_shapes[0]["curves"], shapes[0]["curves"])
+        self.assertTrue(cached_shapes[0].is_loaded)
+
+        # adding a file invalidates the manifest
+        with open(os.path.join(self.controls_dir, "new_control.yaml"), "w") as fp:
+            fp.write("name: New\nsort: 0\ncurves: []\n")
+        new_shapes = control_shapes.load_control_shapes_from_directory(self.controls_dir)
+        self.assertEqual(len(new_shapes), len(shapes) + 1)
+        self.assertEqual([s["name"] for s in new_shapes if s.is_loaded], ["New"])
+
+    def test_registerWithoutSort(self):
+        with open(os.path.join(self.controls_dir, "unsorted_control.yaml"), "w") as fp:
+            fp.write("name: Unsorted\ncurves: []\n")
+        control_shapes.load_control_shapes_from_directory(self.controls_dir)
+        shapes = control_shapes.load_control_shapes_from_directory(self.controls_dir)
+        shape = [s for s in shapes if s["name"] == "Unsorted"][0]
+        self.assertEqual(shape["sort"], control_shapes.DEFAULT_SHAPE_SORT)
+        try:
+            control_shapes.register_control_shape("_test_unsorted", shape)
+            self.assertFalse(shape.is_loaded)
+        finally:
+            control_shapes.unregister_control_shape("_test_unsorted")
+
+    def test_sortedShapes(self):
+        control_shapes.register_control_shape("_test_b", {"name": "B", "sort": -1})
+        control_shapes.register_control_shape("_test_a", {"name": "A", "sort": -1})
+        try:
+            names = [s["name"] for s in control_shapes.get_control_shapes()]
+            self.assertEqual(names[:2], ["A", "B"])
+            control_shapes.register_control_shape("_test_a", {"name": "A", "sort": 10000})
+            names = [s["name"] for s in control_shapes.get_control_shapes()]
+            self.assertEqual(names[0], "B")
+            self.assertEqual(names[-1], "A")
+        finally:
+            control_shapes.unregister_control_shape("_test_a")
+            control_shapes.unregister_control_shape("_test_b")
+        names = [s["name"] for s in control_shapes.get_control_shapes()]
+        self.assertNotIn("A", names)
+        self.assertNotIn("B", names)
+
+    def test_createControls(self):
+        pm.newFile(force=True)
+        shape_data = control_shapes.load_control_shapes_from_directory(self.controls_dir, use_cache=False)[0]
+        pm.select(clear=True)
+        joints = [pm.joint(position=(i, 1, 0)) for i in range(3)]
+        joints[1].rotateOrder.set(3)
+        parent = pm.group(empty=True, name="ctls_grp")
+        parent.translate.set((0, 0, 5))
+
+        ctls = control_shapes.create_controls(shape_data, target_nodes=joints, link=True, parent=parent)
+        self.assertEqual(len(ctls), 3)
+        for ctl, joint in zip(ctls, joints):
+            self.assertEqual(ctl.getParent(), parent)
+            self.assertEqual(len(ctl.getShapes()), len(shape_data["curves"]))
+            self.assertEqual(ctl.rotateOrder.get(), joint.rotateOrder.get())
+            self.assertTrue(ctl.wm.get().isEquivalent(joint.wm.get()))
+            self.assertTrue(meta.has_metaclass(ctl, control_shapes.CONTROL_SHAPE_METACLASS))
+            self.assertEqual(links.get_link_meta_data(ctl), {"targetNodes": [joint], "type": links.LinkType.DEFAULT})
+
+        pm.undo()
+        self.assertFalse(pm.ls(ctls[0].nodeName()))
+
+    def test_replaceShapes(self):
+        pm.newFile(force=True)
+        shapes = control_shapes.load_control_shapes_from_directory(self.controls_dir, use_cache=False)
+        ctl = control_shapes.create_control(shapes[0], name="test_ctl")
+        old_shape_names = [shape.nodeName() for shape in ctl.getShapes()]
+        control_shapes.replace_shapes(ctl, shapes[1])
+        self.assertTrue(pm.objExists("test_ctl"))
+        self.assertEqual(len(ctl.getShapes()), len(shapes[1]["curves"]))
+
+        pm.undo()
+        self.assertTrue(pm.objExists("test_ctl"))
+        self.assertEqual([shape.nodeName() for shape in ctl.getShapes()], old_shape_names)
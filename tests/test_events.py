@@ -0,0 +1,55 @@
+import unittest
+
+import maya.cmds as cmds
+import pymel.core as pm
+
+from pulse import events
+from pulse.core import rigs
+
+
+class TestRigLifecycleEvents(unittest.TestCase):
+    def setUp(self) -> None:
+        pm.newFile(force=True)
+        self.created = []
+        self.deleted = []
+        self.rig_events = events.RigLifecycleEvents.get_shared()
+        self.rig_events.onRigCreated.append(self.created.append)
+        self.rig_events.onRigDeleted.append(self.deleted.append)
+        self.rig_events.add_subscriber(self)
+
+    def tearDown(self) -> None:
+        self.rig_events.onRigCreated.remove_all(self.created.append)
+        self.rig_events.onRigDeleted.remove_all(self.deleted.append)
+        self.rig_events.remove_subscriber(self)
+
+    def test_createAndDelete(self):
+        for i in range(10):
+            pm.group(empty=True, name=f"node{i}")
+        rig = rigs.create_rig_node("test_rig")
+        cmds.flushIdleQueue()
+        self.assertEqual(self.created, [rig])
+
+        rig_name = rig.nodeName()
+        pm.delete(rig)
+        self.assertEqual([node.nodeName() for node in self.deleted], [rig_name])
+
+    def test_suspend(self):
+        with events.rig_events_suspended():
+            rig_a = rigs.create_rig_node("test_rig_a")
+            rig_b = rigs.create_rig_node("test_rig_b")
+            cmds.flushIdleQueue()
+            self.assertEqual(self.created, [])
+        cmds.flushIdleQueue()
+        self.assertEqual(set(self.created), {rig_a, rig_b})
+
+    def test_deleteWhileSuspended(self):
+        rig = rigs.create_rig_node("test_rig")
+        cmds.flushIdleQueue()
+        with events.rig_events_suspended():
+            pm.delete(rig)
+            # created and deleted while suspended, never dispatched
+            pm.delete(rigs.create_rig_node("temp_rig"))
+            self.assertEqual(self.deleted, [])
+        self.assertEqual(len(self.deleted), 1)
+        cmds.flushIdleQueue()
+        self.assertEqual(self.created, [rig])
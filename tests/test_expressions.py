@@ -0,0 +1,54 @@
+import unittest
+
+import pymel.core as pm
+
+from pulse import expressions
+
+
+class TestExpressions(unittest.TestCase):
+    def setUp(self) -> None:
+        pm.newFile(force=True)
+
+    def test_foldConstants(self):
+        result = expressions.compile_expression("1 + 2 * 3 - max(1, 2) ** 2")
+        self.assertEqual(result, 3.0)
+        self.assertEqual(pm.ls(type=["multiplyDivide", "plusMinusAverage"]), [])
+
+    def test_mergeSums(self):
+        node = pm.createNode("transform")
+        root = expressions.optimize_expression(expressions.parse_expression("a.tx + 1 - (a.ty - 2)", {"a": node}))
+        self.assertEqual(root.op, "sum")
+        self.assertEqual(len(root.args), 3)
+        self.assertEqual(root.param, (1, 1, -1))
+        self.assertEqual(root.args[1].value, 3.0)
+
+    def test_packLanes(self):
+        node = pm.createNode("transform")
+        node.translate.set((1, 2, 3))
+        result = expressions.compile_expression("a.tx * 2 + a.ty * 3 + a.tz * 4", {"a": node})
+        self.assertEqual(len(pm.ls(type="multiplyDivide")), 1)
+        self.assertEqual(len(pm.ls(type="plusMinusAverage")), 1)
+        self.assertAlmostEqual(result.get(), 20.0)
+
+    def test_clamp(self):
+        node = pm.createNode("transform")
+        node.translate.set((0.2, 0.5, 0))
+        result = expressions.compile_expression("clamp(a.tx * 2 + a.ty, 0, 1)", {"a": node})
+        self.assertAlmostEqual(result.get(), 0.9)
+        node.tx.set(2)
+        self.assertAlmostEqual(result.get(), 1.0)
+
+    def test_condition(self):
+        node = pm.createNode("transform")
+        result = expressions.compile_expression("a.tx if a.ty > 0 else 5", {"a": node})
+        self.assertAlmostEqual(result.get(), 5.0)
+        node.translate.set((2, 1, 0))
+        self.assertAlmostEqual(result.get(), 2.0)
+
+    def test_invalidExpressions(self):
+        with self.assertRaises(expressions.ExpressionError):
+            expressions.parse_expression("a.tx +")
+        with self.assertRaises(expressions.ExpressionError):
+            expressions.parse_expression("foo(1)")
+        with self.assertRaises(expressions.ExpressionError):
+            expressions.compile_expression("1 / 0")
@@ -0,0 +1,52 @@
+import unittest
+
+import maya.cmds as cmds
+import pymel.core as pm
+
+from pulse import links
+from pulse.vendor import pymetanode as meta
+
+
+class TestLinkSolver(unittest.TestCase):
+    def setUp(self):
+        pm.newFile(force=True)
+        cmds.loadPlugin("pulse", quiet=True)
+
+    def test_chain_settles_in_one_update(self):
+        leader = pm.group(empty=True, name="leader")
+        leader.t.set((5, 0, 0))
+        # follower_b is linked to a child of follower_a, so it depends on follower_a moving first
+        follower_a = pm.group(empty=True, name="follower_a")
+        follower_a_child = pm.group(empty=True, name="follower_a_child", parent=follower_a)
+        follower_a_child.t.set((0, 1, 0))
+        follower_b = pm.group(empty=True, name="follower_b")
+        links.create_default_link(follower_b, follower_a_child)
+        links.create_default_link(follower_a, leader)
+
+        solver = links.update_links()
+        self.assertEqual(solver.order, [follower_a, follower_b])
+        self.assertEqual(list(follower_b.getTranslation(space="world")), [5, 1, 0])
+
+    def test_cycles_are_reported(self):
+        node_a = pm.group(empty=True, name="node_a")
+        node_b = pm.group(empty=True, name="node_b")
+        node_c = pm.group(empty=True, name="node_c")
+        links.create_default_link(node_a, node_b)
+        links.create_default_link(node_b, node_a)
+        links.create_default_link(node_c, node_a)
+
+        solver = links.LinkSolver()
+        solver.sort()
+        self.assertEqual(set(solver.cyclic_nodes), {node_a, node_b, node_c})
+        self.assertEqual(solver.order, [])
+
+    def test_get_all_link_meta_data(self):
+        leader = pm.group(empty=True, name="leader")
+        follower = pm.group(empty=True, name="follower")
+        other = pm.group(empty=True, name="other")
+        links.create_default_link(follower, leader)
+        meta.set_metadata(follower, "other_class", {"node": other})
+
+        expected = {follower: links.get_link_meta_data(follower)}
+        self.assertEqual(links.get_all_link_meta_data(), expected)
+        self.assertEqual(links.get_all_link_meta_data([other, follower]), expected)
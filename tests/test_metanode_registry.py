@@ -0,0 +1,58 @@
+import unittest
+
+import pymel.core as pm
+from maya import cmds
+
+from pulse.vendor import pymetanode as meta
+
+
+class TestMetaClassRegistry(unittest.TestCase):
+    """
+    Tests the live meta class registry, verifying every query against a full scene scan.
+    """
+
+    def setUp(self):
+        pm.newFile(force=True)
+        self.registry = meta.enable_registry(strict=True)
+
+    def tearDown(self):
+        meta.disable_registry(force=True)
+
+    def test_set_and_remove_metadata(self):
+        node = pm.group(empty=True, name="my_node")
+        self.assertEqual(meta.find_meta_nodes("my_class"), [])
+
+        meta.set_metadata(node, "my_class", {"a": 1})
+        self.assertEqual(meta.find_meta_nodes("my_class"), [node])
+        self.assertEqual(meta.find_meta_nodes(), [node])
+
+        meta.remove_metadata(node, "my_class")
+        self.assertEqual(meta.find_meta_nodes("my_class"), [])
+
+    def test_undo_redo(self):
+        node = pm.group(empty=True, name="my_node")
+        meta.set_metadata(node, "my_class", {"a": 1})
+        meta.set_metadata(node, "my_other_class", {"b": 2})
+        self.assertEqual(meta.find_meta_nodes("my_other_class"), [node])
+
+        cmds.undo()
+        self.assertEqual(meta.find_meta_nodes("my_other_class"), [])
+        self.assertEqual(meta.find_meta_nodes("my_class"), [node])
+
+        cmds.redo()
+        self.assertEqual(meta.find_meta_nodes("my_other_class"), [node])
+
+    def test_delete_node(self):
+        node = pm.group(empty=True, name="my_node")
+        meta.set_metadata(node, "my_class", {"a": 1})
+        pm.delete(node)
+        self.assertEqual(meta.find_meta_nodes("my_class"), [])
+
+        cmds.undo()
+        self.assertEqual(len(meta.find_meta_nodes("my_class")), 1)
+
+    def test_new_scene(self):
+        node = pm.group(empty=True, name="my_node")
+        meta.set_metadata(node, "my_class", {"a": 1})
+        pm.newFile(force=True)
+        self.assertEqual(meta.find_meta_nodes("my_class"), [])
@@ -0,0 +1,37 @@
+import unittest
+
+import pymel.core as pm
+
+from pulse.vendor import pymetanode as meta
+
+
+class TestNodeHandles(unittest.TestCase):
+    def setUp(self):
+        pm.newFile(force=True)
+
+    def test_node_handle(self):
+        node = pm.group(empty=True, name="my_node")
+        handle = meta.NodeHandle.from_node(node)
+        self.assertEqual(str(handle), "my_node")
+        self.assertEqual(handle.uuid(), meta.get_uuid(node))
+        self.assertEqual(handle.py_node(), node)
+        self.assertEqual(handle, meta.NodeHandle.from_node("my_node"))
+        self.assertEqual(len({handle, meta.NodeHandle.from_node("my_node")}), 1)
+
+        pm.delete(node)
+        self.assertFalse(handle.is_valid())
+
+    def test_metadata_as_handles(self):
+        node_a = pm.group(empty=True, name="node_a")
+        node_b = pm.group(empty=True, name="node_b")
+        meta.set_metadata(node_a, "my_class", {"other": meta.NodeHandle.from_node(node_b)})
+
+        data = meta.get_metadata(node_a, "my_class")
+        self.assertEqual(data["other"], node_b)
+
+        data = meta.get_metadata(node_a, "my_class", as_handles=True)
+        self.assertIsInstance(data["other"], meta.NodeHandle)
+        self.assertEqual(str(data["other"]), "node_b")
+
+        handles = meta.find_meta_nodes("my_class", as_handles=True)
+        self.assertEqual(handles, [meta.NodeHandle.from_node(node_a)])
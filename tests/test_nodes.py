@@ -0,0 +1,173 @@
+import unittest
+
+import maya.cmds as cmds
+import pymel.core as pm
+
+from pulse import nodes
+
+
+class TestSetWorldMatrices(unittest.TestCase):
+    def setUp(self):
+        pm.newFile(force=True)
+        cmds.loadPlugin("pulse", quiet=True)
+
+    def _create_hierarchy(self, prefix: str):
+        parent = pm.group(empty=True, name=f"{prefix}_parent")
+        parent.t.set((1, 2, 3))
+        parent.r.set((10, 20, 30))
+        parent.s.set((2, 2, 2))
+        child = pm.group(empty=True, name=f"{prefix}_child", parent=parent)
+        child.t.set((0, 1, 0))
+        child.rotateOrder.set(3)
+        return parent, child
+
+    def _get_target_matrices(self):
+        source = pm.group(empty=True, name="source")
+        source.t.set((4, -2, 5))
+        source.r.set((45, 0, 90))
+        source.s.set((1.5, 1.5, 1.5))
+        source_child = pm.group(empty=True, name="source_child", parent=source)
+        source_child.t.set((2, 0, 0))
+        source_child.r.set((0, 30, 0))
+        source_child.s.set((1, 2, 1))
+        return source.wm.get(), source_child.wm.get()
+
+    def assertMatricesEqual(self, mtx_a, mtx_b, places=4):
+        for a, b in zip([c for r in mtx_a for c in r], [c for r in mtx_b for c in r]):
+            self.assertAlmostEqual(a, b, places=places)
+
+    def test_matches_set_world_matrix(self):
+        parent_mtx, child_mtx = self._get_target_matrices()
+        components_list = [(True, True, True), (True, False, False), (False, True, False), (False, False, True)]
+
+        for components in components_list:
+            ref_parent, ref_child = self._create_hierarchy("ref")
+            nodes.set_world_matrix(ref_parent, parent_mtx, *components)
+            nodes.set_world_matrix(ref_child, child_mtx, *components)
+
+            parent, child = self._create_hierarchy("batch")
+            # given child-first to ensure parents are updated first
+            nodes.set_world_matrices([(child, child_mtx, components), (parent, parent_mtx, components)])
+
+            self.assertMatricesEqual(parent.wm.get(), ref_parent.wm.get())
+            self.assertMatricesEqual(child.wm.get(), ref_child.wm.get())
+            pm.delete(ref_parent, parent)
+
+    def test_undo(self):
+        parent_mtx, child_mtx = self._get_target_matrices()
+        parent, child = self._create_hierarchy("batch")
+        old_parent_mtx = parent.wm.get()
+        old_child_mtx = child.wm.get()
+
+        nodes.set_world_matrices([(parent, parent_mtx), (child, child_mtx)])
+        self.assertMatricesEqual(child.wm.get(), child_mtx)
+
+        cmds.undo()
+        self.assertMatricesEqual(parent.wm.get(), old_parent_mtx)
+        self.assertMatricesEqual(child.wm.get(), old_child_mtx)
+
+        cmds.redo()
+        self.assertMatricesEqual(parent.wm.get(), parent_mtx)
+        self.assertMatricesEqual(child.wm.get(), child_mtx)
+
+    def test_joints_and_pivots(self):
+        parent_mtx, child_mtx = self._get_target_matrices()
+        parent = pm.group(empty=True, name="pivot_parent")
+        parent.rotatePivot.set((1, 0, 0))
+        pm.select(clear=True)
+        child = pm.joint(name="child_jnt")
+        pm.parent(child, parent)
+
+        nodes.set_world_matrices([(parent, parent_mtx), (child, child_mtx)])
+        self.assertMatricesEqual(child.wm.get(), child_mtx)
+
+    def test_no_inherits_transform_and_shear(self):
+        parent_mtx, child_mtx = self._get_target_matrices()
+        for prefix in ("ref", "batch"):
+            parent, child = self._create_hierarchy(prefix)
+            child.inheritsTransform.set(False)
+            sheared = pm.group(empty=True, name=f"{prefix}_sheared", parent=parent)
+            sheared.shear.set((0.5, 0, 0))
+
+        nodes.set_world_matrix(pm.PyNode("ref_parent"), parent_mtx)
+        nodes.set_world_matrix(pm.PyNode("ref_child"), child_mtx)
+        nodes.set_world_matrix(pm.PyNode("ref_sheared"), child_mtx)
+        nodes.set_world_matrices(
+            [
+                (pm.PyNode("batch_parent"), parent_mtx),
+                (pm.PyNode("batch_child"), child_mtx),
+                (pm.PyNode("batch_sheared"), child_mtx),
+            ]
+        )
+
+        self.assertMatricesEqual(pm.PyNode("batch_child").wm.get(), child_mtx)
+        for name in ("parent", "child", "sheared"):
+            self.assertMatricesEqual(pm.PyNode(f"batch_{name}").wm.get(), pm.PyNode(f"ref_{name}").wm.get())
+
+
+class TestGetWorldMatrices(unittest.TestCase):
+    def setUp(self):
+        pm.newFile(force=True)
+
+    def assertMatricesEqual(self, mtx_a, mtx_b, places=4):
+        for a, b in zip([c for r in mtx_a for c in r], [c for r in mtx_b for c in r]):
+            self.assertAlmostEqual(a, b, places=places)
+
+    def test_matches_get_world_matrix(self):
+        parent = pm.group(empty=True, name="parent")
+        parent.t.set((1, 2, 3))
+        parent.r.set((10, 20, 30))
+        child = pm.group(empty=True, name="child", parent=parent)
+        child.t.set((0, 1, 0))
+        child.r.set((15, -40, 60))
+        child.rotateAxis.set((0, 0, 45))
+        child.rotateOrder.set(4)
+        pm.select(clear=True)
+        jnt = pm.joint(name="jnt")
+        jnt.jointOrient.set((90, 0, 0))
+
+        node_list = [parent, child, jnt, child]
+        for negate_rotate_axis in (True, False):
+            matrices = nodes.get_world_matrices(node_list, negate_rotate_axis)
+            self.assertEqual(len(matrices), len(node_list))
+            for node, mtx in zip(node_list, matrices):
+                expected = nodes.get_world_matrix(node, negate_rotate_axis)
+                self.assertMatricesEqual(mtx, expected)
+                rotation = mtx.getRotation()
+                expected_rotation = expected.getRotation()
+                self.assertEqual(str(rotation.order), str(expected_rotation.order))
+                for a, b in zip(rotation, expected_rotation):
+                    self.assertAlmostEqual(a, b, places=4)
+
+    def test_invalid_nodes(self):
+        node = pm.group(empty=True, name="node")
+        # nodes that aren't transforms have an identity matrix, like get_world_matrix
+        time_node = pm.PyNode("time1")
+        self.assertMatricesEqual(nodes.get_world_matrices([time_node])[0], pm.dt.TransformationMatrix())
+        with self.assertRaises(ValueError):
+            nodes.get_world_matrices([node, "missing_node"])
+
+        pm.group(empty=True, name="dup", parent=node)
+        pm.group(empty=True, name="dup")
+        with self.assertRaises(ValueError):
+            nodes.get_world_transforms(["dup"])
+
+    def test_transforms(self):
+        node = pm.group(empty=True, name="node")
+        node.t.set((1, 2, 3))
+        node.r.set((10, 20, 30))
+        node.s.set((2, 2, 2))
+        node.rotateOrder.set(2)
+
+        translates, rotates, scales, rotate_orders = nodes.get_world_transforms([node], as_numpy=True)
+        self.assertEqual(translates.shape, (1, 3))
+        self.assertEqual(list(translates[0]), [1, 2, 3])
+        for a, b in zip(rotates[0], (10, 20, 30)):
+            self.assertAlmostEqual(a, b, places=4)
+        for a in scales[0]:
+            self.assertAlmostEqual(a, 2, places=4)
+        self.assertEqual(list(rotate_orders), [2])
+
+        _, rotates, _, rotate_orders = nodes.get_world_transforms([node])
+        self.assertEqual(rotate_orders, ["ZXY"])
+        self.assertEqual(str(rotates[0].order), "ZXY")
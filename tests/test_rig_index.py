@@ -0,0 +1,60 @@
+import unittest
+
+import pymel.core as pm
+
+from pulse.core import rigs
+
+
+class TestRigIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        pm.newFile(force=True)
+        self.rig = rigs.create_rig_node("test_rig")
+        self.ctls_grp = pm.group(empty=True, name="ctls", parent=self.rig)
+        self.ctl = pm.group(empty=True, name="test_ctl", parent=self.ctls_grp)
+        self.other = pm.group(empty=True, name="other")
+
+    def tearDown(self) -> None:
+        rigs.disable_rig_index(force=True)
+
+    def test_findRigs(self):
+        with rigs.rig_index_enabled() as index:
+            self.assertEqual(rigs.get_rig_from_node(self.ctl), self.rig)
+            locator = pm.spaceLocator(name="test_loc")
+            locator.setParent(self.ctl)
+            self.assertEqual(rigs.get_rig_from_node(locator.getShape()), self.rig)
+            self.assertIsNone(rigs.get_rig_from_node(self.other))
+            self.assertEqual(rigs.get_all_rigs_by_name(["test_rig"]), [self.rig])
+            self.assertEqual(rigs.get_all_rigs_by_name(["missing"]), [])
+            self.assertEqual(index.get_rigs(), [self.rig])
+            self.assertEqual(rigs.get_all_rigs(), [self.rig])
+        self.assertIsNone(rigs.get_rig_index())
+
+    def test_invalidate(self):
+        with rigs.rig_index_enabled() as index:
+            self.assertIsNone(rigs.get_rig_from_node(self.other))
+            self.assertTrue(index.is_valid)
+            self.other.setParent(self.ctls_grp)
+            self.assertFalse(index.is_valid)
+            self.assertEqual(rigs.get_rig_from_node(self.other), self.rig)
+
+    def test_invalidateOnlyForRigChanges(self):
+        with rigs.rig_index_enabled() as index:
+            self.assertIsNone(rigs.get_rig_from_node(self.other))
+            # changes outside of any rig keep the index
+            pm.group(empty=True, name="other_child", parent=self.other)
+            self.other.rename("other_renamed")
+            self.assertTrue(index.is_valid)
+            # renaming a rig, or reparenting it, changes the paths of everything it owns
+            self.rig.rename("test_rig_renamed")
+            self.assertFalse(index.is_valid)
+            self.assertEqual(rigs.get_rig_from_node(self.ctl), self.rig)
+            self.rig.setParent(self.other)
+            self.assertFalse(index.is_valid)
+            self.assertEqual(rigs.get_rig_from_node(self.ctl), self.rig)
+
+    def test_rigWrapper(self):
+        with rigs.rig_index_enabled():
+            rig = rigs.Rig(self.rig)
+            self.assertEqual(rig.get_core_hierarchy_node("ctls"), self.ctls_grp)
+            self.assertEqual(rig.get_core_hierarchy_nodes(), [self.ctls_grp])
+            self.assertEqual(rig.get_meta_data_value("name"), "test_rig")
@@ -0,0 +1,145 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pulse import kdtree
+from pulse import skin_weights
+from pulse.skin_weights import SkinWeights
+
+WEIGHTS_LIST = [
+    (0, [("joint_a", 1.0)]),
+    (1, [("joint_a", 0.25), ("joint_b", 0.75)]),
+    (3, [("joint_c", 0.5), ("joint_b", 0.5)]),
+]
+
+
+class TestSkinWeights(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def test_from_list(self):
+        weights = SkinWeights.from_list(WEIGHTS_LIST)
+        self.assertEqual(weights.influences, ["joint_a", "joint_b", "joint_c"])
+        self.assertEqual(weights.num_vertices, 4)
+        self.assertEqual(weights.num_weights, 5)
+        self.assertEqual(weights.get_vertex_weights(2), [])
+        self.assertEqual(weights.get_vertex_weights(1), [("joint_a", 0.25), ("joint_b", 0.75)])
+        self.assertEqual(weights.to_list(), WEIGHTS_LIST)
+
+    def test_weights_precision(self):
+        # weights keep full precision in memory, and are only reduced to float32 in weights files
+        weights = SkinWeights.from_list([(0, [("joint_a", 0.1), ("joint_b", 0.9)])])
+        self.assertEqual(weights.weights.dtype, np.float64)
+        self.assertEqual(weights.get_vertex_weights(0), [("joint_a", 0.1), ("joint_b", 0.9)])
+        self.assertEqual(weights.normalize().get_vertex_weights(0), [("joint_a", 0.1), ("joint_b", 0.9)])
+
+        file_path = os.path.join(self.temp_dir, "test_precision.weights")
+        skin_weights.save_weights_file(file_path, {"skin_a": weights})
+        loaded = skin_weights.load_weights_file(file_path)["skin_a"]
+        self.assertEqual(loaded.weights.dtype, np.float32)
+        self.assertAlmostEqual(loaded.get_vertex_weights(0)[0][1], 0.1, places=6)
+
+    def test_dense(self):
+        weights = SkinWeights.from_list(WEIGHTS_LIST)
+        dense = weights.to_dense()
+        self.assertEqual(dense.shape, (4, 3))
+        self.assertEqual(dense[1].tolist(), [0.25, 0.75, 0.0])
+        from_dense = SkinWeights.from_dense(weights.influences, dense)
+        self.assertEqual(from_dense.num_weights, 5)
+        self.assertEqual(from_dense.to_dense().tolist(), dense.tolist())
+
+        # reorder and drop influences
+        dense = weights.to_dense(["joint_c", "joint_a"])
+        self.assertEqual(dense[3].tolist(), [0.5, 0.0])
+
+    def test_normalize(self):
+        weights = SkinWeights.from_list([(0, [("joint_a", 2.0), ("joint_b", 2.0)]), (1, [("joint_a", 0.0)])])
+        expected = [(0, [("joint_a", 0.5), ("joint_b", 0.5)]), (1, [("joint_a", 0.0)])]
+        self.assertEqual(weights.normalize().to_list(), expected)
+
+    def test_prune_and_limit(self):
+        vert_weights = [("joint_a", 0.1), ("joint_b", 0.00001), ("joint_c", 0.6), ("joint_d", 0.3)]
+        weights = SkinWeights.from_list([(0, vert_weights)])
+        self.assertEqual(weights.prune().get_vertex_weights(0), weights.limit_influences(3).get_vertex_weights(0))
+        limited = weights.limit_influences(2)
+        self.assertEqual([inf for inf, _ in limited.get_vertex_weights(0)], ["joint_c", "joint_d"])
+
+    def test_limit_uneven_influences(self):
+        # mostly single influence vertices, with one vertex that has many influences
+        weights_list = [(i, [("joint_0", 1.0)]) for i in range(10)]
+        weights_list.append((10, [(f"joint_{i}", i / 10) for i in range(10)]))
+        limited = SkinWeights.from_list(weights_list).limit_influences(2)
+        self.assertEqual(limited.num_weights, 12)
+        self.assertEqual([inf for inf, _ in limited.get_vertex_weights(10)], ["joint_8", "joint_9"])
+
+    def test_remap_influences(self):
+        weights = SkinWeights.from_list(WEIGHTS_LIST)
+        ancestors = {"joint_b": ["joint_b_parent", "joint_a"], "joint_c": ["joint_b"]}
+        influence_map = skin_weights.get_parent_influence_map(weights.influences, ancestors, r"joint_(b|c)")
+        self.assertEqual(influence_map, {"joint_b": "joint_a"})
+
+        remapped = weights.remap_influences({"joint_b": "joint_a"})
+        self.assertEqual(remapped.influences, ["joint_a", "joint_c"])
+        self.assertEqual(remapped.get_vertex_weights(1), [("joint_a", 1.0)])
+        self.assertEqual(remapped.get_vertex_weights(3), [("joint_a", 0.5), ("joint_c", 0.5)])
+
+    def _test_round_trip(self, compression):
+        file_path = os.path.join(self.temp_dir, f"test_{compression}.weights")
+        weights = SkinWeights.from_list(WEIGHTS_LIST)
+        skin_weights.save_weights_file(file_path, {"skin_a": weights, "skin_b": weights}, compression=compression)
+        self.assertTrue(skin_weights.is_binary_weights_file(file_path))
+
+        loaded = skin_weights.load_weights_file(file_path)
+        self.assertEqual(list(loaded.keys()), ["skin_a", "skin_b"])
+        self.assertEqual(loaded["skin_a"].influences, weights.influences)
+        self.assertEqual(loaded["skin_b"].to_list(), WEIGHTS_LIST)
+
+    def test_round_trip(self):
+        self._test_round_trip(skin_weights.COMPRESSION_NONE)
+
+    def test_round_trip_zlib(self):
+        self._test_round_trip(skin_weights.COMPRESSION_ZLIB)
+
+    def test_text_file_is_not_binary(self):
+        file_path = os.path.join(self.temp_dir, "test_text.weights")
+        with open(file_path, "w") as fp:
+            fp.write(repr({"skin_a": WEIGHTS_LIST}))
+        self.assertFalse(skin_weights.is_binary_weights_file(file_path))
+
+    def test_round_trip_positions(self):
+        file_path = os.path.join(self.temp_dir, "test_positions.weights")
+        weights = SkinWeights.from_list(WEIGHTS_LIST)
+        weights.positions = np.arange(12, dtype=np.float32).reshape(4, 3)
+        skin_weights.save_weights_file(file_path, {"skin_a": weights, "skin_b": SkinWeights.from_list(WEIGHTS_LIST)})
+
+        loaded = skin_weights.load_weights_file(file_path)
+        self.assertEqual(loaded["skin_a"].positions.tolist(), weights.positions.tolist())
+        self.assertIsNone(loaded["skin_b"].positions)
+
+    def test_transfer(self):
+        # two vertices weighted fully to different joints
+        weights = SkinWeights.from_list([(0, [("joint_a", 1.0)]), (1, [("joint_b", 1.0)])])
+        weights.positions = np.array([[0, 0, 0], [2, 0, 0]], dtype=np.float32)
+
+        positions = [[0, 0, 0], [1, 0, 0], [2, 0.5, 0], [3, 0, 0]]
+        transferred, stats = weights.transfer(positions, k=2)
+        self.assertEqual(transferred.num_vertices, 4)
+        self.assertEqual(transferred.get_vertex_weights(0), [("joint_a", 1.0)])
+        self.assertEqual([w for _, w in transferred.get_vertex_weights(1)], [0.5, 0.5])
+        self.assertEqual([inf for inf, _ in transferred.get_vertex_weights(3)], ["joint_a", "joint_b"])
+        self.assertGreater(transferred.get_vertex_weights(3)[1][1], 0.8)
+        self.assertEqual(stats["exact_matches"], 1)
+        self.assertAlmostEqual(stats["max_distance"], 1.0)
+
+    def test_kd_tree(self):
+        rng = np.random.default_rng(0)
+        points = rng.random((1000, 3))
+        query_points = rng.random((200, 3))
+        distances, indices = kdtree.KDTree(points).query(query_points, k=4)
+
+        all_distances = np.linalg.norm(query_points[:, None] - points[None], axis=2)
+        expected = np.argsort(all_distances, axis=1)[:, :4]
+        self.assertEqual(indices.tolist(), expected.tolist())
+        self.assertTrue(np.allclose(distances, np.take_along_axis(all_distances, expected, axis=1)))
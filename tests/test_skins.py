@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+import maya.cmds as cmds
+import pymel.core as pm
+
+from pulse import skins
+
+
+class TestSkinWeights(unittest.TestCase):
+    def setUp(self):
+        pm.newFile(force=True)
+        cmds.loadPlugin("pulse", quiet=True)
+        self.mesh = pm.polyCube(name="cube", constructionHistory=False)[0]
+        pm.select(clear=True)
+        self.joint_a = pm.joint(name="joint_a", position=(0, -1, 0))
+        self.joint_b = pm.joint(name="joint_b", position=(0, 1, 0))
+        self.skin = pm.skinCluster(self.joint_a, self.joint_b, self.mesh, toSelectedBones=True)
+
+    def test_weights_array(self):
+        weights, influence_ids = skins.get_skin_weights_array(self.skin)
+        self.assertEqual(weights.shape, (8, 2))
+        self.assertEqual(len(influence_ids), 2)
+
+        weights[:] = 0
+        weights[:, 1] = 1
+        skins.set_skin_weights_array(self.skin, weights, influence_ids)
+        new_weights, _ = skins.get_skin_weights_array(self.skin)
+        self.assertAlmostEqual(new_weights[:, 1].sum(), 8)
+
+        cmds.undo()
+        old_weights, _ = skins.get_skin_weights_array(self.skin)
+        self.assertLess(old_weights[:, 1].sum(), 8)
+
+    def test_weights_list(self):
+        weights = skins.get_skin_weights(self.skin)
+        self.assertEqual(len(weights), 8)
+
+        skins.set_skin_weights(self.skin, [(0, [("joint_a", 1.0)])])
+        self.assertEqual(skins.get_skin_weights(self.skin, indices=[0]), [(0, [("joint_a", 1.0)])])
+
+    def test_weights_list_out_of_range(self):
+        # e.g. weights saved for a mesh that had more vertices
+        weights = [(1, [("joint_b", 1.0)]), (8, [("joint_a", 1.0)]), (100, [("joint_a", 1.0)])]
+        with self.assertLogs(skins.LOG, "WARNING"):
+            skins.set_skin_weights(self.skin, weights)
+        self.assertEqual(skins.get_skin_weights(self.skin, indices=[1]), [(1, [("joint_b", 1.0)])])
+
+    def test_normalize(self):
+        weights, influence_ids = skins.get_skin_weights_array(self.skin)
+        weights[:] = 2
+        self.skin.normalizeWeights.set(0)
+        skins.set_skin_weights_array(self.skin, weights, influence_ids)
+
+        skins.normalize_skin_weights(self.skin)
+        weights, _ = skins.get_skin_weights_array(self.skin)
+        for total in weights.sum(axis=1):
+            self.assertAlmostEqual(total, 1.0)
+
+    def test_transfer_weights(self):
+        weights = skins.get_skin_weights_data(self.skin, include_positions=True)
+        self.assertEqual(weights.positions.shape, (8, 3))
+
+        # a mesh with more vertices in the same place
+        mesh = pm.polyCube(name="dense_cube", subdivisionsX=2, constructionHistory=False)[0]
+        skin = pm.skinCluster(self.joint_a, self.joint_b, mesh, toSelectedBones=True)
+        transfer_stats = skins.apply_skin_weights_map({skin.nodeName(): weights}, skin)
+        self.assertEqual(transfer_stats[skin.nodeName()]["exact_matches"], 8)
+
+    def test_weights_file_loader(self):
+        file_path = os.path.join(tempfile.mkdtemp(), "test.weights")
+        skins.save_skin_weights_to_file(file_path, self.skin, binary=True)
+        with skins.SkinWeightsFileLoader(file_path, max_memory=0) as loader:
+            loader.start()
+            self.assertIsNone(loader.get("missing_skcl"))
+            weights = loader.get(self.skin.nodeName())
+        self.assertEqual(weights.num_vertices, 8)
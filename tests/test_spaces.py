@@ -0,0 +1,27 @@
+import unittest
+
+import pymel.core as pm
+
+from pulse import spaces
+
+
+class TestSpaceRegistry(unittest.TestCase):
+    def setUp(self):
+        pm.newFile(force=True)
+
+    def test_connect_only_pending_spaces(self):
+        world = pm.group(empty=True, name="world_space")
+        spaces.create_space(world, "world")
+        ctl = pm.group(empty=True, name="ctl")
+        spaces.setup_space_constraint(ctl, ["world", "missing"])
+
+        registry = spaces.SpaceRegistry()
+        registry.load()
+        self.assertEqual(registry.spaces, {"world": world})
+        self.assertEqual(registry.connect_constraints(), 1)
+        self.assertEqual([s["name"] for s in registry.pending[ctl]], ["missing"])
+
+        # connected spaces are saved and skipped the next time
+        registry = spaces.SpaceRegistry()
+        registry.load([ctl])
+        self.assertEqual(registry.connect_constraints(), 0)
@@ -0,0 +1,162 @@
+import unittest
+
+import pymel.core as pm
+
+from pulse import sym
+from pulse.core import Blueprint, BlueprintBuilder
+
+
+class TestMirrorPairingTable(unittest.TestCase):
+    def setUp(self):
+        pm.newFile(force=True)
+
+    def test_get_paired_node(self):
+        node_a = pm.group(empty=True, name="node_a")
+        node_b = pm.group(empty=True, name="node_b")
+        node_c = pm.group(empty=True, name="node_c")
+        sym.pair_mirror_nodes(node_a, node_b)
+
+        table = sym.MirrorPairingTable()
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.get_paired_node(node_a), node_b)
+        self.assertEqual(table.get_paired_node(node_b.nodeName()), node_a)
+        self.assertIsNone(table.get_paired_node(node_c))
+        self.assertTrue(table.is_mirror_node(node_a))
+        self.assertFalse(table.is_mirror_node(node_c))
+
+        table.add_pair(node_c, node_a)
+        self.assertEqual(table.get_paired_node(node_c), node_a)
+        # node_b is no longer reciprocated by node_a
+        self.assertIsNone(table.get_paired_node(node_b))
+        self.assertEqual(table.get_paired_node(node_b, validate=False), node_a)
+
+    def test_validate_nodes(self):
+        node_a = pm.group(empty=True, name="node_a")
+        node_b = pm.group(empty=True, name="node_b")
+        node_c = pm.group(empty=True, name="node_c")
+        node_d = pm.group(empty=True, name="node_d")
+        sym.pair_mirror_nodes(node_a, node_b)
+        # node_c references node_a, which doesn't reference it back
+        sym.set_mirroring_data(node_c, node_a)
+        # node_d references a node that no longer exists
+        sym.pair_mirror_nodes(node_d, pm.group(empty=True, name="deleted"))
+        pm.delete("deleted")
+
+        table = sym.MirrorPairingTable()
+        invalid_nodes = table.validate_nodes()
+        self.assertEqual({n.py_node() for n in invalid_nodes}, {node_c, node_d})
+        self.assertEqual(len(table), 2)
+        self.assertFalse(sym.is_mirror_node(node_c))
+        self.assertFalse(sym.is_mirror_node(node_d))
+        self.assertEqual(sym.get_paired_node(node_a), node_b)
+
+        # validating specific nodes only affects those nodes
+        sym.set_mirroring_data(node_c, node_a)
+        table.refresh()
+        self.assertEqual(table.validate_nodes([node_a, node_b]), [])
+        self.assertTrue(sym.is_mirror_node(node_c))
+
+    def test_pairing_scope(self):
+        self.assertIsNone(sym.MirrorActionUtil({})._pairing_table)
+        with sym.mirror_pairing_scope() as table:
+            self.assertIs(sym.MirrorActionUtil({}).pairing_table, table)
+            with sym.mirror_pairing_scope() as inner_table:
+                self.assertIsNot(inner_table, table)
+                self.assertIs(sym.MirrorActionUtil({}).pairing_table, inner_table)
+            self.assertIs(sym.MirrorActionUtil({}).pairing_table, table)
+        self.assertIsNone(sym.MirrorActionUtil({})._pairing_table)
+
+    def test_pairing_scope_during_generate_actions(self):
+        builder = BlueprintBuilder(Blueprint())
+        tables = []
+
+        def action_iterator():
+            # every mirrored action generated during the build should share one table
+            tables.append(sym.MirrorActionUtil({}).pairing_table)
+            tables.append(sym.MirrorActionUtil({}).pairing_table)
+            return iter([])
+
+        builder.action_iterator = action_iterator
+        builder._generate_all_actions()
+        self.assertEqual(len(tables), 2)
+        self.assertIs(tables[0], tables[1])
+        self.assertIsNone(sym.MirrorActionUtil({})._pairing_table)
+
+
+class TestMirrorPlan(unittest.TestCase):
+    def setUp(self):
+        pm.newFile(force=True)
+
+    def _create_util(self) -> sym.MirrorUtil:
+        util = sym.MirrorUtil()
+        util.is_recursive = True
+        util.add_operation(sym.MirrorParenting())
+        util.add_operation(sym.MirrorTransforms())
+        return util
+
+    def test_plan_does_not_modify_scene(self):
+        node_a = pm.group(empty=True, name="node_a")
+        node_a.tx.set(2)
+        node_b = pm.group(empty=True, name="node_b", parent=node_a)
+        node_b.tx.set(1)
+        num_nodes = len(pm.ls())
+
+        util = self._create_util()
+        plan = util.plan([node_a])
+        self.assertEqual(len(pm.ls()), num_nodes)
+        self.assertEqual(plan.nodes_to_create, [node_a, node_b])
+        self.assertEqual(plan.get_counts()["create"], 2)
+        self.assertEqual(len(plan.get_changes(util._operations[1])), 2)
+        self.assertFalse(sym.is_mirror_node(node_a))
+
+        # plans always reflect the current scene
+        pm.delete(node_b)
+        self.assertEqual(util.plan([node_a]).nodes_to_create, [node_a])
+
+    def test_apply_plan(self):
+        node_a = pm.group(empty=True, name="node_a")
+        node_a.tx.set(2)
+        node_b = pm.group(empty=True, name="node_b", parent=node_a)
+        node_b.tx.set(1)
+
+        util = self._create_util()
+        util.apply_plan(util.plan([node_a]))
+
+        mirror_a = sym.get_paired_node(node_a)
+        mirror_b = sym.get_paired_node(node_b)
+        self.assertIsNotNone(mirror_a)
+        self.assertEqual(mirror_b.getParent(), mirror_a)
+        self.assertAlmostEqual(mirror_b.getTranslation(space="world")[0], -3)
+
+        # nothing left to create after mirroring
+        plan = util.plan([node_a])
+        self.assertEqual(plan.nodes_to_create, [])
+        self.assertEqual(plan.pairs, [(node_a, mirror_a), (node_b, mirror_b)])
+
+    def test_run_after_plan_uses_current_scene(self):
+        node_a = pm.group(empty=True, name="node_a")
+        node_a.tx.set(2)
+        util = self._create_util()
+        util.run([node_a])
+        mirror_a = sym.get_paired_node(node_a)
+
+        # preview, then change the source node before mirroring again
+        util.plan([node_a])
+        node_a.tx.set(5)
+        util.run([node_a])
+        self.assertAlmostEqual(mirror_a.getTranslation(space="world")[0], -5)
+
+    def test_run_reconnects_inverse_scale(self):
+        pm.select(clear=True)
+        jnt_a = pm.joint(name="jnt_a", position=(1, 0, 0))
+        jnt_b = pm.joint(name="jnt_b", position=(2, 0, 0))
+        util = self._create_util()
+        util.run([jnt_a])
+        mirror_a = sym.get_paired_node(jnt_a)
+        mirror_b = sym.get_paired_node(jnt_b)
+        self.assertTrue(pm.isConnected(mirror_a.scale, mirror_b.inverseScale))
+
+        # the parent doesn't change, but the connection should still be restored
+        pm.disconnectAttr(mirror_a.scale, mirror_b.inverseScale)
+        util.run([jnt_a])
+        self.assertTrue(pm.isConnected(mirror_a.scale, mirror_b.inverseScale))
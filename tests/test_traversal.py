@@ -0,0 +1,68 @@
+import unittest
+
+import pymel.core as pm
+
+from pulse import joints
+from pulse import nodes
+from pulse import traversal
+from pulse.core import rigs
+
+
+class TestTraversal(unittest.TestCase):
+    def setUp(self):
+        pm.newFile(force=True)
+
+    def _create_joints(self):
+        pm.select(clear=True)
+        root = pm.joint(name="root")
+        mid = pm.joint(name="mid")
+        end_a = pm.joint(name="end_a")
+        grp = pm.group(empty=True, name="grp", parent=mid)
+        pm.select(grp)
+        end_b = pm.joint(name="end_b")
+        return root, mid, end_a, grp, end_b
+
+    def test_descendants_top_to_bottom(self):
+        root, mid, end_a, grp, end_b = self._create_joints()
+        descendants = nodes.get_descendants_top_to_bottom(root)
+        self.assertEqual(set(descendants), {mid, end_a, grp, end_b})
+        for node in descendants:
+            parent = node.getParent()
+            if parent != root:
+                self.assertLess(descendants.index(parent), descendants.index(node))
+        self.assertEqual(set(nodes.get_descendants_top_to_bottom(root, type="joint")), {mid, end_a, end_b})
+
+    def test_parents(self):
+        root, mid, end_a, grp, end_b = self._create_joints()
+        self.assertEqual(nodes.get_all_parents(end_b), [grp, mid, root])
+        self.assertEqual(nodes.get_all_parents(end_b, include_node=True), [end_b, grp, mid, root])
+        self.assertEqual(nodes.get_parent_nodes([end_b, mid, end_a]), [mid])
+
+    def test_joints(self):
+        root, mid, end_a, grp, end_b = self._create_joints()
+        self.assertEqual(joints.get_child_joints(mid), [end_a, end_b])
+        self.assertEqual(joints.get_end_joints(root), [end_a])
+        self.assertEqual(joints.get_end_joints(end_a), [end_a])
+
+    def test_rig_lookup(self):
+        rig = rigs.create_rig_node("test")
+        child = pm.group(empty=True, name="child", parent=rig)
+        grand_child = pm.group(empty=True, name="grand_child", parent=child)
+        other = pm.group(empty=True, name="other")
+
+        lookup = rigs.RigLookup()
+        self.assertEqual(rigs.get_rig_from_node(grand_child, lookup), rig)
+        self.assertEqual(rigs.get_rig_from_node(child, lookup), rig)
+        self.assertIsNone(rigs.get_rig_from_node(other, lookup))
+        self.assertEqual(rigs.get_rig_from_node(rig), rig)
+        self.assertEqual(len(traversal.get_ancestors(grand_child, include_node=True)), 3)
+
+    def test_descendants_of_shape_type(self):
+        root = pm.group(empty=True, name="root")
+        cube = pm.polyCube(name="cube")[0]
+        loc = pm.spaceLocator(name="loc")
+        pm.parent(cube, loc, root)
+        self.assertEqual(nodes.get_descendants_top_to_bottom(root, type="mesh"), [cube.getShape()])
+        self.assertEqual(nodes.get_descendants_top_to_bottom(root, type="locator"), [loc.getShape()])
+        shapes = nodes.get_descendants_top_to_bottom(root, type="shape")
+        self.assertEqual(set(shapes), {cube.getShape(), loc.getShape()})
@@ -1,8 +1,10 @@
 import unittest
 
+import maya.cmds as cmds
 import pymel.core as pm
 
 from pulse.core import load_actions
+from pulse import node_graph
 from pulse import util_nodes
 
 
@@ -26,6 +28,13 @@ class TestUtilNodes(unittest.TestCase):
         node = util_nodes.create_utility_node("condition")
         output_attr = util_nodes.get_output_attr(node.colorIfTrueR)
         self.assertEqual(output_attr.longName(), "outColorR")
+        output_attr = util_nodes.get_output_attr(node.colorIfFalseB)
+        self.assertEqual(output_attr.longName(), "outColorB")
+        self.assertEqual(output_attr.node(), node)
+
+        node = util_nodes.create_utility_node("plusMinusAverage")
+        output_attr = util_nodes.get_output_attr(node.input2D[1].input2Dy)
+        self.assertEqual(output_attr.longName(), "output2Dy")
 
     def test_plusMinusAverageOutputAttr(self):
         node = util_nodes.create_utility_node("plusMinusAverage")
@@ -93,3 +102,40 @@ class TestUtilNodes(unittest.TestCase):
         equal_attr = util_nodes.equal(7, 7, 1, 0)
         self.assertEqual(equal_attr.longName(), "outColorR")
         self.assertEqual(equal_attr.get(), 1)
+
+    def test_deferredGraph(self):
+        pm.newFile(force=True)
+        node = pm.group(empty=True, name="node")
+        node.t.set((1, 2, 3))
+        with node_graph.deferred_graph():
+            sum_attr = util_nodes.add(node.tx, node.ty, 4)
+            mult_attr = util_nodes.multiply(sum_attr, 2)
+            blend_attr = util_nodes.blend2(node.t, [10, 20, 30], 0.5)
+            self.assertEqual(cmds.ls(type="plusMinusAverage"), [])
+
+        self.assertEqual(len(cmds.ls(type="plusMinusAverage")), 1)
+        mult_attr = mult_attr.py_attr()
+        self.assertIsInstance(mult_attr, pm.Attribute)
+        self.assertEqual(mult_attr.longName(), "outputX")
+        self.assertEqual(mult_attr.get(), 14)
+        self.assertEqual(list(node_graph.resolve(blend_attr).get()), [5.5, 11, 16.5])
+
+        cmds.undo()
+        self.assertEqual(cmds.ls(type="plusMinusAverage"), [])
+
+    def test_nodeCache(self):
+        pm.newFile(force=True)
+        node = pm.group(empty=True, name="node")
+        with util_nodes.node_cache_scope(fold_constants=True) as cache:
+            self.assertEqual(util_nodes.add(1, 2, 3, 4), 10)
+            self.assertEqual(util_nodes.multiply([1, 2, 3], [2, 2, 2]), [2, 4, 6])
+            mult_a = util_nodes.multiply(node.tx, 2)
+            mult_b = util_nodes.multiply(node.tx, 2)
+            self.assertEqual(mult_a, mult_b)
+            self.assertNotEqual(util_nodes.multiply(node.tx, 3).node(), mult_a.node())
+        self.assertEqual(len(pm.ls(type="multiplyDivide")), 2)
+        self.assertEqual(cache.num_folded, 2)
+        self.assertEqual(cache.num_reused, 1)
+
+        # constants are not folded outside of the scope
+        self.assertIsInstance(util_nodes.add(1, 2), pm.Attribute)